@@ -7,22 +7,22 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-async def verify_admin(
+async def verify_user(
     authorization: Optional[str] = Header(None),
     supabase_client: Optional[Client] = None
 ):
     """
-    Verify that the user is an admin.
+    Verify that the request carries a valid user access token.
     
     Args:
         authorization: Authorization header value
         supabase_client: Supabase admin client
         
     Returns:
-        User object if admin
+        User object
         
     Raises:
-        HTTPException: If authentication/authorization fails
+        HTTPException: If authentication fails
     """
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(
@@ -43,14 +43,6 @@ async def verify_admin(
         user_response = supabase_client.auth.get_user(token)
         if not user_response.user:
             raise HTTPException(status_code=401, detail="Invalid token")
-        
-        role = user_response.user.user_metadata.get("role")
-        if role != "admin":
-            raise HTTPException(
-                status_code=403,
-                detail="Admin access required"
-            )
-        
         return user_response.user
     except HTTPException:
         raise
@@ -60,3 +52,31 @@ async def verify_admin(
             detail=f"Authentication failed: {str(e)}"
         )
 
+
+async def verify_admin(
+    authorization: Optional[str] = Header(None),
+    supabase_client: Optional[Client] = None
+):
+    """
+    Verify that the user is an admin.
+    
+    Args:
+        authorization: Authorization header value
+        supabase_client: Supabase admin client
+        
+    Returns:
+        User object if admin
+        
+    Raises:
+        HTTPException: If authentication/authorization fails
+    """
+    user = await verify_user(authorization, supabase_client)
+    
+    role = user.user_metadata.get("role")
+    if role != "admin":
+        raise HTTPException(
+            status_code=403,
+            detail="Admin access required"
+        )
+    
+    return user
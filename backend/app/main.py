@@ -1,26 +1,35 @@
 """FastAPI application main entry point."""
 import os
+import json
 import logging
+from datetime import date
 from typing import Optional
-from fastapi import FastAPI, HTTPException, Depends, Header
+from fastapi import FastAPI, HTTPException, Depends, Header, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
-from supabase import create_client, Client
+from fastapi.responses import RedirectResponse, StreamingResponse, FileResponse
+from supabase import create_client, acreate_client, Client, AsyncClient
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
 from app.models import (
     ExportRequest,
+    PdfExportRequest,
+    ExportJobRequest,
     CreateUserRequest,
     SignUpRequest,
     UpdateUserRoleRequest,
+    KeywordRequest,
+    UpdateKeywordRequest,
     AIQuestionRequest
 )
-from app.services.export_service import to_csv, to_pdf
+from app.services.export_service import to_csv, to_pdf, to_pdf_file, iter_file, stream_items_csv
+from app.services.export_jobs import ExportQueueFull, get_export_job_manager
 from app.services.user_service import UserService
-from app.services.ai_service import process_ai_question
-from app.auth import verify_admin
+from app.services.keyword_service import KeywordService
+from app.services.ai_service import process_ai_question, stream_ai_question, get_answer_cache
+from app.utils.ai_summarization import close_openai_clients
+from app.auth import verify_admin, verify_user
 
 # Load environment variables (try both backend/.env and root .env)
 load_dotenv()  # Load from current directory (backend/.env)
@@ -36,6 +45,21 @@ else:
 # Initialize FastAPI app
 app = FastAPI(title="Ignite Knowledge Backend")
 
+@app.on_event("shutdown")
+async def shutdown_openai_clients():
+    """Close pooled OpenAI connections on shutdown."""
+    await close_openai_clients()
+
+@app.on_event("startup")
+async def start_export_jobs():
+    """Start the periodic purge of expired export files."""
+    get_export_job_manager().start()
+
+@app.on_event("shutdown")
+def shutdown_export_jobs():
+    """Cancel queued export jobs and stop their worker threads."""
+    get_export_job_manager().shutdown()
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -59,8 +83,12 @@ supabase_admin: Optional[Client] = None
 if SUPABASE_URL and SUPABASE_SERVICE_KEY:
     supabase_admin = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
 
+# Async Supabase client for the AI endpoints, created on first use
+supabase_async: Optional[AsyncClient] = None
+
 # Initialize services
 user_service = UserService(supabase_admin) if supabase_admin else None
+keyword_service = KeywordService(supabase_admin) if supabase_admin else None
 
 
 # Dependency to get user service
@@ -74,6 +102,17 @@ def get_user_service() -> UserService:
     return user_service
 
 
+# Dependency to get keyword service
+def get_keyword_service() -> KeywordService:
+    """Get keyword service instance."""
+    if not keyword_service:
+        raise HTTPException(
+            status_code=500,
+            detail="Keyword service not configured"
+        )
+    return keyword_service
+
+
 # Dependency to get supabase admin client
 def get_supabase_admin() -> Client:
     """Get Supabase admin client."""
@@ -85,6 +124,25 @@ def get_supabase_admin() -> Client:
     return supabase_admin
 
 
+# Dependency to get async supabase admin client
+async def get_supabase_async() -> AsyncClient:
+    """Get async Supabase admin client."""
+    global supabase_async
+    if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
+        raise HTTPException(
+            status_code=500,
+            detail="Supabase admin client not configured"
+        )
+    if supabase_async is None:
+        supabase_async = await acreate_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+    return supabase_async
+
+
+async def get_current_user(authorization: Optional[str] = Header(None)):
+    """Dependency to get the current authenticated user."""
+    return await verify_user(authorization, supabase_admin)
+
+
 # ============================================================================
 # Health and Root Endpoints
 # ============================================================================
@@ -110,6 +168,10 @@ def export_items(request: ExportRequest):
     """
     Export knowledge items to CSV or PDF format.
     
+    Kept for backwards compatibility: the file is returned inside a JSON body
+    (PDF hex-encoded). Prefer /export/pdf and /export/csv, which return the
+    file itself.
+    
     Args:
         request: Export request with items and format
         
@@ -149,6 +211,184 @@ def export_items(request: ExportRequest):
     }
 
 
+def _attachment_filename(filename: str, extension: str) -> str:
+    """Filename with the given extension, safe for a Content-Disposition header."""
+    safe = "".join(c for c in filename if c.isalnum() or c in "._- ") or "knowledge"
+    return safe if safe.endswith(extension) else f"{safe}{extension}"
+
+
+@app.post("/export/pdf")
+def export_items_pdf(request: PdfExportRequest, current_user=Depends(get_current_user)):
+    """
+    Export knowledge items as a PDF download.
+    
+    The PDF is rendered into a spooled temporary file (on disk once large)
+    and streamed back as application/pdf, instead of hex-encoded in JSON.
+    
+    Args:
+        request: Items to export and download filename
+        
+    Returns:
+        application/pdf attachment
+    """
+    pdf_file = to_pdf_file(request.items)
+    pdf_file.seek(0, os.SEEK_END)
+    size = pdf_file.tell()
+    pdf_file.seek(0)
+    return StreamingResponse(
+        iter_file(pdf_file),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{_attachment_filename(request.filename, ".pdf")}"',
+            "Content-Length": str(size)
+        }
+    )
+
+
+@app.get("/export/csv")
+async def export_items_csv(
+    project: Optional[str] = None,
+    source: Optional[str] = None,
+    date_from: Optional[date] = Query(None, description="Earliest item date (inclusive)"),
+    date_to: Optional[date] = Query(None, description="Latest item date (inclusive)"),
+    include_raw_text: bool = False,
+    filename: str = "knowledge",
+    current_user=Depends(get_current_user),
+    supabase: AsyncClient = Depends(get_supabase_async)
+):
+    """
+    Stream knowledge items matching the filters as a CSV download.
+    
+    Items are selected server-side and written page by page, so memory use
+    stays constant however many rows match.
+    
+    Args:
+        project: Only items from this project (channel / space)
+        source: Only items from this source ('slack', 'confluence', ...)
+        date_from: Only items dated on or after this day
+        date_to: Only items dated on or before this day
+        include_raw_text: Include the full original content column
+        filename: Download filename
+        
+    Returns:
+        text/csv attachment
+    """
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(
+            status_code=400,
+            detail="date_from must not be after date_to"
+        )
+    
+    rows = stream_items_csv(
+        supabase,
+        project=project,
+        source=source,
+        date_from=date_from.isoformat() if date_from else None,
+        date_to=date_to.isoformat() if date_to else None,
+        include_raw_text=include_raw_text
+    )
+    return StreamingResponse(
+        rows,
+        media_type="text/csv; charset=utf-8",
+        headers={
+            "Content-Disposition": f'attachment; filename="{_attachment_filename(filename, ".csv")}"'
+        }
+    )
+
+
+@app.post("/export/jobs", status_code=202)
+async def create_export_job(
+    request: ExportJobRequest,
+    current_user=Depends(get_current_user),
+    supabase: AsyncClient = Depends(get_supabase_async)
+):
+    """
+    Start a background CSV/PDF export and return its job id.
+    
+    The file is rendered to disk off the request path; poll
+    GET /export/jobs/{job_id} for progress and fetch the result from
+    GET /export/jobs/{job_id}/download. Exports `items` if given, otherwise
+    the knowledge items matching the filters.
+    
+    Args:
+        request: Format, filename, and items or filters
+        
+    Returns:
+        Job status (202 Accepted)
+    """
+    if request.format not in {"pdf", "csv"}:
+        raise HTTPException(
+            status_code=400,
+            detail="Unsupported format. Must be 'pdf' or 'csv'"
+        )
+    if request.date_from and request.date_to and request.date_from > request.date_to:
+        raise HTTPException(
+            status_code=400,
+            detail="date_from must not be after date_to"
+        )
+    
+    filters = {
+        "project": request.project,
+        "source": request.source,
+        "date_from": request.date_from.isoformat() if request.date_from else None,
+        "date_to": request.date_to.isoformat() if request.date_to else None,
+        "include_raw_text": request.include_raw_text,
+    }
+    try:
+        job = get_export_job_manager().submit(
+            request.format,
+            _attachment_filename(request.filename, f".{request.format}"),
+            owner_id=current_user.id,
+            items=request.items,
+            supabase=supabase if request.items is None else None,
+            filters=filters
+        )
+    except ExportQueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many exports in progress, please try again shortly",
+            headers={"Retry-After": "30"}
+        )
+    return job.to_dict()
+
+
+def _get_export_job(job_id: str, current_user):
+    """The caller's export job, or 404."""
+    job = get_export_job_manager().get(job_id, owner_id=current_user.id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return job
+
+
+@app.get("/export/jobs/{job_id}")
+async def get_export_job(job_id: str, current_user=Depends(get_current_user)):
+    """
+    Report an export job's status and progress.
+    
+    Returns:
+        status (queued, running, completed, failed), stage, processed/total
+        items and progress (0-1, null while the total is unknown)
+    """
+    return _get_export_job(job_id, current_user).to_dict()
+
+
+@app.get("/export/jobs/{job_id}/download")
+async def download_export_job(job_id: str, current_user=Depends(get_current_user)):
+    """
+    Download a completed export job's file.
+    
+    Returns:
+        The CSV/PDF attachment; 409 if the job has not completed
+    """
+    job = _get_export_job(job_id, current_user)
+    if job.status != "completed":
+        raise HTTPException(
+            status_code=409,
+            detail=f"Export job is {job.status}" + (f": {job.error}" if job.error else "")
+        )
+    return FileResponse(job.path, media_type=job.media_type, filename=job.filename)
+
+
 # ============================================================================
 # Public Signup Endpoint
 # ============================================================================
@@ -284,6 +524,79 @@ async def update_user_role(
         )
 
 
+# ============================================================================
+# Keyword Vocabulary Endpoints (Admin Only)
+# ============================================================================
+
+@app.get("/api/admin/keywords")
+async def list_keywords(
+    current_user=Depends(get_current_admin),
+    service: KeywordService = Depends(get_keyword_service)
+):
+    """List the Slack keyword vocabulary (Admin only)."""
+    try:
+        return {"keywords": service.list_keywords()}
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to list keywords: {str(e)}"
+        )
+
+
+@app.post("/api/admin/keywords")
+async def add_keyword(
+    request: KeywordRequest,
+    current_user=Depends(get_current_admin),
+    service: KeywordService = Depends(get_keyword_service)
+):
+    """Add a keyword the Slack extractors should match (Admin only)."""
+    try:
+        return service.add_keyword(request.keyword, created_by=current_user.id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Failed to add keyword: {str(e)}"
+        )
+
+
+@app.patch("/api/admin/keywords/{keyword_id}")
+async def update_keyword(
+    keyword_id: str,
+    request: UpdateKeywordRequest,
+    current_user=Depends(get_current_admin),
+    service: KeywordService = Depends(get_keyword_service)
+):
+    """Enable or disable a vocabulary keyword (Admin only)."""
+    try:
+        return service.set_keyword_active(keyword_id, request.active)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Failed to update keyword: {str(e)}"
+        )
+
+
+@app.delete("/api/admin/keywords/{keyword_id}")
+async def delete_keyword(
+    keyword_id: str,
+    current_user=Depends(get_current_admin),
+    service: KeywordService = Depends(get_keyword_service)
+):
+    """Delete a vocabulary keyword (Admin only)."""
+    try:
+        service.delete_keyword(keyword_id)
+        return {"success": True, "message": "Keyword deleted successfully"}
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Failed to delete keyword: {str(e)}"
+        )
+
+
 # ============================================================================
 # AI Assistant Endpoints
 # ============================================================================
@@ -291,14 +604,14 @@ async def update_user_role(
 @app.post("/api/ai/ask")
 async def ask_ai_question(
     request: AIQuestionRequest,
-    supabase: Client = Depends(get_supabase_admin)
+    supabase: AsyncClient = Depends(get_supabase_async)
 ):
     """
     Answer a user's question using AI and relevant articles from the knowledge base.
     
     Args:
         request: Question request with user's question
-        supabase: Supabase admin client
+        supabase: Async Supabase admin client
         
     Returns:
         AI-generated answer with relevant article links
@@ -310,7 +623,7 @@ async def ask_ai_question(
         )
     
     try:
-        result = process_ai_question(supabase, request.question.strip())
+        result = await process_ai_question(supabase, request.question.strip())
         return result
     except Exception as e:
         logger.error(f"Error processing AI question: {str(e)}")
@@ -320,6 +633,58 @@ async def ask_ai_question(
         )
 
 
+@app.post("/api/ai/ask/stream")
+async def ask_ai_question_stream(
+    request: AIQuestionRequest,
+    supabase: AsyncClient = Depends(get_supabase_async)
+):
+    """
+    Streaming variant of /api/ai/ask using Server-Sent Events.
+    
+    Emits an ``articles`` event as soon as search completes, ``token`` events
+    while the answer is generated, then a ``done`` event with the same body
+    /api/ai/ask returns (or an ``error`` event).
+    
+    Args:
+        request: Question request with user's question
+        supabase: Async Supabase admin client
+    """
+    if not request.question or not request.question.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="Question cannot be empty"
+        )
+    
+    async def event_stream():
+        try:
+            async for event, data in stream_ai_question(supabase, request.question.strip()):
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming AI question: {str(e)}")
+            yield f"event: error\ndata: {json.dumps({'detail': f'Failed to process question: {str(e)}'})}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        # Disable proxy buffering so events reach the browser immediately
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.get("/api/ai/cache/stats")
+def ai_cache_stats(current_user=Depends(get_current_admin)):
+    """
+    Answer cache hit/miss counters for this worker process (Admin only).
+    
+    Returns:
+        Cache statistics, or {"enabled": False} when the cache is off
+    """
+    cache = get_answer_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
 # ============================================================================
 # Application Entry Point
 # ============================================================================
@@ -1,6 +1,7 @@
 """Pydantic models for request/response validation."""
 from pydantic import BaseModel, EmailStr
-from typing import List, Dict, Any
+from datetime import date
+from typing import List, Dict, Any, Optional
 
 
 class ExportRequest(BaseModel):
@@ -10,6 +11,29 @@ class ExportRequest(BaseModel):
     items: List[Dict[str, Any]]
 
 
+class PdfExportRequest(BaseModel):
+    """Request model for exporting knowledge items as a PDF download."""
+    filename: str = "knowledge"
+    items: List[Dict[str, Any]]
+
+
+class ExportJobRequest(BaseModel):
+    """
+    Request model for a background export job.
+    
+    Exports `items` if given, otherwise the knowledge items matching the
+    filters.
+    """
+    format: str  # 'pdf' or 'csv'
+    filename: str = "knowledge"
+    items: Optional[List[Dict[str, Any]]] = None
+    project: Optional[str] = None
+    source: Optional[str] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    include_raw_text: bool = False
+
+
 class CreateUserRequest(BaseModel):
     """Request model for creating a new user."""
     email: EmailStr
@@ -30,6 +54,16 @@ class UpdateUserRoleRequest(BaseModel):
     role: str  # 'admin', 'project_lead', or 'team_member'
 
 
+class KeywordRequest(BaseModel):
+    """Request model for adding a keyword to the Slack keyword vocabulary."""
+    keyword: str
+
+
+class UpdateKeywordRequest(BaseModel):
+    """Request model for enabling/disabling a vocabulary keyword."""
+    active: bool
+
+
 class AIQuestionRequest(BaseModel):
     """Request model for AI Q&A."""
     question: str
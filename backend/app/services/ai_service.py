@@ -1,24 +1,144 @@
 """AI service for question-answering using OpenAI and Supabase."""
 import os
+import re
+import json
+import asyncio
+import time
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
-from supabase import Client
+import threading
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+from supabase import AsyncClient
 
-from app.utils.ai_summarization import call_openai_api
+from app.utils.ai_summarization import (
+    call_openai_api_async,
+    stream_openai_api_async,
+    create_embedding_async,
+    StreamInterrupted
+)
+from app.utils.cache import TTLCache, SQLiteCache
 
 logger = logging.getLogger(__name__)
 
+# Columns returned for ILIKE search results; raw_text can be megabytes for
+# Slack articles and the answer prompt doesn't use it, so it is never fetched
+ARTICLE_SEARCH_COLUMNS = 'id, summary, topics, key_points, source, created_at'
+# Columns needed to rank ILIKE matches
+ARTICLE_MATCH_COLUMNS = 'id, created_at'
 
-def extract_keywords_with_openai(question: str) -> List[str]:
+# Words dropped when extracting keywords locally
+QUESTION_STOP_WORDS = {
+    'what', 'is', 'the', 'of', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'with', 'about', 'tell', 'me', 'show', 'status', 'latest', 'updates', 'information',
+    'how', 'who', 'when', 'where', 'why', 'which', 'are', 'was', 'were', 'does', 'do', 'did',
+    'can', 'could', 'any', 'there', 'our', 'we', 'us', 'this', 'that', 'has', 'have', 'been',
+    'give', 'find', 'know', 'please', 'you', 'your', 'its', 'from', 'into', 'update'
+}
+TOPIC_PAGE_SIZE = 1000
+# Completion settings for answers (shared by the JSON and streaming endpoints)
+ANSWER_COMPLETION_OPTIONS = {
+    'model': 'gpt-4o-mini',
+    'temperature': 0.3,
+    'max_tokens': 250,
+    'timeout': 45  # Increased timeout
+}
+
+# Question -> OpenAI keywords
+_keyword_cache = TTLCache(
+    maxsize=int(os.getenv('AI_KEYWORD_CACHE_SIZE', '1024')),
+    ttl=float(os.getenv('AI_KEYWORD_CACHE_TTL', '3600'))
+)
+_topic_vocabulary: Dict[str, Any] = {'matcher': None, 'loaded_at': 0.0}
+_topic_vocabulary_lock = asyncio.Lock()
+
+_answer_cache: Optional[TTLCache] = None
+_answer_cache_lock = threading.Lock()
+
+
+def get_answer_cache() -> Optional[TTLCache]:
+    """
+    Return the process-wide answer cache, or None if AI_ANSWER_CACHE=false.
+    
+    Sized by AI_ANSWER_CACHE_SIZE (default 256) and AI_ANSWER_CACHE_TTL
+    seconds (default 600). Setting AI_ANSWER_CACHE_DB to a file path adds a
+    SQLite tier shared by all workers on the host.
+    """
+    global _answer_cache
+    if os.getenv('AI_ANSWER_CACHE', 'true').lower() == 'false':
+        return None
+    with _answer_cache_lock:
+        if _answer_cache is None:
+            ttl = float(os.getenv('AI_ANSWER_CACHE_TTL', '600'))
+            shared = None
+            db_path = os.getenv('AI_ANSWER_CACHE_DB')
+            if db_path:
+                try:
+                    shared = SQLiteCache(db_path, ttl)
+                except Exception as e:
+                    logger.warning(f"Shared answer cache unavailable ({str(e)}), using in-process cache only")
+            _answer_cache = TTLCache(
+                maxsize=int(os.getenv('AI_ANSWER_CACHE_SIZE', '256')),
+                ttl=ttl,
+                shared=shared
+            )
+        return _answer_cache
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    return re.sub(r'\s+', ' ', question.lower()).strip().rstrip('?!. ')
+
+
+def answer_cache_key(question: str, articles: List[Dict[str, Any]]) -> str:
+    """
+    Cache key for an answer: the normalized question plus the matched
+    articles, in order, with the fields the answer prompt is built from, so
+    an edited or newly matching article produces a new key.
+    """
+    fingerprint = [
+        [a.get('id'), a.get('summary'), a.get('topics'), a.get('key_points')]
+        for a in articles
+    ]
+    material = json.dumps([normalize_question(question), fingerprint], sort_keys=True, default=str)
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def extract_keywords_simple(question: str) -> List[str]:
+    """
+    Extract keywords from a question by dropping stop words (no API call).
+    
+    Args:
+        question: User's question
+        
+    Returns:
+        List of keywords
+    """
+    question_lower = question.lower()
+    question_words = [word.strip() for word in question_lower.split() if word.strip() and word not in QUESTION_STOP_WORDS]
+    keywords = [word for word in question_words if len(word) > 2]
+    return keywords if keywords else [word.strip() for word in question_lower.split() if len(word.strip()) > 2]
+
+
+async def extract_keywords_with_openai(question: str) -> List[str]:
     """
     Use OpenAI API to extract the most relevant keywords from a user's question.
     
+    Results are memoized per normalized question in a bounded TTL cache
+    (AI_KEYWORD_CACHE_SIZE / AI_KEYWORD_CACHE_TTL); the stop-word fallback
+    used when OpenAI fails is not cached.
+    
     Args:
         question: User's question
         
     Returns:
         List of extracted keywords
     """
+    cache_key = normalize_question(question)
+    cached = _keyword_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"Cached OpenAI keywords: {cached}")
+        return list(cached)
+    
     try:
         logger.info(f"Extracting keywords from question using OpenAI: {question[:50]}...")
         
@@ -32,7 +152,7 @@ def extract_keywords_with_openai(question: str) -> List[str]:
         )
         
         # Call OpenAI API
-        response = call_openai_api(
+        response = await call_openai_api_async(
             prompt=prompt,
             system_message=system_message,
             model='gpt-4o-mini',
@@ -43,185 +163,363 @@ def extract_keywords_with_openai(question: str) -> List[str]:
         
         if not response:
             logger.warning("OpenAI keyword extraction returned None, falling back to simple extraction")
-            # Fallback: simple keyword extraction
-            question_lower = question.lower()
-            stop_words = {'what', 'is', 'the', 'of', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'with', 'about', 'tell', 'me', 'show', 'status', 'latest', 'updates', 'information'}
-            question_words = [word.strip() for word in question_lower.split() if word.strip() and word not in stop_words]
-            keywords = [word for word in question_words if len(word) > 2]
-            return keywords if keywords else [word.strip() for word in question_lower.split() if len(word.strip()) > 2]
+            return extract_keywords_simple(question)
         
         # Parse keywords from response (comma-separated)
         keywords = [kw.strip() for kw in response.split(',') if kw.strip()]
+        if not keywords:
+            return extract_keywords_simple(question)
         logger.info(f"OpenAI extracted keywords: {keywords}")
-        
-        return keywords
-        
+        _keyword_cache.set(cache_key, keywords)
+        return list(keywords)
+    
     except Exception as e:
         logger.error(f"Error extracting keywords with OpenAI: {str(e)}", exc_info=True)
-        # Fallback: simple keyword extraction
-        question_lower = question.lower()
-        stop_words = {'what', 'is', 'the', 'of', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'with', 'about', 'tell', 'me', 'show', 'status', 'latest', 'updates', 'information'}
-        question_words = [word.strip() for word in question_lower.split() if word.strip() and word not in stop_words]
-        keywords = [word for word in question_words if len(word) > 2]
-        return keywords if keywords else [word.strip() for word in question_lower.split() if len(word.strip()) > 2]
+        return extract_keywords_simple(question)
 
 
-def search_relevant_articles(
-    supabase: Client,
-    question: str,
-    limit: int = 5
-) -> List[Dict[str, Any]]:
+def _build_topic_matcher(vocabulary: List[str]) -> Optional[re.Pattern]:
     """
-    Search for articles relevant to the user's question using OpenAI-extracted keywords
-    and Supabase ILIKE queries.
+    One alternation over every topic, longest first so multi-word topics win
+    over their parts; an optional plural suffix matches the singular topics
+    the extractors store.
+    """
+    topics = sorted(
+        {t.strip().lower() for t in vocabulary if t and len(t.strip()) > 2} - QUESTION_STOP_WORDS,
+        key=len,
+        reverse=True
+    )
+    if not topics:
+        return None
+    alternation = '|'.join(re.escape(topic) for topic in topics)
+    return re.compile(rf'\b({alternation})(?:s|es)?\b')
+
+
+async def get_topic_vocabulary(supabase: AsyncClient) -> Optional[re.Pattern]:
+    """
+    Return a matcher for the topic vocabulary in ``knowledge_items.topics``.
     
-    Workflow:
-    1. Extract keywords from question using OpenAI API
-    2. Query Supabase using ILIKE '%keyword%' matching on titles (summary) and summaries
-    3. Return matching articles
+    Loaded page by page and kept for AI_TOPIC_VOCABULARY_TTL seconds (default
+    600); if a reload fails the previous vocabulary is kept.
+    """
+    ttl = float(os.getenv('AI_TOPIC_VOCABULARY_TTL', '600'))
+    async with _topic_vocabulary_lock:
+        if _topic_vocabulary['matcher'] is not None and time.monotonic() - _topic_vocabulary['loaded_at'] < ttl:
+            return _topic_vocabulary['matcher']
+        try:
+            vocabulary = set()
+            offset = 0
+            while True:
+                response = await (
+                    supabase.table('knowledge_items').select('topics')
+                    .not_.is_('topics', 'null')
+                    .range(offset, offset + TOPIC_PAGE_SIZE - 1)
+                    .execute()
+                )
+                rows = response.data or []
+                for row in rows:
+                    vocabulary.update(row.get('topics') or [])
+                if len(rows) < TOPIC_PAGE_SIZE:
+                    break
+                offset += TOPIC_PAGE_SIZE
+            _topic_vocabulary['matcher'] = _build_topic_matcher(list(vocabulary))
+            logger.info(f"Loaded topic vocabulary ({len(vocabulary)} topics)")
+        except Exception as e:
+            logger.warning(f"Could not load topic vocabulary: {str(e)}")
+        # Also on failure, so a broken query is not retried on every question
+        _topic_vocabulary['loaded_at'] = time.monotonic()
+        return _topic_vocabulary['matcher']
+
+
+def extract_keywords_local(question: str, topic_matcher: Optional[re.Pattern]) -> List[str]:
+    """
+    Extract keywords without an API call: known topics found in the question,
+    followed by its remaining non-stop words.
     
     Args:
-        supabase: Supabase client instance
         question: User's question
-        limit: Maximum number of articles to return
+        topic_matcher: Matcher from get_topic_vocabulary
         
     Returns:
-        List of relevant articles with id, summary, topics, and key_points
+        Keywords, or an empty list if no known topic appears in the question
     """
-    try:
-        logger.info(f"Searching articles for question: {question[:50]}...")
+    if topic_matcher is None:
+        return []
+    question_lower = question.lower()
+    topics = []
+    for match in topic_matcher.finditer(question_lower):
+        if match.group(1) not in topics:
+            topics.append(match.group(1))
+    if not topics:
+        return []
+    remainder = topic_matcher.sub(' ', question_lower)
+    extra = [
+        word for word in re.findall(r"[\w'-]+", remainder)
+        if len(word) > 2 and word not in QUESTION_STOP_WORDS
+    ]
+    return topics + [word for word in extra if word not in topics]
+
+
+async def extract_keywords(
+    supabase: AsyncClient,
+    question: str,
+    allow_openai: bool = True
+) -> List[str]:
+    """
+    Extract search keywords, trying the local topic-vocabulary extractor first.
+    
+    Args:
+        supabase: Async Supabase client instance
+        question: User's question
+        allow_openai: Fall back to OpenAI when no known topic is found;
+            otherwise fall back to stop-word removal
         
-        # Step 1: Extract keywords using OpenAI
-        keywords = extract_keywords_with_openai(question)
+    Returns:
+        List of keywords
+    """
+    keywords = extract_keywords_local(question, await get_topic_vocabulary(supabase))
+    if keywords:
+        logger.info(f"Local keywords: {keywords}")
+        return keywords
+    if allow_openai:
+        return await extract_keywords_with_openai(question)
+    return extract_keywords_simple(question)
+
+
+async def _search_keyword(supabase: AsyncClient, keyword: str, limit: int) -> List[Dict[str, Any]]:
+    """
+    Run the summary and raw_text ILIKE queries for one keyword concurrently,
+    returning only ids and dates of the most recent matches.
+    """
+    try:
+        # Search in summary (title) and raw_text (content) with case-insensitive matching
+        responses = await asyncio.gather(
+            supabase.table('knowledge_items').select(ARTICLE_MATCH_COLUMNS)
+            .ilike('summary', f'%{keyword}%')
+            .order('created_at', desc=True).limit(limit).execute(),
+            supabase.table('knowledge_items').select(ARTICLE_MATCH_COLUMNS)
+            .ilike('raw_text', f'%{keyword}%')
+            .order('created_at', desc=True).limit(limit).execute()
+        )
+        return [article for response in responses for article in (response.data or [])]
+    except Exception as e:
+        logger.warning(f"Error querying for keyword '{keyword}': {str(e)}")
+        return []
+
+
+async def search_articles_full_text(
+    supabase: AsyncClient,
+    keywords: List[str],
+    limit: int
+) -> List[Dict[str, Any]]:
+    """
+    Rank articles for all keywords in one round trip via the
+    ``search_knowledge_items`` RPC (see ``supabase/add_full_text_search.sql``).
+    
+    Args:
+        supabase: Async Supabase client instance
+        keywords: Search keywords (any may match)
+        limit: Maximum number of articles to return
         
-        if not keywords:
-            logger.warning("No keywords extracted, returning empty results")
-            return []
+    Returns:
+        Articles ordered by ts_rank (without raw_text)
+    """
+    response = await supabase.rpc(
+        'search_knowledge_items',
+        {'keywords': keywords, 'match_limit': limit}
+    ).execute()
+    return response.data or []
+
+
+async def search_articles_fuzzy(
+    supabase: AsyncClient,
+    keywords: List[str],
+    limit: int,
+    threshold: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Typo-tolerant search via the ``search_knowledge_items_fuzzy`` RPC
+    (pg_trgm word similarity on summary and topics, see
+    ``supabase/add_trigram_search.sql``).
+    
+    Args:
+        supabase: Async Supabase client instance
+        keywords: Search keywords (any may match)
+        limit: Maximum number of articles to return
+        threshold: Minimum word similarity (AI_SEARCH_SIMILARITY_THRESHOLD, default 0.4)
         
-        logger.info(f"Searching with keywords: {keywords}")
-        
-        # Step 2: Query Supabase using ILIKE matching for each keyword
-        # We'll search in both 'summary' (which serves as title) and 'raw_text' (which contains content)
-        # Note: Supabase PostgREST doesn't support OR conditions directly in filters,
-        # so we'll query for each keyword and combine results
-        
-        all_matching_articles = {}
-        
-        for keyword in keywords:
-            try:
-                # Search in summary (title) field with case-insensitive matching
-                query_summary = supabase.table('knowledge_items').select(
-                    'id, summary, topics, key_points, raw_text, source, created_at'
-                ).ilike('summary', f'%{keyword}%')
-                
-                response_summary = query_summary.execute()
-                if response_summary.data:
-                    for article in response_summary.data:
-                        article_id = article.get('id')
-                        if article_id not in all_matching_articles:
-                            all_matching_articles[article_id] = article
-                
-                # Also search in raw_text (content) field with case-insensitive matching
-                query_raw_text = supabase.table('knowledge_items').select(
-                    'id, summary, topics, key_points, raw_text, source, created_at'
-                ).ilike('raw_text', f'%{keyword}%')
-                
-                response_raw_text = query_raw_text.execute()
-                if response_raw_text.data:
-                    for article in response_raw_text.data:
-                        article_id = article.get('id')
-                        if article_id not in all_matching_articles:
-                            all_matching_articles[article_id] = article
-                            
-            except Exception as e:
-                logger.warning(f"Error querying for keyword '{keyword}': {str(e)}")
-                continue
-        
-        # Convert dictionary values to list
-        articles = list(all_matching_articles.values())
-        
-        # Sort by created_at (most recent first) and limit results
-        articles.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        result = articles[:limit]
-        
-        logger.info(f"Found {len(result)} matching articles (from {len(articles)} total matches)")
+    Returns:
+        Articles ordered by similarity (without raw_text)
+    """
+    if threshold is None:
+        threshold = float(os.getenv('AI_SEARCH_SIMILARITY_THRESHOLD', '0.4'))
+    response = await supabase.rpc(
+        'search_knowledge_items_fuzzy',
+        {'keywords': keywords, 'match_limit': limit, 'similarity_threshold': threshold}
+    ).execute()
+    return response.data or []
+
+
+async def search_articles_semantic(
+    supabase: AsyncClient,
+    question: str,
+    limit: int,
+    min_similarity: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Top-k articles by cosine similarity between the question embedding and the
+    article embeddings stored at ingest, via the ``match_knowledge_items`` RPC
+    (pgvector HNSW index, see ``supabase/add_embeddings.sql``).
+    
+    Args:
+        supabase: Async Supabase client instance
+        question: User's question
+        limit: Maximum number of articles to return
+        min_similarity: Minimum cosine similarity (AI_SEMANTIC_MIN_SIMILARITY, default 0.3)
         
-        return result
+    Returns:
+        Articles ordered by similarity (without raw_text)
         
-    except Exception as e:
-        logger.error(f"Error searching articles: {str(e)}", exc_info=True)
+    Raises:
+        RuntimeError: If the question could not be embedded
+    """
+    if min_similarity is None:
+        min_similarity = float(os.getenv('AI_SEMANTIC_MIN_SIMILARITY', '0.3'))
+    embedding = await create_embedding_async(question)
+    if embedding is None:
+        raise RuntimeError("Question embedding unavailable")
+    response = await supabase.rpc(
+        'match_knowledge_items',
+        {'query_embedding': embedding, 'match_limit': limit, 'min_similarity': min_similarity}
+    ).execute()
+    return response.data or []
+
+
+def is_semantic_search_enabled() -> bool:
+    """Semantic search is on unless AI_SEMANTIC_SEARCH=false."""
+    return os.getenv('AI_SEMANTIC_SEARCH', 'true').lower() != 'false'
+
+
+async def search_articles_ilike(
+    supabase: AsyncClient,
+    keywords: List[str],
+    limit: int
+) -> List[Dict[str, Any]]:
+    """
+    Fallback search with per-keyword ILIKE queries, most recent first.
+    
+    Used when the full-text search RPC is not installed. Matching only
+    returns ids; the article rows (without raw_text) are fetched for the
+    final top-k.
+    """
+    # Supabase PostgREST doesn't support OR conditions directly in filters,
+    # so we query for each keyword (concurrently) and combine results
+    keyword_results = await asyncio.gather(
+        *(_search_keyword(supabase, keyword, limit) for keyword in keywords)
+    )
+    
+    all_matches = {}
+    for results in keyword_results:
+        for match in results:
+            all_matches.setdefault(match.get('id'), match.get('created_at') or '')
+    
+    # Sort by created_at (most recent first) and limit results
+    top_ids = sorted(all_matches, key=lambda article_id: all_matches[article_id], reverse=True)[:limit]
+    logger.info(f"ILIKE search matched {len(all_matches)} articles")
+    if not top_ids:
         return []
+    
+    response = await (
+        supabase.table('knowledge_items').select(ARTICLE_SEARCH_COLUMNS)
+        .in_('id', top_ids).execute()
+    )
+    articles_by_id = {article.get('id'): article for article in response.data or []}
+    return [articles_by_id[article_id] for article_id in top_ids if article_id in articles_by_id]
 
 
-def format_articles_for_prompt(articles: List[Dict[str, Any]]) -> str:
+async def search_relevant_articles(
+    supabase: AsyncClient,
+    question: str,
+    limit: int = 5
+) -> List[Dict[str, Any]]:
     """
-    Format articles into a context string for the OpenAI prompt.
+    Search for articles relevant to the user's question.
+    
+    Workflow:
+    1. Extract keywords locally (known topics + stop-word filter); the OpenAI
+       keyword extraction round trip is only used when semantic search is
+       disabled and the question mentions no known topic
+    2. Run semantic (embedding), Postgres full-text and pg_trgm fuzzy searches
+       concurrently (falls back to ILIKE queries if all of them fail)
+    3. Merge: semantic matches first, then full-text, then fuzzy
     
     Args:
-        articles: List of article dictionaries
+        supabase: Async Supabase client instance
+        question: User's question
+        limit: Maximum number of articles to return
         
     Returns:
-        Formatted string with article summaries
+        List of relevant articles with id, summary, topics, and key_points
     """
-    if not articles:
-        return "No relevant articles found in the knowledge base."
-    
-    formatted = []
-    for i, article in enumerate(articles, 1):
-        summary = article.get('summary', 'No summary available')
-        topics = article.get('topics', [])
-        key_points = article.get('key_points', [])
-        raw_text = article.get('raw_text', '')
-        source = article.get('source', 'Unknown')
+    try:
+        logger.info(f"Searching articles for question: {question[:50]}...")
         
-        article_text = f"=== Article {i} ===\n"
-        article_text += f"Title/Summary: {summary}\n"
+        # Step 1: Keywords for the lexical searches; OpenAI is only asked
+        # when there is no semantic search and no known topic in the question
+        semantic = is_semantic_search_enabled()
+        keywords = await extract_keywords(supabase, question, allow_openai=not semantic)
         
-        if topics:
-            if isinstance(topics, list):
-                topics_str = ', '.join(str(t) for t in topics)
-            else:
-                topics_str = str(topics)
-            article_text += f"Topics/Keywords: {topics_str}\n"
+        searches = []
+        if semantic:
+            searches.append(search_articles_semantic(supabase, question, limit))
+        if keywords:
+            logger.info(f"Searching with keywords: {keywords}")
+            searches.append(search_articles_full_text(supabase, keywords, limit))
+            searches.append(search_articles_fuzzy(supabase, keywords, limit))
         
-        if key_points:
-            if isinstance(key_points, list):
-                article_text += f"Key Points:\n"
-                for j, kp in enumerate(key_points, 1):
-                    article_text += f"  {j}. {kp}\n"
-            else:
-                article_text += f"Key Points: {key_points}\n"
+        if not searches:
+            logger.warning("No keywords extracted, returning empty results")
+            return []
         
-        # Include a snippet of raw_text if available (first 300 chars to keep prompt shorter)
-        if raw_text:
-            raw_text_snippet = raw_text[:300] if len(raw_text) > 300 else raw_text
-            article_text += f"Content: {raw_text_snippet}...\n" if len(raw_text) > 300 else f"Content: {raw_text_snippet}\n"
+        # Step 2: All searches in one concurrent round trip
+        results = await asyncio.gather(*searches, return_exceptions=True)
+        if all(isinstance(r, Exception) for r in results):
+            logger.warning(f"Search RPCs failed ({str(results[0])}), falling back to ILIKE search")
+            result = await search_articles_ilike(supabase, keywords, limit) if keywords else []
+        else:
+            # Step 3: Earlier searches rank first; later ones fill remaining slots
+            merged: Dict[str, Dict[str, Any]] = {}
+            for articles in results:
+                if isinstance(articles, Exception):
+                    logger.warning(f"Search failed: {str(articles)}")
+                    continue
+                for article in articles:
+                    merged.setdefault(article.get('id'), article)
+            result = list(merged.values())[:limit]
+        
+        logger.info(f"Found {len(result)} matching articles")
         
-        article_text += f"Source: {source}\n"
-        article_text += f"Article ID: {article.get('id')}\n"
+        return result
         
-        formatted.append(article_text)
-    
-    return "\n\n".join(formatted)
+    except Exception as e:
+        logger.error(f"Error searching articles: {str(e)}", exc_info=True)
+        return []
 
 
-def generate_ai_answer(
+def build_answer_prompt(
     question: str,
     articles: List[Dict[str, Any]]
-) -> Optional[str]:
+) -> Tuple[str, str]:
     """
-    Generate an AI-powered answer using OpenAI.
+    Build the system message and user prompt for answering a question.
     
     Args:
         question: User's question
         articles: List of relevant articles
         
     Returns:
-        AI-generated answer or None if generation fails
+        Tuple of (system_message, prompt)
     """
-    # Format articles for context
-    articles_context = format_articles_for_prompt(articles)
-    
     # Create system message
     system_message = (
         "You are an AI assistant for a team knowledge base application. "
@@ -280,15 +578,31 @@ User question: "{question}"
 
 Provide a relevant results list. If articles match the question, format them as Markdown links. If no articles match, respond with exactly: 'I do not have information for this.'"""
     
+    return system_message, prompt
+
+
+async def generate_ai_answer(
+    question: str,
+    articles: List[Dict[str, Any]]
+) -> Optional[str]:
+    """
+    Generate an AI-powered answer using OpenAI.
+    
+    Args:
+        question: User's question
+        articles: List of relevant articles
+        
+    Returns:
+        AI-generated answer or None if generation fails
+    """
+    system_message, prompt = build_answer_prompt(question, articles)
+    
     # Call OpenAI API with increased timeout
     logger.info(f"Calling OpenAI API with {len(articles)} articles, prompt length: {len(prompt)}")
-    answer = call_openai_api(
+    answer = await call_openai_api_async(
         prompt=prompt,
         system_message=system_message,
-        model='gpt-4o-mini',
-        temperature=0.3,
-        max_tokens=250,
-        timeout=45  # Increased timeout
+        **ANSWER_COMPLETION_OPTIONS
     )
     
     if answer:
@@ -401,15 +715,90 @@ def normalize_rejection_answer(answer: str) -> str:
     return answer
 
 
-def process_ai_question(
-    supabase: Client,
+def build_fallback_answer(articles: List[Dict[str, Any]]) -> str:
+    """Markdown list of article links, used when answer generation fails."""
+    if not articles:
+        return (
+            "I couldn't generate an answer at this time. "
+            "Please try rephrasing your question or check back later."
+        )
+    answer_lines = []
+    for article in articles:
+        article_id = article.get('id')
+        article_url = get_article_url(article_id)
+        summary = article.get('summary', 'Untitled Article')
+        topics = article.get('topics', [])
+        key_points = article.get('key_points', [])
+        
+        # Create markdown link
+        link_text = f"[{summary}]({article_url})"
+        
+        # Add summary/status
+        status_parts = []
+        if topics:
+            topics_str = ', '.join(topics) if isinstance(topics, list) else str(topics)
+            status_parts.append(f"Topics: {topics_str}")
+        if key_points and isinstance(key_points, list) and len(key_points) > 0:
+            status_parts.append(f"Key point: {key_points[0]}")
+        
+        status = " — " + ". ".join(status_parts) if status_parts else ""
+        answer_lines.append(f"{link_text}{status}")
+    
+    return "\n".join(answer_lines)
+
+
+def build_article_links(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Title and URL for each article."""
+    return [
+        {
+            'id': article.get('id'),
+            'title': article.get('summary', 'Untitled Article'),
+            'url': get_article_url(article.get('id'))
+        }
+        for article in articles
+    ]
+
+
+def build_answer_result(answer: str, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Assemble the response for an answer. Relevant articles are omitted when
+    the answer is a rejection; article links are always included.
+    """
+    is_rejection = is_rejection_answer(answer)
+    return {
+        'answer': answer,
+        'relevant_articles': [
+            {
+                'id': article.get('id'),
+                'title': article.get('summary', 'Untitled Article'),
+                'topics': article.get('topics', []),
+                'source': article.get('source', 'Unknown')
+            }
+            for article in articles
+        ] if not is_rejection else [],
+        'article_links': build_article_links(articles)
+    }
+
+
+NO_ARTICLES_RESULT = {
+    'answer': 'I do not have information for this.',
+    'relevant_articles': [],
+    'article_links': []
+}
+
+
+async def process_ai_question(
+    supabase: AsyncClient,
     question: str
 ) -> Dict[str, Any]:
     """
     Process an AI question: search articles, generate answer, and return results.
     
+    Runs entirely on the event loop, so concurrent questions do not block
+    other requests.
+    
     Args:
-        supabase: Supabase client instance
+        supabase: Async Supabase client instance
         question: User's question
         
     Returns:
@@ -419,86 +808,107 @@ def process_ai_question(
         logger.info(f"Processing AI question: {question[:50]}...")
         
         # Search for relevant articles (limit to top 3 for faster processing)
-        articles = search_relevant_articles(supabase, question, limit=3)
+        articles = await search_relevant_articles(supabase, question, limit=3)
         
         # If no articles found, return appropriate message
         if not articles:
             logger.info("No articles found, returning 'no information' message")
-            return {
-                'answer': 'I do not have information for this.',
-                'relevant_articles': [],
-                'article_links': []
-            }
+            return dict(NO_ARTICLES_RESULT)
+        
+        # Reuse the answer for the same question over the same articles
+        cache = get_answer_cache()
+        cache_key = answer_cache_key(question, articles)
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info("Answer cache hit")
+                return cached
         
         # Generate AI answer with fallback
         logger.info("Generating AI answer...")
-        answer = generate_ai_answer(question, articles)
+        answer = await generate_ai_answer(question, articles)
         
         if not answer:
             logger.warning("AI answer generation returned None, using fallback")
-            # Fallback: Create markdown-formatted answer from articles
-            if articles:
-                answer_lines = []
-                for i, article in enumerate(articles, 1):
-                    article_id = article.get('id')
-                    article_url = get_article_url(article_id)
-                    summary = article.get('summary', 'Untitled Article')
-                    topics = article.get('topics', [])
-                    key_points = article.get('key_points', [])
-                    
-                    # Create markdown link
-                    link_text = f"[{summary}]({article_url})"
-                    
-                    # Add summary/status
-                    status_parts = []
-                    if topics:
-                        topics_str = ', '.join(topics) if isinstance(topics, list) else str(topics)
-                        status_parts.append(f"Topics: {topics_str}")
-                    if key_points and isinstance(key_points, list) and len(key_points) > 0:
-                        status_parts.append(f"Key point: {key_points[0]}")
-                    
-                    status = " — " + ". ".join(status_parts) if status_parts else ""
-                    answer_lines.append(f"{link_text}{status}")
-                
-                answer = "\n".join(answer_lines)
-            else:
-                answer = (
-                    "I couldn't generate an answer at this time. "
-                    "Please try rephrasing your question or check back later."
-                )
-        else:
-            # Normalize rejection answers
-            answer = normalize_rejection_answer(answer)
-            logger.info(f"AI answer generated: {answer[:100]}...")
-        
-        # Check if answer is a rejection
-        is_rejection = is_rejection_answer(answer)
-        
-        # Always create article links if we have articles (the AI response may contain markdown links)
-        article_links = []
-        if articles:
-            for article in articles:
-                article_links.append({
-                    'id': article.get('id'),
-                    'title': article.get('summary', 'Untitled Article'),
-                    'url': get_article_url(article.get('id'))
-                })
+            return build_answer_result(build_fallback_answer(articles), articles)
+        
+        # Normalize rejection answers
+        answer = normalize_rejection_answer(answer)
+        logger.info(f"AI answer generated: {answer[:100]}...")
+        
+        result = build_answer_result(answer, articles)
+        # Fallback answers are not cached so the next ask retries OpenAI
+        if cache is not None:
+            cache.set(cache_key, result)
         
         logger.info("Successfully processed AI question")
-        return {
-            'answer': answer,
-            'relevant_articles': [
-                {
-                    'id': article.get('id'),
-                    'title': article.get('summary', 'Untitled Article'),
-                    'topics': article.get('topics', []),
-                    'source': article.get('source', 'Unknown')
-                }
-                for article in articles
-            ] if not is_rejection else [],
-            'article_links': article_links
-        }
+        return result
     except Exception as e:
         logger.error(f"Error processing AI question: {str(e)}", exc_info=True)
         raise
 
+
+async def stream_ai_question(
+    supabase: AsyncClient,
+    question: str
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Streaming variant of process_ai_question.
+    
+    Yields (event, data) pairs:
+    - ``articles``: ``{'article_links': [...]}`` as soon as search completes
+    - ``token``: ``{'text': ...}`` for each answer fragment from OpenAI
+    - ``done``: the same dictionary process_ai_question returns; its answer is
+      the rejection-normalized (or fallback) text and replaces the streamed one
+    - ``error``: ``{'detail': ...}`` instead of ``done`` if the answer stream
+      breaks off; the partial answer is not cached
+    
+    Args:
+        supabase: Async Supabase client instance
+        question: User's question
+    """
+    logger.info(f"Streaming AI question: {question[:50]}...")
+    
+    articles = await search_relevant_articles(supabase, question, limit=3)
+    yield 'articles', {'article_links': build_article_links(articles)}
+    
+    if not articles:
+        logger.info("No articles found, returning 'no information' message")
+        yield 'done', dict(NO_ARTICLES_RESULT)
+        return
+    
+    cache = get_answer_cache()
+    cache_key = answer_cache_key(question, articles)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("Answer cache hit")
+            yield 'token', {'text': cached['answer']}
+            yield 'done', cached
+            return
+    
+    system_message, prompt = build_answer_prompt(question, articles)
+    fragments = []
+    try:
+        async for fragment in stream_openai_api_async(
+            prompt=prompt,
+            system_message=system_message,
+            **ANSWER_COMPLETION_OPTIONS
+        ):
+            fragments.append(fragment)
+            yield 'token', {'text': fragment}
+    except StreamInterrupted as e:
+        logger.error(f"AI answer stream interrupted: {str(e)}")
+        yield 'error', {'detail': 'The answer was interrupted, please ask again'}
+        return
+    
+    answer = ''.join(fragments)
+    if not answer:
+        logger.warning("AI answer stream returned nothing, using fallback")
+        yield 'done', build_answer_result(build_fallback_answer(articles), articles)
+        return
+    
+    result = build_answer_result(normalize_rejection_answer(answer), articles)
+    if cache is not None:
+        cache.set(cache_key, result)
+    yield 'done', result
@@ -0,0 +1,460 @@
+"""Background export jobs: render CSV/PDF exports to disk off the request path.
+
+Job state is persisted as a JSON record next to the job's file, so any
+worker process sharing the export directory can report progress and serve
+the download, not just the one that runs the job.
+"""
+import os
+import re
+import json
+import time
+import uuid
+import asyncio
+import logging
+import tempfile
+import threading
+from dataclasses import dataclass, field, asdict, fields
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+from supabase import AsyncClient
+
+from app.services.export_service import EXPORT_COLUMNS, iter_csv, iter_knowledge_items, write_pdf
+from app.services.pdf_renderer import max_pdf_items
+
+logger = logging.getLogger(__name__)
+
+JOB_FORMATS = {
+    'csv': ('.csv', 'text/csv; charset=utf-8'),
+    'pdf': ('.pdf', 'application/pdf'),
+}
+RECORD_SUFFIX = '.json'
+JOB_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+# Minimum seconds between persisted progress updates of a running job
+PROGRESS_SAVE_INTERVAL = 1.0
+
+
+class ExportQueueFull(Exception):
+    """Raised when the export queue has no room for another job."""
+
+
+@dataclass
+class ExportJob:
+    """State of one export job, as reported by GET /export/jobs/{id}."""
+    id: str
+    format: str
+    filename: str
+    owner_id: Optional[str] = None
+    status: str = 'queued'  # queued, running, completed, failed
+    stage: str = 'queued'  # queued, fetching, rendering, done
+    total: Optional[int] = None
+    processed: int = 0
+    error: Optional[str] = None
+    path: Optional[str] = None
+    size: Optional[int] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    updated_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> 'ExportJob':
+        """Rebuild a job from its persisted record."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in record.items() if key in names})
+
+    def to_record(self) -> Dict[str, Any]:
+        """Full job state, as persisted next to the job's file."""
+        return asdict(self)
+
+    def expired(self, cutoff: float) -> bool:
+        """
+        Finished before `cutoff`, or unfinished with no update since then
+        (the worker process running it has gone away).
+        """
+        if self.finished:
+            return self.finished_at < cutoff
+        return self.updated_at < cutoff
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ('completed', 'failed')
+
+    @property
+    def media_type(self) -> str:
+        return JOB_FORMATS[self.format][1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Public job status (no filesystem paths)."""
+        progress = None
+        if self.status == 'completed':
+            progress = 1.0
+        elif self.total:
+            progress = round(min(self.processed / self.total, 1.0), 3)
+        return {
+            'id': self.id,
+            'format': self.format,
+            'filename': self.filename,
+            'status': self.status,
+            'stage': self.stage,
+            'total': self.total,
+            'processed': self.processed,
+            'progress': progress,
+            'size': self.size,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+
+
+class ExportJobManager:
+    """
+    Runs export jobs in the background with bounded concurrency.
+
+    At most `concurrency` jobs render at once per worker process, in a
+    dedicated thread pool so the event loop (AI and admin endpoints) stays
+    responsive; at most `max_queued` more wait their turn, beyond which
+    submit raises ExportQueueFull. Job records and files live in
+    `directory`, which all worker processes must share; finished jobs are
+    kept for `ttl` seconds and purged every `purge_interval` seconds once
+    start() has been called.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 2,
+        max_queued: int = 20,
+        directory: Optional[str] = None,
+        ttl: float = 3600,
+        purge_interval: float = 300
+    ):
+        """
+        Initialize export job manager.
+
+        Args:
+            concurrency: Jobs rendering at the same time
+            max_queued: Jobs allowed to wait beyond those running
+            directory: Where job records and files are written (created if missing)
+            ttl: Seconds a finished job and its file are kept
+            purge_interval: Seconds between purges of expired jobs
+        """
+        self.concurrency = concurrency
+        self.max_queued = max_queued
+        self.directory = directory or os.path.join(tempfile.gettempdir(), 'ignite-exports')
+        self.ttl = ttl
+        self.purge_interval = purge_interval
+        os.makedirs(self.directory, exist_ok=True)
+        self._jobs: Dict[str, ExportJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='export-job')
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._save_lock = threading.Lock()
+        self._purge_task: Optional[asyncio.Task] = None
+
+    def _active_count(self) -> int:
+        return sum(1 for job in self._jobs.values() if not job.finished)
+
+    def submit(
+        self,
+        format: str,
+        filename: str,
+        owner_id: Optional[str] = None,
+        items: Optional[List[Dict[str, Any]]] = None,
+        supabase: Optional[AsyncClient] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> ExportJob:
+        """
+        Queue an export job and return it immediately.
+
+        Either `items` are exported as given, or the knowledge items matching
+        `filters` (project, source, date_from, date_to, include_raw_text) are
+        fetched with `supabase` when the job starts.
+
+        Raises:
+            ExportQueueFull: If concurrency + max_queued jobs are unfinished
+        """
+        if format not in JOB_FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+        self.purge_expired()
+        if self._active_count() >= self.concurrency + self.max_queued:
+            raise ExportQueueFull(f"{self.concurrency + self.max_queued} export jobs already pending")
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.concurrency)
+
+        job = ExportJob(id=uuid.uuid4().hex, format=format, filename=filename, owner_id=owner_id)
+        if items is not None:
+            job.total = len(items)
+        self._jobs[job.id] = job
+        self._save(job)
+        task = asyncio.create_task(self._run(job, items, supabase, filters or {}))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+        return job
+
+    def get(self, job_id: str, owner_id: Optional[str] = None) -> Optional[ExportJob]:
+        """
+        Return the job, or None if unknown, expired or owned by someone else.
+
+        Jobs run by other worker processes are read from their records.
+        """
+        cutoff = time.time() - self.ttl
+        job = self._jobs.get(job_id)
+        if job is None:
+            job = self._load(job_id)
+            if job is None or job.expired(cutoff):
+                return None
+        elif job.finished and job.expired(cutoff):
+            return None
+        if owner_id is not None and job.owner_id != owner_id:
+            return None
+        return job
+
+    def start(self):
+        """Start purging expired jobs periodically (call from the running event loop)."""
+        if self._purge_task is None:
+            self._purge_task = asyncio.create_task(self._purge_periodically())
+
+    async def _purge_periodically(self):
+        while True:
+            await asyncio.sleep(self.purge_interval)
+            try:
+                self.purge_expired()
+            except Exception as e:
+                logger.warning(f"Export job purge failed: {e}")
+
+    def purge_expired(self):
+        """
+        Delete the records and files of expired jobs, including those of
+        other worker processes, and files left behind without a record.
+        """
+        cutoff = time.time() - self.ttl
+        for job_id, job in list(self._jobs.items()):
+            if job.finished and job.finished_at < cutoff:
+                del self._jobs[job_id]
+
+        try:
+            names = os.listdir(self.directory)
+        except OSError as e:
+            logger.warning(f"Could not list export directory {self.directory}: {e}")
+            return
+        files_by_job: Dict[str, List[str]] = {}
+        for name in names:
+            job_id = name.split('.', 1)[0]
+            if JOB_ID_PATTERN.fullmatch(job_id):
+                files_by_job.setdefault(job_id, []).append(name)
+
+        for job_id, job_files in files_by_job.items():
+            if job_id in self._jobs:
+                continue
+            if job_id + RECORD_SUFFIX in job_files:
+                job = self._load(job_id)
+                if job is not None and not job.expired(cutoff):
+                    continue
+            elif not all(self._modified_before(name, cutoff) for name in job_files):
+                continue  # record not written yet
+            for name in job_files:
+                self._remove_file(os.path.join(self.directory, name))
+            logger.info(f"Purged expired export job {job_id}")
+
+    def shutdown(self):
+        """Cancel pending jobs, stop purging and stop the worker threads."""
+        for task in list(self._tasks.values()):
+            task.cancel()
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            self._purge_task = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _record_path(self, job_id: str) -> str:
+        return os.path.join(self.directory, job_id + RECORD_SUFFIX)
+
+    def _save(self, job: ExportJob):
+        """Atomically persist the job's record for other worker processes."""
+        job.updated_at = time.time()
+        path = self._record_path(job.id)
+        tmp_path = f"{path}.tmp"
+        with self._save_lock:
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(job.to_record(), f)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not save export job {job.id}: {e}")
+
+    def _load(self, job_id: str) -> Optional[ExportJob]:
+        """Read a job's record, or None if the id is invalid or there is no readable record."""
+        if not JOB_ID_PATTERN.fullmatch(job_id):
+            return None
+        try:
+            with open(self._record_path(job_id), 'r', encoding='utf-8') as f:
+                return ExportJob.from_record(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Could not read export job {job_id}: {e}")
+            return None
+
+    def _set_progress(self, job: ExportJob, processed: int):
+        """Update a job's progress, persisting it at most every PROGRESS_SAVE_INTERVAL."""
+        job.processed = processed
+        if time.time() - job.updated_at >= PROGRESS_SAVE_INTERVAL:
+            self._save(job)
+
+    def _modified_before(self, name: str, cutoff: float) -> bool:
+        try:
+            return os.path.getmtime(os.path.join(self.directory, name)) < cutoff
+        except OSError:
+            return False
+
+    @staticmethod
+    def _remove_file(path: Optional[str]):
+        if path:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    async def _run(
+        self,
+        job: ExportJob,
+        items: Optional[List[Dict[str, Any]]],
+        supabase: Optional[AsyncClient],
+        filters: Dict[str, Any]
+    ):
+        """Wait for a slot, then fetch (if needed) and render the job's file."""
+        path = os.path.join(self.directory, job.id + JOB_FORMATS[job.format][0])
+        partial = path + '.part'
+        try:
+            async with self._slots:
+                job.status = 'running'
+                job.started_at = time.time()
+                self._save(job)
+                loop = asyncio.get_running_loop()
+
+                if job.format == 'csv' and items is None:
+                    await self._write_csv_query(job, partial, supabase, filters, loop)
+                else:
+                    if items is None:
+                        items = await self._fetch_items(job, supabase, filters)
+                        job.total = len(items)
+                    if job.format == 'pdf' and max_pdf_items():
+                        job.total = min(job.total, max_pdf_items())
+                    job.stage = 'rendering'
+                    job.processed = 0
+                    self._save(job)
+                    writer = self._write_csv_items if job.format == 'csv' else self._write_pdf_items
+                    await loop.run_in_executor(self._executor, writer, job, items, partial)
+
+            os.replace(partial, path)
+            job.path = path
+            job.size = os.path.getsize(path)
+            job.stage = 'done'
+            job.status = 'completed'
+            logger.info(f"Export job {job.id} completed: {job.processed} items, {job.size} bytes")
+        except asyncio.CancelledError:
+            self._remove_file(partial)
+            job.status = 'failed'
+            job.error = 'Cancelled'
+            raise
+        except Exception as e:
+            logger.error(f"Export job {job.id} failed: {e}")
+            self._remove_file(partial)
+            job.status = 'failed'
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            self._save(job)
+
+    @staticmethod
+    def _columns(filters: Dict[str, Any]) -> List[str]:
+        return EXPORT_COLUMNS + (['raw_text'] if filters.get('include_raw_text') else [])
+
+    @staticmethod
+    def _query_args(filters: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: filters.get(key) for key in ('project', 'source', 'date_from', 'date_to')}
+
+    async def _fetch_items(
+        self,
+        job: ExportJob,
+        supabase: AsyncClient,
+        filters: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect the matching items for a PDF (it needs them all for the
+        contents page), stopping one past EXPORT_PDF_MAX_ITEMS so the
+        renderer can tell the export was capped.
+        """
+        job.stage = 'fetching'
+        max_items = max_pdf_items()
+        items = []
+        async for page in iter_knowledge_items(supabase, self._columns(filters), **self._query_args(filters)):
+            items.extend(page)
+            self._set_progress(job, len(items))
+            if max_items and len(items) > max_items:
+                del items[max_items + 1:]
+                break
+        return items
+
+    async def _write_csv_query(
+        self,
+        job: ExportJob,
+        partial: str,
+        supabase: AsyncClient,
+        filters: Dict[str, Any],
+        loop: asyncio.AbstractEventLoop
+    ):
+        """Write matching items to CSV page by page; memory stays at one page."""
+        columns = self._columns(filters)
+        job.stage = 'rendering'
+        with open(partial, 'w', encoding='utf-8', newline='') as output:
+            header_sent = False
+            async for page in iter_knowledge_items(supabase, columns, **self._query_args(filters)):
+                chunks = iter_csv(page, columns)
+                if header_sent:
+                    next(chunks)  # header row
+                header_sent = True
+                await loop.run_in_executor(self._executor, output.write, "".join(chunks))
+                self._set_progress(job, job.processed + len(page))
+            if not header_sent:
+                output.write("".join(iter_csv([], columns)))
+
+    def _write_csv_items(self, job: ExportJob, items: List[Dict[str, Any]], partial: str):
+        headers = list(items[0].keys()) if items else []
+        with open(partial, 'w', encoding='utf-8', newline='') as output:
+            if not items:
+                return
+            chunks = iter_csv(items, headers)
+            output.write(next(chunks))  # header row
+            for rows, text in enumerate(chunks, 1):
+                output.write(text)
+                self._set_progress(job, rows)
+
+    def _write_pdf_items(self, job: ExportJob, items: List[Dict[str, Any]], partial: str):
+        def progress(done: int):
+            self._set_progress(job, done)
+
+        with open(partial, 'wb') as output:
+            write_pdf(items, output, progress=progress)
+
+
+_manager: Optional[ExportJobManager] = None
+
+
+def get_export_job_manager() -> ExportJobManager:
+    """
+    Process-wide job manager, configured from the environment.
+
+    EXPORT_JOB_CONCURRENCY (default 2), EXPORT_JOB_QUEUE_SIZE (default 20),
+    EXPORT_JOB_DIR (default <tmp>/ignite-exports), EXPORT_JOB_TTL seconds
+    (default 3600), EXPORT_JOB_PURGE_INTERVAL seconds (default 300).
+    """
+    global _manager
+    if _manager is None:
+        _manager = ExportJobManager(
+            concurrency=max(1, int(os.getenv('EXPORT_JOB_CONCURRENCY', '2'))),
+            max_queued=max(0, int(os.getenv('EXPORT_JOB_QUEUE_SIZE', '20'))),
+            directory=os.getenv('EXPORT_JOB_DIR') or None,
+            ttl=float(os.getenv('EXPORT_JOB_TTL', '3600')),
+            purge_interval=float(os.getenv('EXPORT_JOB_PURGE_INTERVAL', '300'))
+        )
+    return _manager
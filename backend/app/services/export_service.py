@@ -1,8 +1,52 @@
 """Service for exporting knowledge items to various formats."""
-from typing import List, Dict, Any
-from io import BytesIO
-from reportlab.lib.pagesizes import LETTER
-from reportlab.pdfgen import canvas
+import os
+import csv
+import tempfile
+from typing import List, Dict, Any, Iterable, Iterator, AsyncIterator, Optional, BinaryIO, Callable
+from io import BytesIO, StringIO
+from supabase import AsyncClient
+
+from app.services.pdf_renderer import render_pdf
+
+# Columns in server-side exports; raw_text is opt-in because Slack articles
+# are append-only logs that can be megabytes each
+EXPORT_COLUMNS = [
+    'id', 'summary', 'project', 'source', 'date', 'topics', 'decisions',
+    'key_points', 'action_items', 'faqs', 'sender_name', 'created_at', 'updated_at'
+]
+EXPORT_PAGE_SIZE = 1000
+# Separator for list values (topics, decisions, ...) inside one CSV cell
+LIST_SEPARATOR = '; '
+
+
+def _csv_value(value: Any) -> str:
+    """Render a cell value; lists are joined, None is empty."""
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return LIST_SEPARATOR.join(str(v) for v in value)
+    return str(value)
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]], headers: List[str]) -> Iterator[str]:
+    """
+    Yield CSV text one row at a time (header first), quoted by csv.writer so
+    commas, quotes and newlines in values survive intact.
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    
+    def flush() -> str:
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+    
+    writer.writerow(headers)
+    yield flush()
+    for row in rows:
+        writer.writerow([_csv_value(row.get(h)) for h in headers])
+        yield flush()
 
 
 def to_csv(rows: List[Dict[str, Any]]) -> str:
@@ -10,99 +54,130 @@ def to_csv(rows: List[Dict[str, Any]]) -> str:
     if not rows:
         return ""
     
-    headers = list(rows[0].keys())
-    out = [",".join([str(h) for h in headers])]
+    return "".join(iter_csv(rows, list(rows[0].keys())))
+
+
+async def iter_knowledge_items(
+    supabase: AsyncClient,
+    columns: List[str],
+    project: Optional[str] = None,
+    source: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    page_size: int = EXPORT_PAGE_SIZE
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yield pages of knowledge items matching the filters.
+    
+    Pages use keyset pagination on id, so each page costs the same however
+    deep the export goes, and only one page is held in memory.
     
-    for row in rows:
-        out.append(
-            ",".join([
-                str(row.get(h, "")).replace("\n", " ").replace(",", ";")
-                for h in headers
-            ])
-        )
+    Args:
+        supabase: Async Supabase client instance
+        columns: Columns to select (id is always included)
+        project: Exact project (channel / space) to match
+        source: Exact source to match ('slack', 'confluence', ...)
+        date_from: Earliest item date, YYYY-MM-DD (inclusive)
+        date_to: Latest item date, YYYY-MM-DD (inclusive)
+        page_size: Rows per request
+    """
+    select = ','.join(columns if 'id' in columns else ['id', *columns])
+    last_id = None
+    while True:
+        query = supabase.table('knowledge_items').select(select)
+        if project:
+            query = query.eq('project', project)
+        if source:
+            query = query.eq('source', source)
+        if date_from:
+            query = query.gte('date', date_from)
+        if date_to:
+            query = query.lte('date', date_to)
+        if last_id:
+            query = query.gt('id', last_id)
+        response = await query.order('id').limit(page_size).execute()
+        rows = response.data or []
+        if rows:
+            yield rows
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]['id']
+
+
+async def stream_items_csv(
+    supabase: AsyncClient,
+    project: Optional[str] = None,
+    source: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    include_raw_text: bool = False
+) -> AsyncIterator[str]:
+    """
+    Stream the filtered knowledge items as CSV, one page of rows per chunk.
     
-    return "\n".join(out)
+    Memory use is bounded by one page regardless of the number of rows.
+    """
+    columns = EXPORT_COLUMNS + (['raw_text'] if include_raw_text else [])
+    header_sent = False
+    async for page in iter_knowledge_items(supabase, columns, project, source, date_from, date_to):
+        chunks = iter_csv(page, columns)
+        if header_sent:
+            next(chunks)  # header row
+        header_sent = True
+        yield "".join(chunks)
+    if not header_sent:
+        yield "".join(iter_csv([], columns))
 
 
 def to_pdf(items: List[Dict[str, Any]]) -> bytes:
     """Convert list of dictionaries to PDF format."""
     buffer = BytesIO()
-    canvas_obj = canvas.Canvas(buffer, pagesize=LETTER)
-    width, height = LETTER
-    
-    def write_line(text: str, x: float, y: float, font_size: int = 11) -> float:
-        """Write a line of text and return new y position."""
-        canvas_obj.setFont("Helvetica", font_size)
-        canvas_obj.drawString(x, y, text)
-        return y
-    
-    y = height - 50
-    canvas_obj.setFont("Helvetica-Bold", 16)
-    canvas_obj.setFillColorRGB(0.115, 0.455, 0.961)  # #1D74F5
-    canvas_obj.drawString(50, y, "Knowledge Export")
-    canvas_obj.setFillColorRGB(0, 0, 0)
-    y -= 24
-    
-    for item in items:
-        if y < 100:
-            canvas_obj.showPage()
-            y = height - 50
-        
-        # Summary
-        canvas_obj.setFont("Helvetica-Bold", 12)
-        y = write_line(str(item.get("summary", "—")), 50, y)
-        y -= 14
-        
-        # Metadata
-        meta = (
-            f"Project: {item.get('project', '—')} | "
-            f"Source: {item.get('source', '—')} | "
-            f"Date: {item.get('date', '—')}"
-        )
-        canvas_obj.setFont("Helvetica", 10)
-        y = write_line(meta, 50, y)
-        y -= 10
-        
-        # Topics
-        topics = item.get("topics") or []
-        if topics:
-            y = write_line("Topics: " + ", ".join(map(str, topics)), 50, y)
-            y -= 12
-        
-        # Decisions
-        decisions = item.get("decisions") or []
-        if decisions:
-            y = write_line("Decisions:", 50, y)
-            y -= 12
-            for decision in decisions:
-                y = write_line(f"• {decision}", 60, y)
-                y -= 12
-        
-        # FAQs
-        faqs = item.get("faqs") or []
-        if faqs:
-            y = write_line("FAQs:", 50, y)
-            y -= 12
-            for faq in faqs:
-                y = write_line(f"• {faq}", 60, y)
-                y -= 12
-        
-        # Raw text
-        raw_text = item.get("raw_text")
-        if raw_text:
-            y = write_line("Original Content:", 50, y)
-            y -= 12
-            for line in str(raw_text).splitlines():
-                if y < 80:
-                    canvas_obj.showPage()
-                    y = height - 50
-                y = write_line(line[:110], 60, y)
-                y -= 12
-        
-        y -= 16
-    
-    canvas_obj.save()
+    write_pdf(items, buffer)
     pdf_data = buffer.getvalue()
     buffer.close()
     return pdf_data
 
+
+def to_pdf_file(items: List[Dict[str, Any]]) -> BinaryIO:
+    """
+    Render items to a PDF in a spooled temporary file, rewound for reading.
+    
+    The file stays in memory up to EXPORT_SPOOL_MAX_BYTES (default 8MB) and
+    then rolls over to disk; the caller must close it.
+    """
+    max_size = int(os.getenv('EXPORT_SPOOL_MAX_BYTES', str(8 * 1024 * 1024)))
+    pdf_file = tempfile.SpooledTemporaryFile(max_size=max_size, mode='w+b')
+    try:
+        write_pdf(items, pdf_file)
+    except Exception:
+        pdf_file.close()
+        raise
+    pdf_file.seek(0)
+    return pdf_file
+
+
+def iter_file(file_obj: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield a file's contents in chunks, closing it when done."""
+    try:
+        while True:
+            chunk = file_obj.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        file_obj.close()
+
+
+def write_pdf(
+    items: List[Dict[str, Any]],
+    output: BinaryIO,
+    progress: Optional[Callable[[int], None]] = None
+):
+    """
+    Render list of dictionaries as a PDF into a binary file object.
+    
+    Text is wrapped and paginated, larger exports start with a table of
+    contents and the largest are rendered in parallel (see pdf_renderer).
+    `progress` is called with the number of items rendered so far.
+    """
+    render_pdf(items, output, progress=progress)
@@ -0,0 +1,116 @@
+"""Service for the admin-managed Slack keyword vocabulary."""
+from typing import List, Dict, Any
+from supabase import Client
+import logging
+
+from app.utils.keyword_index import clean_keyword, MAX_KEYWORD_WORDS
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordService:
+    """
+    Manage the keyword_vocabulary table (supabase/add_keyword_vocabulary.sql).
+
+    The Slack extractors match these keywords alongside the README keywords.
+    """
+
+    def __init__(self, supabase_client: Client):
+        """
+        Initialize keyword service.
+
+        Args:
+            supabase_client: Supabase admin client
+        """
+        self.supabase = supabase_client
+
+    def list_keywords(self) -> List[Dict[str, Any]]:
+        """
+        List all vocabulary keywords, alphabetically.
+
+        Returns:
+            List of keyword rows
+        """
+        try:
+            response = (
+                self.supabase.table('keyword_vocabulary')
+                .select('id, keyword, active, created_by, created_at')
+                .order('keyword')
+                .execute()
+            )
+            return response.data or []
+        except Exception as e:
+            logger.error(f"Failed to list keywords: {e}")
+            raise
+
+    def add_keyword(self, keyword: str, created_by: str = None) -> Dict[str, Any]:
+        """
+        Add a keyword, normalized the way the extractors match it.
+
+        Args:
+            keyword: Keyword or phrase
+            created_by: ID of the admin adding it
+
+        Returns:
+            Created keyword row
+
+        Raises:
+            ValueError: If the keyword is empty, too long or already exists
+        """
+        cleaned = clean_keyword(keyword)
+        if not cleaned:
+            raise ValueError(
+                f"Keyword must be 2+ characters and at most {MAX_KEYWORD_WORDS} words"
+            )
+
+        try:
+            response = self.supabase.table('keyword_vocabulary').insert({
+                'keyword': cleaned,
+                'created_by': created_by,
+            }).execute()
+        except Exception as e:
+            if '23505' in str(e) or 'duplicate' in str(e).lower():
+                raise ValueError(f"Keyword '{cleaned}' already exists")
+            logger.error(f"Failed to add keyword: {e}")
+            raise
+
+        logger.info(f"Added keyword '{cleaned}'")
+        return response.data[0] if response.data else {'keyword': cleaned}
+
+    def set_keyword_active(self, keyword_id: str, active: bool) -> Dict[str, Any]:
+        """
+        Enable or disable a keyword without deleting it.
+
+        Args:
+            keyword_id: Keyword row ID
+            active: Whether the extractors should match it
+
+        Returns:
+            Updated keyword row
+
+        Raises:
+            ValueError: If the keyword does not exist
+        """
+        response = (
+            self.supabase.table('keyword_vocabulary')
+            .update({'active': active})
+            .eq('id', keyword_id)
+            .execute()
+        )
+        if not response.data:
+            raise ValueError("Keyword not found")
+        return response.data[0]
+
+    def delete_keyword(self, keyword_id: str) -> None:
+        """
+        Delete a keyword.
+
+        Args:
+            keyword_id: Keyword row ID
+        """
+        try:
+            self.supabase.table('keyword_vocabulary').delete().eq('id', keyword_id).execute()
+            logger.info(f"Deleted keyword {keyword_id}")
+        except Exception as e:
+            logger.error(f"Failed to delete keyword: {e}")
+            raise
@@ -0,0 +1,296 @@
+"""PDF rendering for knowledge item exports.
+
+Rendering is split into a layout pass (wrap text, break pages; pure
+computation) and a draw pass (emit the laid-out lines on a reportlab
+canvas), so the table of contents can be numbered before anything is drawn.
+"""
+import os
+import logging
+from typing import List, Dict, Any, Optional, Tuple, BinaryIO, Callable
+from reportlab.lib.pagesizes import LETTER
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+
+logger = logging.getLogger(__name__)
+
+PAGE_WIDTH, PAGE_HEIGHT = LETTER
+MARGIN_LEFT = 50
+MARGIN_RIGHT = 50
+MARGIN_TOP = 50
+MARGIN_BOTTOM = 60
+INDENT = 10
+BRAND_COLOR = (0.115, 0.455, 0.961)  # #1D74F5
+
+# (font, size, leading) per text style
+STYLES = {
+    'heading': ('Helvetica-Bold', 16, 24),
+    'title': ('Helvetica-Bold', 12, 15),
+    'meta': ('Helvetica', 10, 13),
+    'body': ('Helvetica', 10, 12),
+    'toc': ('Helvetica', 10, 13),
+}
+
+# Items between progress callbacks
+PROGRESS_EVERY = 50
+
+# Draw op: (style, x, y, text, right_aligned, color)
+DrawOp = Tuple[str, float, float, str, bool, Optional[Tuple[float, float, float]]]
+Page = List[DrawOp]
+
+
+def max_pdf_items() -> int:
+    """Item cap for PDF exports (EXPORT_PDF_MAX_ITEMS, default 10000; 0 = no cap)."""
+    return int(os.getenv('EXPORT_PDF_MAX_ITEMS', '10000'))
+
+
+def _wrap(text: str, style: str, width: float) -> List[str]:
+    """Wrap text to the given width, breaking words longer than a line."""
+    font, size, _ = STYLES[style]
+    lines = []
+    for paragraph in str(text).splitlines() or ['']:
+        for line in simpleSplit(paragraph, font, size, width) or ['']:
+            while stringWidth(line, font, size) > width and len(line) > 1:
+                # simpleSplit keeps unbreakable words whole; cut them to fit
+                cut = max(1, int(len(line) * width / stringWidth(line, font, size)))
+                while cut > 1 and stringWidth(line[:cut], font, size) > width:
+                    cut -= 1
+                lines.append(line[:cut])
+                line = line[cut:]
+            lines.append(line)
+    return lines
+
+
+def item_title(item: Dict[str, Any]) -> str:
+    """First non-empty line of the summary, without markdown heading marks."""
+    for line in str(item.get('summary') or '').splitlines():
+        line = line.strip().lstrip('#').strip()
+        if line and line.lower() != 'summary':
+            return line
+    return '—'
+
+
+class PageLayout:
+    """Flows styled, wrapped lines onto pages, breaking before any overflow."""
+
+    def __init__(self):
+        self.pages: List[Page] = []
+        self.y = 0.0
+        self.new_page()
+
+    def new_page(self):
+        self.pages.append([])
+        self.y = PAGE_HEIGHT - MARGIN_TOP
+
+    def ensure_space(self, height: float):
+        """Start a new page unless `height` points fit above the bottom margin."""
+        if self.y - height < MARGIN_BOTTOM and self.pages[-1]:
+            self.new_page()
+
+    def text(self, text: str, style: str = 'body', indent: float = 0, color=None):
+        """Add wrapped text, breaking pages line by line."""
+        leading = STYLES[style][2]
+        x = MARGIN_LEFT + indent
+        for line in _wrap(text, style, PAGE_WIDTH - MARGIN_RIGHT - x):
+            self.ensure_space(leading)
+            self.pages[-1].append((style, x, self.y, line, False, color))
+            self.y -= leading
+
+    def right_text(self, text: str, style: str, y: float):
+        """Add a right-aligned string at the given baseline (no wrapping)."""
+        self.pages[-1].append((style, PAGE_WIDTH - MARGIN_RIGHT, y, text, True, None))
+
+    def space(self, height: float):
+        self.y -= height
+
+
+def _layout_heading(layout: PageLayout, notice: str):
+    layout.text("Knowledge Export", 'heading', color=BRAND_COLOR)
+    if notice:
+        layout.text(notice, 'meta')
+    layout.space(6)
+
+
+def layout_items(
+    items: List[Dict[str, Any]],
+    max_content_lines: int,
+    heading: Optional[str] = None,
+    progress: Optional[Callable[[int], None]] = None
+) -> Tuple[List[Page], List[int]]:
+    """
+    Lay out items, each starting where the previous one ends.
+
+    Args:
+        items: Knowledge items
+        max_content_lines: Original-content lines kept per item (0 = no limit)
+        heading: If not None, start with the export heading and this notice
+        progress: Called with the number of items laid out so far
+
+    Returns:
+        Tuple of (pages, 0-based start page of each item)
+    """
+    layout = PageLayout()
+    if heading is not None:
+        _layout_heading(layout, heading)
+    item_pages = []
+
+    for index, item in enumerate(items):
+        if progress and index % PROGRESS_EVERY == 0:
+            progress(index)
+        # Keep the title with its metadata line
+        layout.ensure_space(STYLES['title'][2] + STYLES['meta'][2])
+        item_pages.append(len(layout.pages) - 1)
+
+        title = item_title(item)
+        layout.text(title, 'title')
+        layout.text(
+            f"Project: {item.get('project') or '—'} | "
+            f"Source: {item.get('source') or '—'} | "
+            f"Date: {item.get('date') or '—'}",
+            'meta'
+        )
+
+        # Rest of a multi-line (markdown) summary below the title
+        summary_lines = [line.strip().lstrip('#').strip() for line in str(item.get('summary') or '').splitlines()]
+        if title in summary_lines:
+            summary_lines.remove(title)
+        summary_body = "\n".join(line for line in summary_lines if line and line.lower() != 'summary')
+        if summary_body:
+            layout.text(summary_body)
+
+        topics = item.get('topics') or []
+        if topics:
+            layout.text("Topics: " + ", ".join(map(str, topics)))
+
+        for label, key in (('Decisions', 'decisions'), ('FAQs', 'faqs')):
+            values = item.get(key) or []
+            if values:
+                layout.text(f"{label}:")
+                for value in values:
+                    layout.text(f"• {value}", indent=INDENT)
+
+        raw_text = item.get('raw_text')
+        if raw_text:
+            layout.text("Original Content:")
+            lines = str(raw_text).splitlines()
+            if max_content_lines and len(lines) > max_content_lines:
+                lines = lines[:max_content_lines] + [f"… ({len(lines) - max_content_lines} more lines not shown)"]
+            layout.text("\n".join(lines), indent=INDENT)
+
+        layout.space(16)
+
+    return layout.pages, item_pages
+
+
+def layout_contents(
+    titles: List[str],
+    page_numbers: Optional[List[int]],
+    notice: str = ''
+) -> List[Page]:
+    """
+    Lay out the cover heading and table of contents, one line per item.
+
+    Titles are cut to a single line so the page count does not depend on
+    the page numbers, which are only known after the items are laid out.
+    """
+    layout = PageLayout()
+    _layout_heading(layout, notice)
+    layout.text("Contents", 'title')
+
+    font, size, leading = STYLES['toc']
+    width = PAGE_WIDTH - MARGIN_LEFT - MARGIN_RIGHT - 50  # leave room for the page number
+    for i, title in enumerate(titles):
+        line = title
+        if stringWidth(line, font, size) > width:
+            while line and stringWidth(line + '…', font, size) > width:
+                line = line[:-1]
+            line += '…'
+        layout.ensure_space(leading)
+        baseline = layout.y
+        layout.text(line, 'toc')
+        if page_numbers is not None:
+            layout.right_text(str(page_numbers[i]), 'toc', baseline)
+    return layout.pages
+
+
+def draw_pages(
+    canvas_obj: canvas.Canvas,
+    pages: List[Page],
+    bookmarks: Optional[Dict[int, List[str]]] = None
+):
+    """Draw laid-out pages, adding outline entries for the titles on each page index."""
+    for index, page in enumerate(pages):
+        for n, title in enumerate((bookmarks or {}).get(index, [])):
+            key = f"p{index}-{n}"
+            canvas_obj.bookmarkPage(key)
+            canvas_obj.addOutlineEntry(title, key, level=0)
+        current = None
+        for style, x, y, text, right_aligned, color in page:
+            if style != current:
+                font, size, _ = STYLES[style]
+                canvas_obj.setFont(font, size)
+                current = style
+            if color:
+                canvas_obj.setFillColorRGB(*color)
+            if right_aligned:
+                canvas_obj.drawRightString(x, y, text)
+            else:
+                canvas_obj.drawString(x, y, text)
+            if color:
+                canvas_obj.setFillColorRGB(0, 0, 0)
+        canvas_obj.showPage()
+
+
+def render_pdf(
+    items: List[Dict[str, Any]],
+    output: BinaryIO,
+    max_items: Optional[int] = None,
+    max_content_lines: Optional[int] = None,
+    toc: Optional[bool] = None,
+    progress: Optional[Callable[[int], None]] = None
+):
+    """
+    Render knowledge items as a PDF into a binary file object.
+
+    Args:
+        items: Knowledge items
+        output: Binary file object to write to
+        max_items: Render at most this many items (EXPORT_PDF_MAX_ITEMS, default 10000)
+        max_content_lines: Original-content lines per item
+            (EXPORT_PDF_MAX_CONTENT_LINES, default 200; 0 = no limit)
+        toc: Start with a table of contents (page numbers) and add bookmarks;
+            by default only for exports of EXPORT_PDF_TOC_MIN_ITEMS (default 20)
+            or more items
+        progress: Called with the number of items rendered so far
+    """
+    if max_items is None:
+        max_items = max_pdf_items()
+    if max_content_lines is None:
+        max_content_lines = int(os.getenv('EXPORT_PDF_MAX_CONTENT_LINES', '200'))
+    if toc is None:
+        toc = len(items) >= int(os.getenv('EXPORT_PDF_TOC_MIN_ITEMS', '20'))
+
+    notice = ''
+    if max_items and len(items) > max_items:
+        notice = f"Showing the first {max_items} matching items; the rest were left out."
+        items = items[:max_items]
+    titles = [item_title(item) for item in items]
+
+    # The contents length is fixed by the titles, so item page numbers can
+    # be offset before the numbers themselves are known
+    toc_page_count = len(layout_contents(titles, None, notice)) if toc else 0
+
+    pages, item_pages = layout_items(items, max_content_lines, None if toc else notice, progress)
+    bookmarks = None
+    if toc:
+        pages = layout_contents(titles, [toc_page_count + p + 1 for p in item_pages], notice) + pages
+        bookmarks = {}
+        for title, page in zip(titles, item_pages):
+            bookmarks.setdefault(toc_page_count + page, []).append(title)
+
+    canvas_obj = canvas.Canvas(output, pagesize=LETTER)
+    draw_pages(canvas_obj, pages, bookmarks)
+    canvas_obj.save()
+    if progress:
+        progress(len(items))
+
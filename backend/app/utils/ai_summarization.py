@@ -2,12 +2,234 @@
 import os
 import json
 import re
+import time
+import random
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Optional, List, AsyncIterator
 import httpx
 
 logger = logging.getLogger(__name__)
 
+OPENAI_DEFAULT_BASE_URL = 'https://api.openai.com/v1'
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Vector size stored in knowledge_items.embedding (halfvec(1536), see
+# supabase/add_embeddings.sql); the embeddings API shortens to this size
+EMBEDDING_DIMENSIONS = 1536
+# Roughly 8k tokens, the embedding model's input limit
+EMBEDDING_MAX_CHARS = 24000
+
+# Process-wide pooled clients, created lazily on first use
+_client_lock = threading.Lock()
+_sync_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+_sync_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_async_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+class StreamInterrupted(RuntimeError):
+    """Raised when a streamed completion fails after tokens were yielded."""
+
+
+def _client_options() -> Dict[str, Any]:
+    """Shared httpx client options, configurable via OPENAI_* env vars."""
+    max_connections = int(os.getenv('OPENAI_MAX_CONNECTIONS', '20'))
+    return {
+        'limits': httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=float(os.getenv('OPENAI_KEEPALIVE_EXPIRY', '60'))
+        ),
+        'timeout': httpx.Timeout(30.0, connect=float(os.getenv('OPENAI_CONNECT_TIMEOUT', '5'))),
+    }
+
+
+def get_openai_client() -> httpx.Client:
+    """Return the process-wide pooled OpenAI HTTP client."""
+    global _sync_client
+    with _client_lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(**_client_options())
+        return _sync_client
+
+
+def get_async_openai_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled async OpenAI HTTP client."""
+    global _async_client
+    with _client_lock:
+        if _async_client is None or _async_client.is_closed:
+            _async_client = httpx.AsyncClient(**_client_options())
+        return _async_client
+
+
+async def close_openai_clients():
+    """Close the pooled clients (call on application shutdown)."""
+    global _sync_client, _async_client
+    with _client_lock:
+        sync_client, _sync_client = _sync_client, None
+        async_client, _async_client = _async_client, None
+    if sync_client is not None:
+        sync_client.close()
+    if async_client is not None:
+        await async_client.aclose()
+
+
+def _model_concurrency() -> int:
+    return int(os.getenv('OPENAI_MAX_CONCURRENCY_PER_MODEL', '8'))
+
+
+def _get_sync_semaphore(model: str) -> threading.BoundedSemaphore:
+    with _client_lock:
+        if model not in _sync_semaphores:
+            _sync_semaphores[model] = threading.BoundedSemaphore(_model_concurrency())
+        return _sync_semaphores[model]
+
+
+def _get_async_semaphore(model: str) -> asyncio.Semaphore:
+    with _client_lock:
+        if model not in _async_semaphores:
+            _async_semaphores[model] = asyncio.Semaphore(_model_concurrency())
+        return _async_semaphores[model]
+
+
+def _chat_completions_url() -> str:
+    """Chat completions endpoint; OPENAI_BASE_URL allows a proxy or local stub."""
+    base_url = os.getenv('OPENAI_BASE_URL', OPENAI_DEFAULT_BASE_URL).rstrip('/')
+    return f"{base_url}/chat/completions"
+
+
+def _embeddings_url() -> str:
+    """Embeddings endpoint, honouring OPENAI_BASE_URL."""
+    base_url = os.getenv('OPENAI_BASE_URL', OPENAI_DEFAULT_BASE_URL).rstrip('/')
+    return f"{base_url}/embeddings"
+
+
+def _build_request(
+    prompt: str,
+    system_message: str,
+    model: str,
+    temperature: float,
+    max_tokens: int
+) -> Optional[Dict[str, Any]]:
+    """Build headers and payload for a chat completion, or None without an API key."""
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        logger.error("OPENAI_API_KEY not set, skipping AI summarization")
+        return None
+    
+    logger.debug(f"Calling OpenAI API with key: {api_key[:20]}...")
+    
+    return {
+        'headers': {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        },
+        'json': {
+            'model': model,
+            'messages': [
+                {'role': 'system', 'content': system_message},
+                {'role': 'user', 'content': prompt}
+            ],
+            'temperature': temperature,
+            'max_tokens': max_tokens
+        }
+    }
+
+
+def _retry_delay(response: Optional[httpx.Response], attempt: int) -> float:
+    """Backoff delay, honouring Retry-After when OpenAI sends it."""
+    if response is not None:
+        retry_after = response.headers.get('retry-after')
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    base = float(os.getenv('OPENAI_BACKOFF_FACTOR', '0.5'))
+    return base * (2 ** attempt) + random.uniform(0, base)
+
+
+def _parse_response(response: httpx.Response) -> Optional[str]:
+    """Extract message content from a chat completion response."""
+    if response.status_code != 200:
+        error_detail = response.text
+        logger.error(f"OpenAI API error: {response.status_code} - {error_detail}")
+        # Log more details for debugging
+        if response.status_code == 401:
+            logger.error("OpenAI API authentication failed - check your API key")
+        elif response.status_code == 429:
+            logger.error("OpenAI API rate limit exceeded")
+        return None
+    
+    result = response.json()
+    content = result.get('choices', [{}])[0].get('message', {}).get('content', '')
+    return content if content else None
+
+
+def _post_with_retries(
+    url: str,
+    request: Dict[str, Any],
+    model: str,
+    timeout: int
+) -> httpx.Response:
+    """
+    POST to OpenAI through the shared client, limiting in-flight requests per
+    model and retrying 429/5xx responses and transport errors with backoff.
+    
+    Returns:
+        The last response (possibly still an error status)
+        
+    Raises:
+        httpx.TransportError: If the final attempt fails to connect
+    """
+    max_retries = int(os.getenv('OPENAI_MAX_RETRIES', '3'))
+    client = get_openai_client()
+    
+    for attempt in range(max_retries + 1):
+        response = None
+        try:
+            with _get_sync_semaphore(model):
+                response = client.post(url, timeout=timeout, **request)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == max_retries:
+                return response
+        except httpx.TransportError as e:
+            if attempt == max_retries:
+                raise
+            logger.warning(f"OpenAI API transport error ({e}), retrying")
+        delay = _retry_delay(response, attempt)
+        logger.warning(f"OpenAI API retry {attempt + 1}/{max_retries} in {delay:.1f}s")
+        time.sleep(delay)
+    return response
+
+
+async def _post_with_retries_async(
+    url: str,
+    request: Dict[str, Any],
+    model: str,
+    timeout: int
+) -> httpx.Response:
+    """Async variant of _post_with_retries using the shared async client."""
+    max_retries = int(os.getenv('OPENAI_MAX_RETRIES', '3'))
+    client = get_async_openai_client()
+    
+    for attempt in range(max_retries + 1):
+        response = None
+        try:
+            async with _get_async_semaphore(model):
+                response = await client.post(url, timeout=timeout, **request)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == max_retries:
+                return response
+        except httpx.TransportError as e:
+            if attempt == max_retries:
+                raise
+            logger.warning(f"OpenAI API transport error ({e}), retrying")
+        delay = _retry_delay(response, attempt)
+        logger.warning(f"OpenAI API retry {attempt + 1}/{max_retries} in {delay:.1f}s")
+        await asyncio.sleep(delay)
+    return response
+
 
 def call_openai_api(
     prompt: str,
@@ -20,6 +242,9 @@ def call_openai_api(
     """
     Call OpenAI API with a prompt and return the response content.
     
+    Uses the shared pooled client, limits in-flight requests per model and
+    retries 429/5xx responses with backoff.
+    
     Args:
         prompt: User prompt text
         system_message: System message for context
@@ -31,49 +256,54 @@ def call_openai_api(
     Returns:
         Response content string or None if request fails
     """
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key:
-        logger.error("OPENAI_API_KEY not set, skipping AI summarization")
+    request = _build_request(prompt, system_message, model, temperature, max_tokens)
+    if request is None:
         return None
     
-    logger.debug(f"Calling OpenAI API with key: {api_key[:20]}...")
-    
     try:
-        headers = {
-            'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json'
-        }
+        response = _post_with_retries(_chat_completions_url(), request, model, timeout)
+        return _parse_response(response)
         
-        payload = {
-            'model': model,
-            'messages': [
-                {'role': 'system', 'content': system_message},
-                {'role': 'user', 'content': prompt}
-            ],
-            'temperature': temperature,
-            'max_tokens': max_tokens
-        }
+    except httpx.TimeoutException:
+        logger.error("OpenAI API request timed out")
+        return None
+    except httpx.RequestError as e:
+        logger.error(f"OpenAI API request error: {str(e)}")
+        return None
+    except Exception as e:
+        logger.error(f"Error calling OpenAI API: {str(e)}", exc_info=True)
+        return None
+
+
+async def call_openai_api_async(
+    prompt: str,
+    system_message: str,
+    model: str = 'gpt-4o-mini',
+    temperature: float = 0.3,
+    max_tokens: int = 1000,
+    timeout: int = 30
+) -> Optional[str]:
+    """
+    Async variant of call_openai_api using the shared async client.
+    
+    Args:
+        prompt: User prompt text
+        system_message: System message for context
+        model: OpenAI model to use
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens in response
+        timeout: Request timeout in seconds
         
-        with httpx.Client(timeout=timeout) as client:
-            response = client.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers=headers,
-                json=payload
-            )
-            
-            if response.status_code != 200:
-                error_detail = response.text
-                logger.error(f"OpenAI API error: {response.status_code} - {error_detail}")
-                # Log more details for debugging
-                if response.status_code == 401:
-                    logger.error("OpenAI API authentication failed - check your API key")
-                elif response.status_code == 429:
-                    logger.error("OpenAI API rate limit exceeded")
-                return None
-            
-            result = response.json()
-            content = result.get('choices', [{}])[0].get('message', {}).get('content', '')
-            return content if content else None
+    Returns:
+        Response content string or None if request fails
+    """
+    request = _build_request(prompt, system_message, model, temperature, max_tokens)
+    if request is None:
+        return None
+    
+    try:
+        response = await _post_with_retries_async(_chat_completions_url(), request, model, timeout)
+        return _parse_response(response)
         
     except httpx.TimeoutException:
         logger.error("OpenAI API request timed out")
@@ -86,6 +316,185 @@ def call_openai_api(
         return None
 
 
+async def stream_openai_api_async(
+    prompt: str,
+    system_message: str,
+    model: str = 'gpt-4o-mini',
+    temperature: float = 0.3,
+    max_tokens: int = 1000,
+    timeout: int = 30
+) -> AsyncIterator[str]:
+    """
+    Stream a chat completion, yielding content deltas as OpenAI produces them.
+    
+    429/5xx responses are retried with backoff before the first token.
+    Yields nothing if the request fails outright; once tokens have been
+    yielded, a failure (or the stream ending without [DONE]) raises
+    StreamInterrupted so the partial text is not mistaken for an answer.
+    
+    Args:
+        prompt: User prompt text
+        system_message: System message for context
+        model: OpenAI model to use
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens in response
+        timeout: Request timeout in seconds
+        
+    Yields:
+        Content fragments of the response
+        
+    Raises:
+        StreamInterrupted: If the stream breaks off after the first fragment
+    """
+    request = _build_request(prompt, system_message, model, temperature, max_tokens)
+    if request is None:
+        return
+    request['json']['stream'] = True
+    
+    max_retries = int(os.getenv('OPENAI_MAX_RETRIES', '3'))
+    client = get_async_openai_client()
+    streamed = False
+    
+    try:
+        for attempt in range(max_retries + 1):
+            async with _get_async_semaphore(model):
+                async with client.stream('POST', _chat_completions_url(), timeout=timeout, **request) as response:
+                    if response.status_code in RETRY_STATUS_CODES and attempt < max_retries:
+                        delay = _retry_delay(response, attempt)
+                    elif response.status_code != 200:
+                        await response.aread()
+                        _parse_response(response)  # logs the error
+                        return
+                    else:
+                        async for line in response.aiter_lines():
+                            if not line.startswith('data:'):
+                                continue
+                            data = line[5:].strip()
+                            if data == '[DONE]':
+                                return
+                            chunk = json.loads(data)
+                            delta = (chunk.get('choices') or [{}])[0].get('delta', {}).get('content')
+                            if delta:
+                                streamed = True
+                                yield delta
+                        if streamed:
+                            raise StreamInterrupted("OpenAI stream ended before [DONE]")
+                        return
+            logger.warning(f"OpenAI API retry {attempt + 1}/{max_retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    except StreamInterrupted:
+        logger.error("OpenAI API stream ended before completion")
+        raise
+    except httpx.TimeoutException as e:
+        logger.error("OpenAI API streaming request timed out")
+        if streamed:
+            raise StreamInterrupted("OpenAI stream timed out") from e
+    except httpx.RequestError as e:
+        logger.error(f"OpenAI API streaming request error: {str(e)}")
+        if streamed:
+            raise StreamInterrupted(f"OpenAI stream failed: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Error streaming from OpenAI API: {str(e)}", exc_info=True)
+        if streamed:
+            raise StreamInterrupted(f"OpenAI stream failed: {str(e)}") from e
+
+
+def get_embedding_model() -> str:
+    """Embedding model (OPENAI_EMBEDDING_MODEL); must produce EMBEDDING_DIMENSIONS values."""
+    return os.getenv('OPENAI_EMBEDDING_MODEL', 'text-embedding-3-small')
+
+
+def _build_embedding_request(text: str) -> Optional[Dict[str, Any]]:
+    """Build headers and payload for an embedding, or None without text or an API key."""
+    text = (text or '').strip()
+    if not text:
+        return None
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        logger.error("OPENAI_API_KEY not set, skipping embedding")
+        return None
+    
+    return {
+        'headers': {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        },
+        'json': {
+            'model': get_embedding_model(),
+            'input': text[:EMBEDDING_MAX_CHARS],
+            'dimensions': EMBEDDING_DIMENSIONS
+        }
+    }
+
+
+def _parse_embedding_response(response: httpx.Response) -> Optional[List[float]]:
+    """Extract the vector from an embeddings response."""
+    if response.status_code != 200:
+        logger.error(f"OpenAI embeddings error: {response.status_code} - {response.text}")
+        return None
+    data = response.json().get('data') or [{}]
+    embedding = data[0].get('embedding')
+    return embedding if embedding else None
+
+
+def create_embedding(text: str, timeout: int = 30) -> Optional[List[float]]:
+    """
+    Embed text for semantic search via the shared pooled client.
+    
+    Args:
+        text: Text to embed (truncated to EMBEDDING_MAX_CHARS)
+        timeout: Request timeout in seconds
+        
+    Returns:
+        Embedding vector or None if the request fails
+    """
+    request = _build_embedding_request(text)
+    if request is None:
+        return None
+    
+    try:
+        response = _post_with_retries(_embeddings_url(), request, get_embedding_model(), timeout)
+        return _parse_embedding_response(response)
+    except Exception as e:
+        logger.error(f"Error creating embedding: {str(e)}")
+        return None
+
+
+async def create_embedding_async(text: str, timeout: int = 30) -> Optional[List[float]]:
+    """Async variant of create_embedding."""
+    request = _build_embedding_request(text)
+    if request is None:
+        return None
+    
+    try:
+        response = await _post_with_retries_async(_embeddings_url(), request, get_embedding_model(), timeout)
+        return _parse_embedding_response(response)
+    except Exception as e:
+        logger.error(f"Error creating embedding: {str(e)}")
+        return None
+
+
+def format_article_for_embedding(
+    summary: str,
+    topics: Optional[List[str]] = None,
+    key_points: Optional[List[str]] = None,
+    content: str = ''
+) -> str:
+    """
+    Build the text embedded for an article: title, topics, key points, then
+    the start of the content, so short questions match the article's subject.
+    """
+    parts = [summary or '']
+    if topics:
+        parts.append(f"Topics: {', '.join(str(t) for t in topics)}")
+    if key_points:
+        parts.extend(str(point) for point in key_points)
+    if content:
+        parts.append(content)
+    return "\n".join(part for part in parts if part)[:EMBEDDING_MAX_CHARS]
+
+
 def parse_json_response(content: str) -> Optional[Dict[str, Any]]:
     """Parse JSON response from OpenAI, handling markdown code blocks."""
     try:
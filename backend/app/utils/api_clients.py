@@ -1,17 +1,118 @@
 """API client utilities for external services."""
 import os
+import time
 import base64
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, Tuple, Iterator
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# POST is left out because inserts are not idempotent; connection errors are
+# still retried for every method since the request never reached the server
+RETRY_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'PATCH', 'DELETE'])
+
+
+def build_session(
+    pool_size: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None
+) -> requests.Session:
+    """
+    Create a keep-alive HTTP session with connection pooling and retries.
+    
+    Retries use exponential backoff and honour the Retry-After header that
+    Slack and Confluence send with 429 responses.
+    
+    Args:
+        pool_size: Connections kept alive per host (HTTP_POOL_SIZE, default 10)
+        max_retries: Retry attempts per request (HTTP_MAX_RETRIES, default 3)
+        backoff_factor: Backoff base in seconds (HTTP_BACKOFF_FACTOR, default 0.5)
+        
+    Returns:
+        Configured requests session
+    """
+    pool_size = pool_size or int(os.getenv('HTTP_POOL_SIZE', '10'))
+    if max_retries is None:
+        max_retries = int(os.getenv('HTTP_MAX_RETRIES', '3'))
+    if backoff_factor is None:
+        backoff_factor = float(os.getenv('HTTP_BACKOFF_FACTOR', '0.5'))
+    
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Requests per minute for Slack methods by rate-limit tier
+# (https://api.slack.com/docs/rate-limits); other methods are not paced
+SLACK_METHOD_RATE_LIMITS = {
+    'conversations.list': 20,     # Tier 2
+    'conversations.history': 50,  # Tier 3
+    'conversations.replies': 50,  # Tier 3
+    'users.info': 100,            # Tier 4
+}
+
+
+class RateLimiter:
+    """
+    Token bucket: allows bursts of up to `per_minute` calls, then paces
+    calls evenly so the long-run rate stays under the limit.
+    """
+    
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.tokens = per_minute
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a call is allowed."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0.0
+            self.tokens -= 1
+        if wait > 0:
+            time.sleep(wait)
+
+
+def get_default_timeout() -> Tuple[float, float]:
+    """Return (connect, read) timeout in seconds from HTTP_CONNECT_TIMEOUT/HTTP_READ_TIMEOUT."""
+    return (
+        float(os.getenv('HTTP_CONNECT_TIMEOUT', '5')),
+        float(os.getenv('HTTP_READ_TIMEOUT', '30'))
+    )
+
 
 class ConfluenceAPIClient:
     """Client for Confluence REST API."""
     
-    def __init__(self, url: str, email: str, api_token: str):
+    def __init__(
+        self,
+        url: str,
+        email: str,
+        api_token: str,
+        session: Optional[requests.Session] = None,
+        timeout: Optional[Tuple[float, float]] = None
+    ):
         """
         Initialize Confluence API client.
         
@@ -19,10 +120,14 @@ class ConfluenceAPIClient:
             url: Confluence base URL
             email: Confluence account email
             api_token: Confluence API token
+            session: HTTP session to use (defaults to a pooled, retrying session)
+            timeout: (connect, read) timeout in seconds
         """
         self.base_url = url.rstrip('/')
         self.email = email
         self.api_token = api_token
+        self.session = session or build_session()
+        self.timeout = timeout or get_default_timeout()
         self._setup_headers()
     
     def _setup_headers(self):
@@ -52,7 +157,12 @@ class ConfluenceAPIClient:
         """
         url = f"{self.base_url}/wiki/rest/api/{endpoint}"
         try:
-            response = requests.get(url, headers=self.headers, params=params or {})
+            response = self.session.get(
+                url,
+                headers=self.headers,
+                params=params or {},
+                timeout=self.timeout
+            )
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -65,15 +175,31 @@ class ConfluenceAPIClient:
 class SlackAPIClient:
     """Client for Slack Web API."""
     
-    def __init__(self, bot_token: str):
+    def __init__(
+        self,
+        bot_token: str,
+        session: Optional[requests.Session] = None,
+        timeout: Optional[Tuple[float, float]] = None
+    ):
         """
         Initialize Slack API client.
         
         Args:
             bot_token: Slack bot token
+            session: HTTP session to use (defaults to a pooled, retrying session)
+            timeout: (connect, read) timeout in seconds
         """
         self.bot_token = bot_token
+        self.session = session or build_session()
+        self.timeout = timeout or get_default_timeout()
         self._setup_headers()
+        # SLACK_RATE_LIMIT_FACTOR scales the tier limits (e.g. 0.5 when
+        # several extractors share one token)
+        factor = float(os.getenv('SLACK_RATE_LIMIT_FACTOR', '1'))
+        self._rate_limiters = {
+            method: RateLimiter(per_minute * factor)
+            for method, per_minute in SLACK_METHOD_RATE_LIMITS.items()
+        } if factor > 0 else {}
     
     def _setup_headers(self):
         """Setup HTTP headers for Slack API."""
@@ -96,27 +222,90 @@ class SlackAPIClient:
         Raises:
             RuntimeError: If API returns error
         """
+        limiter = self._rate_limiters.get(endpoint)
+        if limiter:
+            limiter.acquire()
         url = f"https://slack.com/api/{endpoint}"
-        response = requests.get(url, headers=self.headers, params=params or {})
+        response = self.session.get(
+            url,
+            headers=self.headers,
+            params=params or {},
+            timeout=self.timeout
+        )
         data = response.json()
         if not data.get('ok'):
             raise RuntimeError(f"Slack API error: {data.get('error')}")
         return data
+    
+    def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        limit: int = 200
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every page of a cursor-paginated Slack method.
+        
+        Pages are requested lazily (the next one only when the caller moves
+        on), following response_metadata.next_cursor, and paced per method
+        by the client's rate limiter.
+        
+        Args:
+            endpoint: API endpoint (e.g., 'conversations.history')
+            params: Query parameters (without cursor)
+            limit: Items per page
+            
+        Yields:
+            JSON response data of each page
+        """
+        params = {**(params or {}), 'limit': limit}
+        while True:
+            data = self.call_api(endpoint, params)
+            yield data
+            cursor = (data.get('response_metadata') or {}).get('next_cursor')
+            if not cursor:
+                return
+            params['cursor'] = cursor
+    
+    def iter_items(
+        self,
+        endpoint: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None,
+        limit: int = 200
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the items under `key` (e.g. 'messages', 'channels') across all pages.
+        
+        Only one page is held in memory at a time.
+        """
+        for page in self.paginate(endpoint, params, limit):
+            yield from page.get(key, [])
 
 
 class SupabaseAPIClient:
     """Client for Supabase REST API."""
     
-    def __init__(self, url: str, anon_key: str):
+    def __init__(
+        self,
+        url: str,
+        anon_key: str,
+        session: Optional[requests.Session] = None,
+        timeout: Optional[Tuple[float, float]] = None
+    ):
         """
         Initialize Supabase API client.
         
         Args:
             url: Supabase project URL
             anon_key: Supabase anonymous key
+            session: HTTP session to use (defaults to a pooled, retrying session)
+            timeout: (connect, read) timeout in seconds
         """
         self.base_url = url.rstrip('/')
         self.anon_key = anon_key
+        self.session = session or build_session()
+        self.timeout = timeout or get_default_timeout()
         self._setup_headers()
     
     def _setup_headers(self):
@@ -130,25 +319,63 @@ class SupabaseAPIClient:
     def get(self, table: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
         """Make GET request to Supabase table."""
         url = f"{self.base_url}/rest/v1/{table}"
-        return requests.get(url, headers=self.headers, params=params or {})
+        return self.session.get(url, headers=self.headers, params=params or {}, timeout=self.timeout)
+    
+    def post(
+        self,
+        table: str,
+        data: Dict[str, Any],
+        return_representation: bool = False
+    ) -> requests.Response:
+        """
+        Make POST request to Supabase table.
+        
+        Args:
+            table: Table name
+            data: Row data
+            return_representation: Ask PostgREST to return the inserted row(s)
+        """
+        url = f"{self.base_url}/rest/v1/{table}"
+        headers = self.headers
+        if return_representation:
+            headers = {**self.headers, "Prefer": "return=representation"}
+        return self.session.post(url, headers=headers, json=data, timeout=self.timeout)
     
-    def post(self, table: str, data: Dict[str, Any]) -> requests.Response:
-        """Make POST request to Supabase table."""
+    def upsert(self, table: str, data: Dict[str, Any], on_conflict: str) -> requests.Response:
+        """
+        Insert a row, or update the existing row that conflicts on the given columns.
+        
+        Args:
+            table: Table name
+            data: Row data; on conflict only these columns are updated
+            on_conflict: Comma-separated columns of a unique index
+        """
         url = f"{self.base_url}/rest/v1/{table}"
-        return requests.post(url, headers=self.headers, json=data)
+        headers = {
+            **self.headers,
+            "Prefer": "resolution=merge-duplicates,return=representation"
+        }
+        return self.session.post(
+            url,
+            headers=headers,
+            params={'on_conflict': on_conflict},
+            json=data,
+            timeout=self.timeout
+        )
     
     def patch(self, table: str, item_id: str, data: Dict[str, Any]) -> requests.Response:
         """Make PATCH request to Supabase table."""
         url = f"{self.base_url}/rest/v1/{table}"
         headers = {**self.headers, "Prefer": "return=representation"}
-        return requests.patch(
+        return self.session.patch(
             f"{url}?id=eq.{item_id}",
             headers=headers,
-            json=data
+            json=data,
+            timeout=self.timeout
         )
     
     def delete(self, table: str, item_id: str) -> requests.Response:
         """Make DELETE request to Supabase table."""
         url = f"{self.base_url}/rest/v1/{table}"
-        return requests.delete(f"{url}?id=eq.{item_id}", headers=self.headers)
+        return self.session.delete(f"{url}?id=eq.{item_id}", headers=self.headers, timeout=self.timeout)
 
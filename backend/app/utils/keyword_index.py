@@ -0,0 +1,400 @@
+"""Shared keyword index for matching Slack messages against the keyword vocabulary."""
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+from typing import List, Dict, Any, Optional, Tuple, Set, Iterable
+
+from app.utils.text_processing import normalize_text
+
+logger = logging.getLogger(__name__)
+
+# Known terms often used in this repo, always part of the vocabulary
+SEEDED_KEYWORDS = [
+    'ui issues', 'dashboard', 'mia chatbot', 'recommendations', 'order history',
+    'pending approvals', 'catalog', 'cart', 'authentication', 'rest api',
+    'dental city webhook', 'mia chat api'
+]
+# Longer bullets/topics are sentences, not keywords
+MAX_KEYWORD_WORDS = 4
+INDEX_FORMAT_VERSION = 2
+TOPIC_PAGE_SIZE = 1000
+
+# Trie-node key holding the index of the keyword that ends at that node;
+# never a token itself
+_KEYWORD_END = ''
+# Tokens: word runs, single whitespace characters, single punctuation marks
+_TOKEN_PATTERN = re.compile(r"\w+|\s|[^\w\s]")
+
+
+class KeywordSourceError(RuntimeError):
+    """Raised when keywords cannot be fetched from the database."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def clean_keyword(text: str) -> Optional[str]:
+    """Normalize a candidate keyword; None if empty, too short or too long."""
+    cleaned = re.sub(r"[\s,:;.!?]+$", "", normalize_text(str(text)))
+    if len(cleaned) < 2 or len(cleaned.split()) > MAX_KEYWORD_WORDS:
+        return None
+    return cleaned
+
+
+def extract_readme_keywords(text: str) -> Set[str]:
+    """Keywords from README bullet points and inline code spans."""
+    bullet_items = re.findall(r"(?m)^\s*[-*]\s*(.+)$", text)
+    code_items = re.findall(r"`([^`]+)`", text)
+    keywords = set()
+    for item in bullet_items + code_items:
+        cleaned = clean_keyword(item)
+        if cleaned:
+            keywords.add(cleaned)
+    return keywords
+
+
+def _fetch_keywords(
+    supabase: Any,
+    table: str,
+    column: str,
+    filters: Dict[str, str],
+    page_size: int
+) -> Set[str]:
+    """Cleaned keywords from a text or text[] column (keyset pagination on id)."""
+    keywords = set()
+    last_id = None
+    while True:
+        params = {'select': f'id,{column}', **filters, 'order': 'id.asc', 'limit': page_size}
+        if last_id:
+            params['id'] = f'gt.{last_id}'
+        response = supabase.get(table, params)
+        if response.status_code != 200:
+            raise KeywordSourceError(
+                f"Failed to fetch {table}.{column}: {response.status_code} {response.text}",
+                response.status_code
+            )
+        rows = response.json()
+        for row in rows:
+            values = row.get(column) or []
+            for value in [values] if isinstance(values, str) else values:
+                cleaned = clean_keyword(value)
+                if cleaned:
+                    keywords.add(cleaned)
+        if len(rows) < page_size:
+            return keywords
+        last_id = rows[-1]['id']
+
+
+def fetch_topic_keywords(supabase: Any, page_size: int = TOPIC_PAGE_SIZE) -> Set[str]:
+    """
+    Distinct topics of existing knowledge items, cleaned like README keywords.
+
+    Args:
+        supabase: Client with get(table, params) -> requests.Response
+            (SupabaseAPIClient)
+        page_size: Rows per request
+
+    Raises:
+        KeywordSourceError: If a page cannot be fetched
+    """
+    return _fetch_keywords(supabase, 'knowledge_items', 'topics', {'topics': 'not.is.null'}, page_size)
+
+
+def fetch_vocabulary_keywords(supabase: Any, page_size: int = TOPIC_PAGE_SIZE) -> Set[str]:
+    """
+    Active keywords from the admin-managed keyword_vocabulary table.
+
+    The table is optional (supabase/add_keyword_vocabulary.sql); if it does
+    not exist the vocabulary is empty.
+
+    Raises:
+        KeywordSourceError: If a page cannot be fetched
+    """
+    try:
+        return _fetch_keywords(supabase, 'keyword_vocabulary', 'keyword', {'active': 'is.true'}, page_size)
+    except KeywordSourceError as e:
+        # PostgREST answers 404 for an unknown table
+        if e.status_code == 404:
+            logger.info("keyword_vocabulary table not found; run supabase/add_keyword_vocabulary.sql to enable it")
+            return set()
+        raise
+
+
+class KeywordIndex:
+    """
+    Compiled keyword vocabulary.
+
+    Keywords are normalized once into a trie keyed by token, so a text is
+    matched in a single pass over its tokens (each step bounded by the
+    longest keyword) instead of one scan per keyword. Keywords only match
+    whole words: "api" matches "rest api" but not "apis" or "rapid".
+    Keywords that normalize to the same text are kept once (first wins).
+    """
+
+    def __init__(self, keywords: Iterable[str] = ()):
+        """
+        Build the index.
+
+        Args:
+            keywords: Keywords/phrases; matches are reported in this form
+        """
+        self.keywords: List[str] = []
+        self._root: Dict[str, Any] = {}
+        for keyword in keywords:
+            tokens = _TOKEN_PATTERN.findall(normalize_text(keyword))
+            if not tokens:
+                continue
+            node = self._root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            if _KEYWORD_END not in node:
+                node[_KEYWORD_END] = len(self.keywords)
+                self.keywords.append(keyword)
+        self._set_priority()
+
+    def _set_priority(self):
+        # Longest phrase first (word count, then characters); ties keep list order
+        self._priority = [(-len(k.split()), -len(k), i) for i, k in enumerate(self.keywords)]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _match_indices(self, text: str) -> Set[int]:
+        tokens = _TOKEN_PATTERN.findall(normalize_text(text))
+        root = self._root
+        token_count = len(tokens)
+        found: Set[int] = set()
+        for start in range(token_count):
+            node = root.get(tokens[start])
+            position = start + 1
+            while node is not None:
+                end = node.get(_KEYWORD_END)
+                if end is not None:
+                    found.add(end)
+                if position == token_count:
+                    break
+                node = node.get(tokens[position])
+                position += 1
+        return found
+
+    def match_all(self, text: str) -> List[str]:
+        """All keywords occurring in text, most specific (longest) first."""
+        return [self.keywords[i] for i in sorted(self._match_indices(text), key=self._priority.__getitem__)]
+
+    def best_match(self, text: str) -> Optional[str]:
+        """The most specific keyword occurring in text, or None."""
+        found = self._match_indices(text)
+        if not found:
+            return None
+        return self.keywords[min(found, key=self._priority.__getitem__)]
+
+    def match(self, text: str) -> Optional[Tuple[str, List[str]]]:
+        """Tuple of (best_match, match_all), or None if nothing matches."""
+        matches = self.match_all(text)
+        return (matches[0], matches) if matches else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form (keywords and compiled trie)."""
+        return {'keywords': self.keywords, 'trie': self._root}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'KeywordIndex':
+        """Restore an index serialized with to_dict, without rebuilding it."""
+        index = cls()
+        index.keywords = list(data['keywords'])
+        index._root = data['trie']
+        index._set_priority()
+        return index
+
+
+def _fingerprint(path: str) -> Optional[List[float]]:
+    """[mtime, size] of a file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime, stat.st_size]
+
+
+def _read_bytes(path: str) -> bytes:
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError as e:
+        logger.warning(f"Could not read {path}: {e}")
+        return b''
+
+
+def _readme_vocabulary(
+    readme_paths: List[str],
+    cached: Optional[Dict[str, Any]]
+) -> Tuple[List[str], Dict[str, Any], bool]:
+    """
+    README keywords, reusing the cached vocabulary while the files are unchanged.
+
+    Unchanged files are recognized by [mtime, size] without reading them;
+    files whose stat changed are hashed, and only a content change (not a
+    touch or checkout) re-extracts the keywords.
+
+    Returns:
+        Tuple of (keywords, cache section, whether the section changed)
+    """
+    cached = cached or {}
+    cached_files = cached.get('files', {})
+    keys = [os.path.abspath(path) for path in readme_paths]
+    fingerprints = {key: _fingerprint(path) for key, path in zip(keys, readme_paths)}
+
+    if 'keywords' in cached and set(cached_files) == set(keys) and all(
+        cached_files[key]['fingerprint'] == fingerprints[key] for key in keys
+    ):
+        return cached['keywords'], cached, False
+
+    texts = {key: _read_bytes(path) for key, path in zip(keys, readme_paths)}
+    files = {
+        key: {'fingerprint': fingerprints[key], 'sha256': hashlib.sha256(texts[key]).hexdigest()}
+        for key in keys
+    }
+    if 'keywords' in cached and set(cached_files) == set(keys) and all(
+        cached_files[key]['sha256'] == files[key]['sha256'] for key in keys
+    ):
+        return cached['keywords'], {'files': files, 'keywords': cached['keywords']}, True
+
+    keywords = set()
+    for text in texts.values():
+        keywords |= extract_readme_keywords(text.decode('utf-8', errors='replace'))
+    keywords = sorted(keywords)
+    logger.info(f"Extracted {len(keywords)} keywords/phrases from README files")
+    return keywords, {'files': files, 'keywords': keywords}, True
+
+
+def _read_cache(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not read keyword index cache {path}: {e}")
+        return {}
+    return cached if cached.get('version') == INDEX_FORMAT_VERSION else {}
+
+
+def _write_cache(path: str, data: Dict[str, Any]):
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({**data, 'version': INDEX_FORMAT_VERSION}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write keyword index cache {path}: {e}")
+
+
+def _seeded(seeded_keywords: Optional[List[str]]) -> List[str]:
+    normalized = (normalize_text(k) for k in (SEEDED_KEYWORDS if seeded_keywords is None else seeded_keywords))
+    return sorted({k for k in normalized if k})
+
+
+def load_readme_keywords(
+    readme_paths: List[str],
+    cache_path: Optional[str] = None,
+    seeded_keywords: Optional[List[str]] = None
+) -> List[str]:
+    """
+    README and seeded keywords, cached by the READMEs' content hash.
+
+    Args:
+        readme_paths: README files to read keywords from
+        cache_path: Cache file (default KEYWORD_INDEX_CACHE, else no cache)
+        seeded_keywords: Always-included keywords (default SEEDED_KEYWORDS)
+
+    Returns:
+        Sorted, normalized keywords
+    """
+    if cache_path is None:
+        cache_path = os.getenv('KEYWORD_INDEX_CACHE')
+    cached = _read_cache(cache_path) if cache_path else {}
+    readme_keywords, section, changed = _readme_vocabulary(readme_paths, cached.get('readmes'))
+    if cache_path and changed:
+        _write_cache(cache_path, {**cached, 'readmes': section})
+    return sorted(set(readme_keywords) | set(_seeded(seeded_keywords)))
+
+
+def load_keyword_index(
+    readme_paths: List[str],
+    supabase: Any = None,
+    cache_path: Optional[str] = None,
+    seeded_keywords: Optional[List[str]] = None,
+    topics_ttl: Optional[float] = None
+) -> KeywordIndex:
+    """
+    Load the keyword index, rebuilding it only when its sources changed.
+
+    The index covers keywords from the README files, the seeded keywords
+    and (with a Supabase client) the topics of existing knowledge items and
+    the admin-managed keyword_vocabulary table. Everything is cached in one
+    JSON file: the README vocabulary is reused while the READMEs' content
+    hash is unchanged, DB keywords are refetched once older than
+    topics_ttl, and the compiled index is reused while its keywords are
+    the same.
+
+    Args:
+        readme_paths: README files to read keywords from
+        supabase: Optional client for DB keywords (SupabaseAPIClient)
+        cache_path: Cache file (default KEYWORD_INDEX_CACHE, else no cache)
+        seeded_keywords: Always-included keywords (default SEEDED_KEYWORDS)
+        topics_ttl: Seconds before DB keywords are refetched
+            (KEYWORD_INDEX_TOPICS_TTL, default 3600)
+
+    Returns:
+        KeywordIndex
+    """
+    if cache_path is None:
+        cache_path = os.getenv('KEYWORD_INDEX_CACHE')
+    if topics_ttl is None:
+        topics_ttl = float(os.getenv('KEYWORD_INDEX_TOPICS_TTL', '3600'))
+
+    cached = _read_cache(cache_path) if cache_path else {}
+    readme_keywords, readme_section, changed = _readme_vocabulary(readme_paths, cached.get('readmes'))
+
+    db = persisted_db = cached.get('db') or {}
+    if supabase is None:
+        changed = changed or bool(db)
+        db = persisted_db = {}
+    elif not db or time.time() - db.get('fetched_at', 0) >= topics_ttl:
+        fetched = {'fetched_at': time.time(), 'topics': db.get('topics', []), 'vocabulary': db.get('vocabulary', [])}
+        complete = True
+        for key, fetch in (('topics', fetch_topic_keywords), ('vocabulary', fetch_vocabulary_keywords)):
+            try:
+                fetched[key] = sorted(fetch(supabase))
+            except Exception as e:
+                # Keep the last known keywords for this run; the cached fetch
+                # time is left as is, so the next run retries
+                complete = False
+                logger.warning(f"Could not fetch {key} keywords ({e}); using {len(fetched[key])} cached")
+        db = fetched
+        if complete:
+            persisted_db = fetched
+            changed = True
+
+    keywords = sorted(
+        set(_seeded(seeded_keywords)) | set(readme_keywords) | set(db.get('topics', [])) | set(db.get('vocabulary', []))
+    )
+    cached_index = cached.get('index')
+    if cached_index and cached_index.get('keywords') == keywords:
+        index = KeywordIndex.from_dict(cached_index)
+        logger.info(f"Loaded {len(index)} keywords/phrases from cache {cache_path}")
+    else:
+        index = KeywordIndex(keywords)
+        changed = True
+        logger.info(
+            f"Built keyword index: {len(index)} keywords/phrases ({len(readme_keywords)} from README files, "
+            f"{len(db.get('topics', []))} from topics, {len(db.get('vocabulary', []))} from keyword_vocabulary)"
+        )
+
+    if cache_path and changed:
+        _write_cache(cache_path, {'readmes': readme_section, 'db': persisted_db, 'index': index.to_dict()})
+    return index
@@ -0,0 +1,108 @@
+"""Persisted per-channel high-water marks for incremental Slack extraction."""
+import os
+import json
+import logging
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def ts_value(ts: Optional[str]) -> float:
+    """Slack ts ('1700000000.000100') as a number for comparisons; 0 if missing."""
+    try:
+        return float(ts) if ts else 0.0
+    except ValueError:
+        return 0.0
+
+
+def newer_ts(a: Optional[str], b: Optional[str]) -> Optional[str]:
+    """Return the later of two Slack timestamps (either may be None)."""
+    if not a:
+        return b
+    if not b:
+        return a
+    return a if ts_value(a) >= ts_value(b) else b
+
+
+class SlackSyncState:
+    """
+    Persists, per channel, the ts of the last processed message and the
+    latest_reply seen for each recent thread.
+
+    Layout of the JSON state file:
+        {"channels": {"C123": {"last_ts": "1700000000.000100",
+                               "threads": {"<thread_ts>": "<latest_reply ts>"}}}}
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize sync state.
+
+        Args:
+            path: Path of the JSON state file
+        """
+        self.path = path
+        self._state = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        """Load the state file, returning an empty state if missing or invalid."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read Slack sync state {self.path}: {e}")
+            return {}
+
+    def _channel(self, channel_id: str) -> Dict[str, Any]:
+        return self._state.get('channels', {}).get(channel_id, {})
+
+    def get_cursor(self, channel_id: str) -> Optional[str]:
+        """Return the ts of the last processed message in a channel, if any."""
+        return self._channel(channel_id).get('last_ts') or None
+
+    def get_threads(self, channel_id: str) -> Dict[str, str]:
+        """Return {thread_ts: latest_reply ts} for the channel's tracked threads."""
+        return dict(self._channel(channel_id).get('threads', {}))
+
+    def set_cursor(
+        self,
+        channel_id: str,
+        last_ts: Optional[str],
+        threads: Dict[str, str],
+        threads_since: float = 0.0
+    ):
+        """
+        Atomically advance a channel's cursors.
+
+        The state file is re-read first and cursors only move forward, so an
+        overlapping run that finished earlier is never rolled back.
+
+        Args:
+            channel_id: Slack channel ID
+            last_ts: Newest message ts processed (None keeps the current cursor)
+            threads: {thread_ts: latest_reply ts} to record
+            threads_since: Stop tracking threads started before this epoch time
+        """
+        state = self._load()
+        channel = state.setdefault('channels', {}).setdefault(channel_id, {})
+        channel['last_ts'] = newer_ts(channel.get('last_ts'), last_ts)
+
+        tracked = channel.get('threads', {})
+        for thread_ts, latest_reply in threads.items():
+            tracked[thread_ts] = newer_ts(tracked.get(thread_ts), latest_reply)
+        channel['threads'] = {
+            thread_ts: latest_reply for thread_ts, latest_reply in tracked.items()
+            if ts_value(thread_ts) >= threads_since
+        }
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_path, self.path)
+            self._state = state
+            logger.info(f"Slack cursor for {channel_id} advanced to {channel['last_ts']}")
+        except OSError as e:
+            logger.error(f"Could not write Slack sync state {self.path}: {e}")
@@ -0,0 +1,32 @@
+"""Shared fixtures: importing the extractor scripts from the repository root."""
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture(scope='session')
+def import_script(tmp_path_factory):
+    """
+    Import a top-level extractor script by module name.
+
+    The scripts open their log file in the working directory on import, so
+    they are imported from a temporary directory.
+    """
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.append(str(REPO_ROOT))
+    log_dir = tmp_path_factory.mktemp('logs')
+
+    def load(name):
+        cwd = os.getcwd()
+        os.chdir(log_dir)
+        try:
+            return importlib.import_module(name)
+        finally:
+            os.chdir(cwd)
+
+    return load
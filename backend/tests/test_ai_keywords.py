@@ -0,0 +1,60 @@
+"""Keyword extraction for the AI assistant when no known topic matches."""
+import asyncio
+
+import pytest
+
+from app.services import ai_service
+
+
+@pytest.fixture
+def no_topic_match(monkeypatch):
+    """Topic vocabulary that never appears in the test questions."""
+    async def get_topic_vocabulary(supabase):
+        return ai_service._build_topic_matcher(['kubernetes'])
+
+    monkeypatch.setattr(ai_service, 'get_topic_vocabulary', get_topic_vocabulary)
+    ai_service._keyword_cache.clear()
+    yield
+    ai_service._keyword_cache.clear()
+
+
+def test_falls_back_to_openai_and_memoizes(monkeypatch, no_topic_match):
+    calls = []
+
+    async def fake_openai(**kwargs):
+        calls.append(kwargs['prompt'])
+        return 'order history, dental city'
+
+    monkeypatch.setattr(ai_service, 'call_openai_api_async', fake_openai)
+
+    first = asyncio.run(ai_service.extract_keywords(None, 'What is the order history status?'))
+    second = asyncio.run(ai_service.extract_keywords(None, '  what is the ORDER history status '))
+
+    assert first == ['order history', 'dental city']
+    assert second == first
+    assert len(calls) == 1
+
+
+def test_openai_failure_uses_stop_words_and_is_not_cached(monkeypatch, no_topic_match):
+    calls = []
+
+    async def failing_openai(**kwargs):
+        calls.append(kwargs['prompt'])
+        return None
+
+    monkeypatch.setattr(ai_service, 'call_openai_api_async', failing_openai)
+
+    for _ in range(2):
+        keywords = asyncio.run(ai_service.extract_keywords(None, 'What about the invoices?'))
+        assert keywords == ['invoices?']
+    assert len(calls) == 2
+
+
+def test_without_openai_uses_stop_words(monkeypatch, no_topic_match):
+    async def unexpected_openai(**kwargs):
+        raise AssertionError('OpenAI must not be called')
+
+    monkeypatch.setattr(ai_service, 'call_openai_api_async', unexpected_openai)
+
+    keywords = asyncio.run(ai_service.extract_keywords(None, 'Show the invoices', allow_openai=False))
+    assert keywords == ['invoices']
@@ -0,0 +1,57 @@
+"""Streaming AI answers: interrupted streams must not be cached."""
+import asyncio
+
+import pytest
+
+from app.services import ai_service
+from app.utils.ai_summarization import StreamInterrupted
+from app.utils.cache import TTLCache
+
+ARTICLES = [{'id': '1', 'summary': 'Dashboard', 'topics': ['dashboard'], 'key_points': []}]
+
+
+@pytest.fixture
+def answer_setup(monkeypatch):
+    cache = TTLCache(maxsize=8, ttl=60)
+
+    async def search(supabase, question, limit=3):
+        return ARTICLES
+
+    monkeypatch.setattr(ai_service, 'search_relevant_articles', search)
+    monkeypatch.setattr(ai_service, 'get_answer_cache', lambda: cache)
+    monkeypatch.setattr(ai_service, 'build_article_links', lambda articles: [])
+    monkeypatch.setattr(ai_service, 'build_answer_prompt', lambda question, articles: ('system', 'prompt'))
+    return cache
+
+
+def collect(question):
+    async def run():
+        return [event async for event in ai_service.stream_ai_question(None, question)]
+    return asyncio.run(run())
+
+
+def test_interrupted_stream_emits_error_and_is_not_cached(monkeypatch, answer_setup):
+    async def broken_stream(**kwargs):
+        yield 'The dashboard '
+        raise StreamInterrupted('OpenAI stream timed out')
+
+    monkeypatch.setattr(ai_service, 'stream_openai_api_async', broken_stream)
+
+    events = collect('What about the dashboard?')
+
+    assert [name for name, _ in events] == ['articles', 'token', 'error']
+    assert answer_setup.get(ai_service.answer_cache_key('What about the dashboard?', ARTICLES)) is None
+
+
+def test_complete_stream_is_cached(monkeypatch, answer_setup):
+    async def stream(**kwargs):
+        for fragment in ('The dashboard ', 'shows orders.'):
+            yield fragment
+
+    monkeypatch.setattr(ai_service, 'stream_openai_api_async', stream)
+
+    events = collect('What about the dashboard?')
+
+    assert [name for name, _ in events] == ['articles', 'token', 'token', 'done']
+    cached = answer_setup.get(ai_service.answer_cache_key('What about the dashboard?', ARTICLES))
+    assert cached == events[-1][1]
@@ -0,0 +1,80 @@
+"""StagePipeline: error propagation, shutdown and bounded queues."""
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture(scope='module')
+def StagePipeline(import_script):
+    return import_script('confluence_knowledge_extractor').StagePipeline
+
+
+def run_with_timeout(pipeline, jobs, timeout=10):
+    """Run the pipeline in a thread so a deadlock fails the test instead of hanging it."""
+    outcome = {}
+    runner = threading.Thread(target=lambda: outcome.update(result=pipeline.run(jobs)), daemon=True)
+    runner.start()
+    runner.join(timeout)
+    assert not runner.is_alive(), 'pipeline did not finish'
+    return outcome['result']
+
+
+def mark(stage):
+    def func(job):
+        job.setdefault('stages', []).append(stage)
+        return job
+    return func
+
+
+def test_every_job_passes_every_stage(StagePipeline):
+    pipeline = StagePipeline([('fetch', mark('fetch'), 3), ('write', mark('write'), 2)], queue_size=2)
+
+    finished = run_with_timeout(pipeline, [{'article_data': {'id': i}} for i in range(50)])
+
+    assert sorted(job['article_data']['id'] for job in finished) == list(range(50))
+    assert all(job['stages'] == ['fetch', 'write'] for job in finished)
+
+
+def test_failed_stage_marks_job_and_skips_later_stages(StagePipeline):
+    def flaky(job):
+        if job['article_data']['id'] % 3 == 0:
+            raise RuntimeError('Confluence 500')
+        return mark('fetch')(job)
+
+    pipeline = StagePipeline([('fetch', flaky, 2), ('write', mark('write'), 1)], queue_size=1)
+
+    finished = run_with_timeout(pipeline, [{'article_data': {'id': i}} for i in range(12)])
+
+    failed = [job for job in finished if job.get('action') == 'error']
+    assert sorted(job['article_data']['id'] for job in failed) == [0, 3, 6, 9]
+    assert all('stages' not in job for job in failed)
+    assert len(finished) == 12
+    # Workers keep going after a failure and all threads shut down
+    assert not [t for t in threading.enumerate() if t.name.startswith('pipeline-')]
+
+
+def test_slow_stage_bounds_work_in_flight(StagePipeline):
+    lock = threading.Lock()
+    fetched = []
+    written = []
+
+    def fetch(job):
+        with lock:
+            fetched.append(job['article_data']['id'])
+            job['ahead'] = len(fetched) - len(written)
+        return job
+
+    def write(job):
+        time.sleep(0.005)
+        with lock:
+            written.append(job['article_data']['id'])
+        return job
+
+    pipeline = StagePipeline([('fetch', fetch, 1), ('write', write, 1)], queue_size=2)
+
+    finished = run_with_timeout(pipeline, [{'article_data': {'id': i}} for i in range(40)])
+
+    assert len(finished) == 40
+    # In flight between the stages: one job per worker plus a full queue
+    assert max(job['ahead'] for job in finished) <= 2 + 2
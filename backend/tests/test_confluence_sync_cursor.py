@@ -0,0 +1,52 @@
+"""Where the Confluence sync cursor moves after complete, truncated and failed runs."""
+from datetime import datetime, timezone
+
+import pytest
+
+STARTED = datetime(2024, 5, 10, 12, 0, tzinfo=timezone.utc)
+PREVIOUS = datetime(2024, 5, 9, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope='module')
+def next_sync_cursor(import_script):
+    return import_script('confluence_knowledge_extractor').next_sync_cursor
+
+
+def page(when):
+    return {'id': when, 'version': {'when': when}}
+
+
+PAGES = [page('2024-05-09T13:00:00Z'), page('2024-05-09T18:30:00Z'), page('2024-05-10T08:00:00Z')]
+
+
+def test_complete_run_resumes_from_run_start(next_sync_cursor):
+    assert next_sync_cursor(PREVIOUS, STARTED, PAGES, [], True) == STARTED
+    assert next_sync_cursor(None, STARTED, PAGES, [], True) == STARTED
+
+
+def test_truncated_incremental_run_resumes_at_last_listed_page(next_sync_cursor):
+    assert next_sync_cursor(PREVIOUS, STARTED, PAGES, [], False) == datetime(
+        2024, 5, 10, 8, 0, tzinfo=timezone.utc
+    )
+
+
+def test_truncated_full_listing_keeps_cursor(next_sync_cursor):
+    assert next_sync_cursor(None, STARTED, PAGES, [], False) is None
+
+
+def test_failed_pages_resume_at_earliest_failure(next_sync_cursor):
+    failed = ['2024-05-10T08:00:00Z', '2024-05-09T18:30:00Z']
+    expected = datetime(2024, 5, 9, 18, 30, tzinfo=timezone.utc)
+
+    assert next_sync_cursor(PREVIOUS, STARTED, PAGES, failed, True) == expected
+    assert next_sync_cursor(PREVIOUS, STARTED, PAGES, failed, False) == expected
+    # A complete full listing has written every page but the failed ones
+    assert next_sync_cursor(None, STARTED, PAGES, failed, True) == expected
+
+
+def test_failure_without_version_date_keeps_cursor(next_sync_cursor):
+    assert next_sync_cursor(PREVIOUS, STARTED, PAGES, [None], True) is None
+
+
+def test_cursor_never_moves_back(next_sync_cursor):
+    assert next_sync_cursor(PREVIOUS, STARTED, PAGES, ['2024-05-08T00:00:00Z'], True) is None
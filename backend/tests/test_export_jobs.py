@@ -0,0 +1,97 @@
+"""Background export jobs: progress, shared job records, purging and the PDF fetch cap."""
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from app.services import export_jobs
+from app.services.export_jobs import ExportJobManager
+
+ITEMS = [{'summary': f'Item {i}', 'project': 'eng', 'source': 'slack'} for i in range(7)]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ExportJobManager(concurrency=1, max_queued=2, directory=str(tmp_path))
+    yield manager
+    manager.shutdown()
+
+
+async def export(manager, format, **kwargs):
+    """Submit a job and wait for it to end."""
+    job = manager.submit(format, f'items.{format}', **kwargs)
+    while job.id in manager._tasks:
+        await asyncio.sleep(0.01)
+    return job
+
+
+def test_csv_progress_counts_rows(manager):
+    job = asyncio.run(export(manager, 'csv', items=ITEMS))
+
+    assert job.status == 'completed'
+    assert job.processed == job.total == len(ITEMS)
+    with open(job.path, encoding='utf-8') as f:
+        assert len(f.read().splitlines()) == len(ITEMS) + 1
+
+
+def test_other_worker_reads_job_record(manager, tmp_path):
+    job = asyncio.run(export(manager, 'csv', owner_id='u1', items=ITEMS))
+    other_worker = ExportJobManager(directory=str(tmp_path))
+    try:
+        seen = other_worker.get(job.id, owner_id='u1')
+        assert seen.to_dict() == job.to_dict()
+        assert os.path.exists(seen.path)
+        assert other_worker.get(job.id, owner_id='u2') is None
+        assert other_worker.get('../' + job.id) is None
+    finally:
+        other_worker.shutdown()
+
+
+def test_expired_jobs_are_purged_without_new_requests(tmp_path):
+    manager = ExportJobManager(directory=str(tmp_path), ttl=0.05, purge_interval=0.02)
+    (tmp_path / 'notes.txt').write_text('not an export')
+
+    async def run():
+        manager.start()
+        job = await export(manager, 'csv', items=ITEMS)
+        await asyncio.sleep(0.2)
+        return job
+
+    try:
+        job = asyncio.run(run())
+    finally:
+        manager.shutdown()
+
+    assert manager.get(job.id) is None
+    assert sorted(os.listdir(tmp_path)) == ['notes.txt']
+
+
+def test_pdf_fetch_stops_one_past_the_cap(manager, monkeypatch):
+    monkeypatch.setenv('EXPORT_PDF_MAX_ITEMS', '25')
+    pages_read = []
+
+    async def fake_pages(supabase, columns, **filters):
+        for page in range(10):
+            pages_read.append(page)
+            yield [{'id': f'{page}-{i}', 'summary': f'Item {page}-{i}'} for i in range(10)]
+
+    monkeypatch.setattr(export_jobs, 'iter_knowledge_items', fake_pages)
+
+    job = asyncio.run(export(manager, 'pdf', supabase=object()))
+
+    assert job.status == 'completed', job.error
+    assert pages_read == [0, 1, 2]
+    assert job.total == job.processed == 25
+
+
+def test_unfinished_record_of_a_gone_worker_expires(manager, tmp_path):
+    stale = export_jobs.ExportJob(id='a' * 32, format='csv', filename='items.csv', status='running')
+    stale.updated_at = time.time() - manager.ttl - 1
+    (tmp_path / f'{stale.id}.json').write_text(json.dumps(stale.to_record()))
+    (tmp_path / f'{stale.id}.csv.part').write_text('id\n')
+
+    assert manager.get(stale.id) is None
+    manager.purge_expired()
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,87 @@
+"""Shared keyword index: matching rules, serialization and the cached vocabulary."""
+import json
+import os
+
+import pytest
+
+from app.utils import keyword_index
+from app.utils.keyword_index import KeywordIndex, load_keyword_index
+
+
+def test_keywords_match_whole_words_only():
+    index = KeywordIndex(['api', 'cart'])
+
+    assert sorted(index.match_all('The API is down, check the cart.')) == ['api', 'cart']
+    assert index.best_match('New apis for the rapid carts page') is None
+
+
+def test_longest_phrase_wins():
+    index = KeywordIndex(['api', 'rest api', 'rest'])
+
+    assert index.best_match('Is the REST API documented?') == 'rest api'
+    assert index.match_all('Is the REST API documented?') == ['rest api', 'rest', 'api']
+    assert index.match('nothing relevant') is None
+
+
+def test_round_trip_through_json():
+    index = KeywordIndex(['order history', 'mia chatbot', 'api'])
+    restored = KeywordIndex.from_dict(json.loads(json.dumps(index.to_dict())))
+
+    text = 'Mia chatbot shows the order history via the api'
+    assert restored.keywords == index.keywords
+    assert restored.match_all(text) == index.match_all(text)
+    assert restored.best_match(text) == 'order history'
+
+
+@pytest.fixture
+def readme(tmp_path):
+    path = tmp_path / 'README.md'
+    path.write_text('- Dashboard\n- Order history\n')
+    return path
+
+
+@pytest.fixture
+def extractions(monkeypatch):
+    """Count how often README text is parsed for keywords."""
+    calls = []
+    original = keyword_index.extract_readme_keywords
+
+    def counting(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(keyword_index, 'extract_readme_keywords', counting)
+    return calls
+
+
+def load(readme, cache_path):
+    return load_keyword_index([str(readme)], cache_path=str(cache_path), seeded_keywords=[])
+
+
+def test_cache_is_reused_while_readmes_are_unchanged(readme, tmp_path, extractions):
+    cache_path = tmp_path / 'keyword-index-cache.json'
+
+    first = load(readme, cache_path)
+    second = load(readme, cache_path)
+
+    assert first.keywords == second.keywords == ['dashboard', 'order history']
+    assert len(extractions) == 1
+
+    # A touch changes the fingerprint but not the content hash
+    stat = os.stat(readme)
+    os.utime(readme, (stat.st_atime, stat.st_mtime + 10))
+    assert load(readme, cache_path).keywords == first.keywords
+    assert len(extractions) == 1
+
+
+def test_cache_is_invalidated_when_a_readme_changes(readme, tmp_path, extractions):
+    cache_path = tmp_path / 'keyword-index-cache.json'
+    load(readme, cache_path)
+
+    readme.write_text('- Dashboard\n- Order history\n- Pending approvals\n')
+    stat = os.stat(readme)
+    os.utime(readme, (stat.st_atime, stat.st_mtime + 10))
+    index = load(readme, cache_path)
+
+    assert len(extractions) == 2
+    assert index.best_match('Three pending approvals today') == 'pending approvals'
@@ -0,0 +1,173 @@
+"""Per-channel Slack cursors: ts ordering, atomic saves and forward-only advancement."""
+import json
+import os
+
+import pytest
+
+from app.utils import slack_sync_state
+from app.utils.slack_sync_state import SlackSyncState, newer_ts, ts_value
+
+
+def test_ts_value_orders_numerically():
+    assert ts_value('1700000000.000100') > ts_value('1700000000.000099')
+    assert ts_value('1000.000001') > ts_value('999.999999')
+    assert ts_value(None) == ts_value('') == ts_value('not-a-ts') == 0.0
+
+
+def test_newer_ts_picks_the_later_timestamp():
+    assert newer_ts('999.9', '1000.1') == '1000.1'
+    assert newer_ts('1700000000.000100', '1700000000.000099') == '1700000000.000100'
+    assert newer_ts(None, '1.0') == '1.0'
+    assert newer_ts('1.0', None) == '1.0'
+    assert newer_ts(None, None) is None
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / 'slack-sync-state.json')
+
+
+def test_cursor_only_moves_forward(state_path):
+    state = SlackSyncState(state_path)
+    state.set_cursor('C1', '1700000100.000000', {'1700000000.000000': '1700000050.000000'})
+    state.set_cursor('C1', '1700000010.000000', {'1700000000.000000': '1700000020.000000'})
+
+    assert state.get_cursor('C1') == '1700000100.000000'
+    assert state.get_threads('C1') == {'1700000000.000000': '1700000050.000000'}
+
+
+def test_overlapping_run_is_not_rolled_back(state_path):
+    first, second = SlackSyncState(state_path), SlackSyncState(state_path)
+    first.set_cursor('C1', '1700000200.000000', {})
+    # The second run loaded the state before the first one saved
+    second.set_cursor('C1', '1700000100.000000', {})
+    second.set_cursor('C2', '1700000300.000000', {})
+
+    reloaded = SlackSyncState(state_path)
+    assert reloaded.get_cursor('C1') == '1700000200.000000'
+    assert reloaded.get_cursor('C2') == '1700000300.000000'
+
+
+def test_old_threads_are_pruned(state_path):
+    state = SlackSyncState(state_path)
+    state.set_cursor('C1', '1700000500.000000', {
+        '1700000000.000000': '1700000400.000000',
+        '1700000300.000000': '1700000450.000000',
+    }, threads_since=1700000100.0)
+
+    assert state.get_threads('C1') == {'1700000300.000000': '1700000450.000000'}
+
+
+def test_save_is_atomic(state_path, monkeypatch):
+    state = SlackSyncState(state_path)
+    state.set_cursor('C1', '1700000100.000000', {})
+    with open(state_path, encoding='utf-8') as f:
+        saved = f.read()
+
+    def failing_replace(src, dst):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(slack_sync_state.os, 'replace', failing_replace)
+    state.set_cursor('C1', '1700000200.000000', {})
+
+    with open(state_path, encoding='utf-8') as f:
+        assert f.read() == saved
+    assert state.get_cursor('C1') == '1700000100.000000'
+    assert json.loads(saved)['channels']['C1']['last_ts'] == '1700000100.000000'
+
+
+def test_unreadable_state_starts_empty(state_path):
+    with open(state_path, 'w', encoding='utf-8') as f:
+        f.write('{not json')
+
+    assert SlackSyncState(state_path).get_cursor('C1') is None
+
+
+def test_failed_channels_keep_their_cursor(state_path, import_script):
+    extractor_module = import_script('slack_knowledge_extractor_simple')
+    extractor = extractor_module.SlackKnowledgeExtractor.__new__(extractor_module.SlackKnowledgeExtractor)
+    extractor.sync_state = SlackSyncState(state_path)
+    extractor.sync_state.set_cursor('C1', '1700000000.000000', {})
+    extractor.sync_state.set_cursor('C2', '1700000000.000000', {})
+    extractor.pending_cursors = {
+        'C1': {'name': 'eng', 'last_ts': '1700000900.000000', 'threads': {}, 'threads_since': 0.0},
+        'C2': {'name': 'product', 'last_ts': '1700000900.000000', 'threads': {}, 'threads_since': 0.0},
+    }
+
+    extractor.save_cursors(failed_channels={'product'})
+
+    reloaded = SlackSyncState(state_path)
+    assert reloaded.get_cursor('C1') == '1700000900.000000'
+    assert reloaded.get_cursor('C2') == '1700000000.000000'
+    assert extractor.pending_cursors == {}
+    assert not os.path.exists(state_path + '.tmp')
+
+
+class FakeSlack:
+    """Minimal Slack client: one channel, its history and threads; records calls."""
+
+    def __init__(self, history, threads):
+        self.history = history
+        self.threads = threads
+        self.calls = []
+
+    def call_api(self, endpoint, params=None):
+        return {'ok': True, 'user': {'real_name': 'Ana'}}
+
+    def iter_items(self, endpoint, key, params=None, limit=200):
+        params = params or {}
+        self.calls.append((endpoint, dict(params)))
+        if endpoint == 'conversations.list':
+            return iter([{'id': 'C1', 'name': 'eng'}])
+        if endpoint == 'conversations.history':
+            oldest = float(params['oldest'])
+            return iter([m for m in self.history if float(m['ts']) > oldest])
+        thread = self.threads[params['ts']]
+        oldest = float(params.get('oldest', 0))
+        return iter([m for m in thread if m['ts'] == params['ts'] or float(m['ts']) > oldest])
+
+
+def test_tracked_threads_are_polled_instead_of_the_window(state_path, import_script):
+    extractor_module = import_script('slack_knowledge_extractor_simple')
+    now = extractor_module.datetime.now().timestamp()
+    parent, quiet, new = f'{now - 3000:.6f}', f'{now - 2500:.6f}', f'{now - 10:.6f}'
+    slack = FakeSlack(
+        history=[{'ts': new, 'text': 'Fresh message', 'user': 'U1'}],
+        threads={
+            parent: [
+                {'ts': parent, 'text': 'Deploy question', 'user': 'U1',
+                 'reply_count': 2, 'latest_reply': f'{now - 100:.6f}'},
+                {'ts': f'{now - 2000:.6f}', 'text': 'Old answer', 'user': 'U2', 'thread_ts': parent},
+                {'ts': f'{now - 100:.6f}', 'text': 'New answer', 'user': 'U2', 'thread_ts': parent},
+            ],
+            quiet: [
+                {'ts': quiet, 'text': 'Settled', 'user': 'U1', 'reply_count': 1, 'latest_reply': f'{now - 2400:.6f}'},
+                {'ts': f'{now - 2400:.6f}', 'text': 'Done', 'user': 'U2', 'thread_ts': quiet},
+            ],
+        }
+    )
+    extractor = extractor_module.SlackKnowledgeExtractor.__new__(extractor_module.SlackKnowledgeExtractor)
+    extractor.hours_back = 24
+    extractor.full_sync = False
+    extractor.include_channels = []
+    extractor.slack_client = slack
+    extractor.message_processor = extractor_module.SlackMessageProcessor(slack)
+    extractor.sync_state = SlackSyncState(state_path)
+    extractor.sync_state.set_cursor('C1', f'{now - 1000:.6f}', {
+        parent: f'{now - 2000:.6f}',
+        quiet: f'{now - 2400:.6f}',
+    })
+
+    messages = extractor.fetch_slack_messages()
+
+    history_calls = [params for endpoint, params in slack.calls if endpoint == 'conversations.history']
+    assert history_calls == [{'channel': 'C1', 'oldest': f'{now - 1000:.6f}'}]
+    new_items = [m.text for m in messages if not m.context_only]
+    assert sorted(new_items) == ['Fresh message', 'New answer']
+    assert extractor.pending_cursors['C1']['threads'] == {parent: f'{now - 100:.6f}'}
+
+    extractor.save_cursors(failed_channels=set())
+    assert SlackSyncState(state_path).get_threads('C1') == {
+        parent: f'{now - 100:.6f}',
+        quiet: f'{now - 2400:.6f}',
+    }
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Backfill knowledge_items.embedding for articles stored before semantic search.
+
+New and updated articles get their embedding from the Slack and Confluence
+extractors; this walks the rows that still have none (keyset paging on id)
+and embeds them the same way.
+
+Requires supabase/add_embeddings.sql, SUPABASE_URL, SUPABASE_ANON_KEY and
+OPENAI_API_KEY.
+
+Usage:
+    python3 backfill_embeddings.py [--batch-size 100] [--dry-run]
+"""
+import os
+import sys
+import logging
+import argparse
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+from app.utils.api_clients import SupabaseAPIClient  # noqa: E402
+from app.utils.ai_summarization import create_embedding, format_article_for_embedding  # noqa: E402
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--dry-run', action='store_true', help='count rows without embedding them')
+    args = parser.parse_args()
+
+    missing = [var for var in ('SUPABASE_URL', 'SUPABASE_ANON_KEY', 'OPENAI_API_KEY') if not os.getenv(var)]
+    if missing:
+        logger.error(f"Missing required environment variables: {missing}")
+        sys.exit(1)
+
+    supabase = SupabaseAPIClient(os.getenv('SUPABASE_URL'), os.getenv('SUPABASE_ANON_KEY'))
+    last_id = None
+    embedded = failed = 0
+
+    while True:
+        params = {
+            'select': 'id,summary,topics,key_points,raw_text',
+            'embedding': 'is.null',
+            'order': 'id.asc',
+            'limit': args.batch_size,
+        }
+        if last_id:
+            params['id'] = f'gt.{last_id}'
+        response = supabase.get('knowledge_items', params)
+        if response.status_code != 200:
+            logger.error(f"Failed to fetch articles: {response.status_code} {response.text}")
+            sys.exit(1)
+        rows = response.json()
+        if not rows:
+            break
+        last_id = rows[-1]['id']
+
+        for row in rows:
+            if args.dry_run:
+                embedded += 1
+                continue
+            embedding = create_embedding(format_article_for_embedding(
+                row.get('summary') or '',
+                row.get('topics') or [],
+                row.get('key_points') or [],
+                (row.get('raw_text') or '')[:4000]
+            ))
+            if embedding is None:
+                failed += 1
+                continue
+            response = supabase.patch('knowledge_items', row['id'], {'embedding': embedding})
+            if response.status_code in (200, 204):
+                embedded += 1
+            else:
+                failed += 1
+                logger.error(f"Failed to store embedding for {row['id']}: {response.status_code} {response.text}")
+        logger.info(f"Progress: {embedded} embedded, {failed} failed")
+
+    action = 'need embeddings' if args.dry_run else 'embedded'
+    logger.info(f"Done: {embedded} articles {action}, {failed} failed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-request latency of the backend API clients against a local stub.
+
+Compares a fresh connection per request (module-level requests.get, the old
+client behaviour) with the pooled keep-alive session the clients now use.
+
+Usage:
+    python3 benchmark_api_clients.py [--requests 500] [--delay-ms 0]
+"""
+import os
+import sys
+import time
+import socket
+import argparse
+import statistics
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+from app.utils.api_clients import SupabaseAPIClient  # noqa: E402
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimal PostgREST stand-in that answers every GET with an empty list."""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    delay = 0.0
+
+    def setup(self):
+        super().setup()
+        # Headers and body are written separately; without this Nagle's
+        # algorithm adds ~40 ms per request on a reused connection
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        if self.delay:
+            time.sleep(self.delay)
+        body = b'[]'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(label: str, call, count: int):
+    """Run call() count times and print latency percentiles in milliseconds."""
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = call()
+        response.raise_for_status()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    p50 = statistics.median(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{label:<28} p50={p50:7.3f} ms  p95={p95:7.3f} ms  total={sum(samples):8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=500, help='requests per variant')
+    parser.add_argument('--delay-ms', type=float, default=0.0, help='stub server latency')
+    args = parser.parse_args()
+
+    StubHandler.delay = args.delay_ms / 1000
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    client = SupabaseAPIClient(base_url, 'stub-key')
+    url = f"{base_url}/rest/v1/knowledge_items"
+
+    print(f"{args.requests} GET requests per variant against {base_url}")
+    measure('new connection per request', lambda: requests.get(url, headers=client.headers), args.requests)
+    measure('pooled session (client)', lambda: client.get('knowledge_items'), args.requests)
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark Slack keyword matching on synthetic keywords and messages.
+
+Compares the precompiled KeywordIndex used by
+slack_knowledge_extractor_simple.find_matching_keywords with the previous
+per-keyword regex scan. The previous scan is too slow to run on every
+message, so it is timed on a sample and extrapolated.
+
+Usage:
+    python3 benchmark_keyword_matching.py [--keywords 5000] [--messages 100000] [--legacy-sample 200]
+"""
+import re
+import time
+import random
+import argparse
+from typing import List, Optional, Tuple
+
+from slack_knowledge_extractor_simple import KeywordIndex, find_matching_keywords, normalize_text
+
+
+def legacy_find_matching_keywords(text: str, keywords: List[str]) -> Optional[Tuple[str, List[str]]]:
+    """The previous implementation: normalize and regex-search every keyword."""
+    normalized_text = normalize_text(text)
+    matches = []
+    for keyword in keywords:
+        normalized_keyword = normalize_text(keyword)
+        if not normalized_keyword:
+            continue
+        if ' ' in normalized_keyword:
+            if normalized_keyword in normalized_text:
+                matches.append(keyword)
+        elif re.search(rf"\b{re.escape(normalized_keyword)}\b", normalized_text):
+            matches.append(keyword)
+    if not matches:
+        return None
+    sorted_matches = sorted(matches, key=lambda k: (-len(k.split()), -len(k)))
+    return (sorted_matches[0], sorted_matches)
+
+
+def synthetic_data(keyword_count: int, message_count: int, seed: int = 11):
+    """Keywords of 1-4 words and Slack-like messages, ~20% containing a keyword."""
+    rng = random.Random(seed)
+    syllables = ['ka', 'lo', 'mi', 'ra', 'ten', 'sho', 'vel', 'dar', 'qu', 'ix', 'nor', 'pe']
+    vocabulary = sorted({
+        ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(20000)
+    })
+    # Message filler shares only a slice of its words with the keywords
+    filler, topic_words = vocabulary[:len(vocabulary) // 2], vocabulary[len(vocabulary) * 2 // 5:]
+    keywords = set()
+    while len(keywords) < keyword_count:
+        keywords.add(' '.join(rng.choice(topic_words) for _ in range(rng.choice((1, 1, 2, 2, 3, 4)))))
+    keywords = sorted(keywords)
+    messages = []
+    for _ in range(message_count):
+        words = [rng.choice(filler) for _ in range(rng.randint(8, 40))]
+        if rng.random() < 0.2:
+            words.insert(rng.randrange(len(words)), rng.choice(keywords))
+        if rng.random() < 0.3:
+            words[0] = f"*{words[0].capitalize()}*"
+        messages.append(' '.join(words) + rng.choice(['.', '?', '!', ' <@U123ABC>']))
+    return keywords, messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--keywords', type=int, default=5000)
+    parser.add_argument('--messages', type=int, default=100000)
+    parser.add_argument('--legacy-sample', type=int, default=200)
+    args = parser.parse_args()
+
+    keywords, messages = synthetic_data(args.keywords, args.messages)
+    print(f"{len(keywords)} keywords x {len(messages)} messages")
+
+    start = time.perf_counter()
+    matcher = KeywordIndex(keywords)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [find_matching_keywords(text, matcher) for text in messages]
+    matched = time.perf_counter() - start
+    hits = sum(1 for r in results if r)
+    print(f"KeywordIndex: build {build * 1000:.0f} ms, match {matched:.2f} s "
+          f"({matched / len(messages) * 1e6:.1f} us/message), {hits} messages matched")
+
+    sample = messages[:args.legacy_sample]
+    start = time.perf_counter()
+    legacy = [legacy_find_matching_keywords(text, keywords) for text in sample]
+    legacy_time = time.perf_counter() - start
+    per_message = legacy_time / len(sample)
+    print(f"Per-keyword regex: {per_message * 1000:.1f} ms/message on {len(sample)} messages, "
+          f"~{per_message * len(messages) / 60:.0f} min extrapolated ({per_message * len(messages) / matched:.0f}x slower)")
+
+    agree = sum(1 for a, b in zip(results, legacy) if (a and a[0]) == (b and b[0]))
+    print(f"Best match agrees with the previous implementation on {agree}/{len(sample)} sampled messages")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark PDF export rendering on synthetic knowledge items.
+
+Renders the items once and reports wall time, output size and peak RSS.
+The layout pass (wrapping, page breaks) and the draw pass are timed
+separately.
+
+Usage:
+    python3 benchmark_pdf_export.py [--items 10000]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import resource
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+WORDS = (
+    "dashboard release deploy api latency customer onboarding mobile checkout search "
+    "recommendation billing invoice migration schema index cache retry webhook chatbot "
+    "design review sprint backlog incident postmortem metrics alert rollout feature flag"
+).split()
+
+
+def synthetic_items(count: int, seed: int = 7):
+    """Items shaped like Slack/Confluence articles, with long content and long words."""
+    rng = random.Random(seed)
+
+    def sentence(n):
+        return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize()
+
+    items = []
+    for i in range(count):
+        content_lines = [
+            f"**User {rng.randint(1, 50)}** (2025-01-{rng.randint(1, 28):02d}): {sentence(rng.randint(8, 60))}"
+            for _ in range(rng.randint(5, 40))
+        ]
+        if i % 10 == 0:
+            content_lines.append("https://example.com/" + "x" * 300)  # unbreakable token
+        items.append({
+            'summary': f"## Summary\n{sentence(6)} {i}\n## Key Points\n1. {sentence(20)}\n2. {sentence(25)}",
+            'project': rng.choice(['general', 'eng', 'product', 'ENG']),
+            'source': rng.choice(['slack', 'confluence']),
+            'date': f"2025-01-{rng.randint(1, 28):02d}",
+            'topics': rng.sample(WORDS, 3),
+            'decisions': [sentence(30) for _ in range(rng.randint(0, 4))],
+            'faqs': [sentence(15) + "?" for _ in range(rng.randint(0, 2))],
+            'raw_text': "\n".join(content_lines),
+        })
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=10000)
+    args = parser.parse_args()
+
+    from app.services.pdf_renderer import render_pdf, layout_items
+    items = synthetic_items(args.items)
+    print(f"Rendering {args.items} synthetic items")
+
+    start = time.perf_counter()
+    layout_items(items, int(os.getenv('EXPORT_PDF_MAX_CONTENT_LINES', '200')))
+    layout_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryFile() as output:
+        start = time.perf_counter()
+        render_pdf(items, output)
+        elapsed = time.perf_counter() - start
+        size = output.tell()
+
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"total {elapsed:7.2f} s  (layout {layout_seconds:.2f} s)  "
+        f"{size / 1e6:7.1f} MB PDF  peak RSS={peak_rss_mb:6.0f} MB"
+    )
+
+
+if __name__ == '__main__':
+    main()
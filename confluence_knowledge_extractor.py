@@ -12,8 +12,10 @@ import re
 import requests
 import html as html_module
 import base64
-from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+import queue
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable
 from urllib.parse import quote
 
 # Configure logging first
@@ -38,7 +40,9 @@ if os.path.exists(backend_path):
         from app.utils.ai_summarization import (
             call_openai_api,
             parse_json_response,
-            format_summary_for_storage
+            format_summary_for_storage,
+            create_embedding,
+            format_article_for_embedding
         )
     except ImportError as e:
         logger.warning(f"Could not import from backend utils: {e}. Using inline implementations.")
@@ -74,6 +78,10 @@ if os.path.exists(backend_path):
             def post(self, table, data):
                 url = f"{self.base_url}/rest/v1/{table}"
                 return requests.post(url, headers=self.headers, json=data)
+            def upsert(self, table, data, on_conflict):
+                url = f"{self.base_url}/rest/v1/{table}"
+                headers = {**self.headers, "Prefer": "resolution=merge-duplicates,return=representation"}
+                return requests.post(url, headers=headers, params={'on_conflict': on_conflict}, json=data)
             def patch(self, table, item_id, data):
                 url = f"{self.base_url}/rest/v1/{table}"
                 headers = {**self.headers, "Prefer": "return=representation"}
@@ -138,6 +146,12 @@ if os.path.exists(backend_path):
                     parts.append(f"{i}. {point}")
                 parts.append("")
             return "\n".join(parts)
+        
+        def create_embedding(text, timeout=30):
+            return None  # Semantic search needs the backend utils
+        
+        def format_article_for_embedding(summary, topics=None, key_points=None, content=''):
+            return summary or ''
 else:
     logger.error("Backend directory not found. Please ensure backend/app/utils exists.")
     sys.exit(1)
@@ -160,7 +174,7 @@ class ConfluencePageExtractor:
     
     def extract_page_data(self, page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Extract relevant data from a Confluence page.
+        Extract relevant data from a Confluence page, including its body.
         
         Args:
             page: Raw page data from Confluence API
@@ -168,19 +182,28 @@ class ConfluencePageExtractor:
         Returns:
             Extracted page data dictionary or None on error
         """
+        article_data = self.extract_page_metadata(page)
+        if article_data is None:
+            return None
+        return self.add_page_content(article_data)
+    
+    def extract_page_metadata(self, page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Extract identity and version data from a Confluence listing entry.
+        
+        Does not fetch the page body, so it is cheap enough to run for every
+        page before deciding whether the page needs syncing at all.
+        
+        Args:
+            page: Raw page data from Confluence API
+            
+        Returns:
+            Page metadata dictionary or None on error
+        """
         try:
             page_id = page.get('id')
             title = page.get('title', 'Untitled')
             
-            # Get page content
-            body_storage = self._fetch_page_content(page_id)
-            
-            # Extract text content for AI processing
-            text_content = extract_text_from_html(body_storage)
-            
-            # Generate initial summary
-            summary = self._generate_initial_summary(text_content, title)
-            
             # Build page URL
             page_url = self._build_page_url(page, page_id, title)
             
@@ -191,7 +214,6 @@ class ConfluencePageExtractor:
             return {
                 'id': page_id,
                 'title': title,
-                'summary': summary,
                 'url': page_url,
                 'author': author,
                 'date': version_info['date'],
@@ -199,13 +221,47 @@ class ConfluencePageExtractor:
                 'version_timestamp': version_info['timestamp'],
                 'version_date': version_info['version_date'],
                 'source': 'confluence',
-                'raw_text': body_storage,
-                'text_content': text_content
+                # Present when the listing was requested with expand=body.storage
+                'listing_body': page.get('body', {}).get('storage', {}).get('value')
             }
         except Exception as e:
             logger.error(f"Error extracting data from page {page.get('id', 'unknown')}: {e}")
             return None
     
+    def add_page_content(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch the page body and add raw_text, text_content and summary.
+        
+        Args:
+            article_data: Page metadata from extract_page_metadata
+            
+        Returns:
+            The same dictionary, updated in place
+        """
+        self.fetch_page_body(article_data)
+        return self.add_text_content(article_data)
+    
+    def fetch_page_body(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Set raw_text, reusing the body from the listing when it was expanded."""
+        body_storage = article_data.pop('listing_body', None)
+        if body_storage is None:
+            body_storage = self._fetch_page_content(article_data['id'])
+        article_data['raw_text'] = body_storage
+        return article_data
+    
+    def add_text_content(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert raw_text HTML to plain text and set the initial summary."""
+        # Extract text content for AI processing
+        text_content = extract_text_from_html(article_data.get('raw_text', ''))
+        
+        # Generate initial summary
+        article_data['summary'] = self._generate_initial_summary(
+            text_content,
+            article_data.get('title', 'Untitled')
+        )
+        article_data['text_content'] = text_content
+        return article_data
+    
     def _fetch_page_content(self, page_id: str) -> str:
         """Fetch page content from Confluence API."""
         try:
@@ -366,6 +422,11 @@ Respond ONLY with valid JSON, no additional text or markdown formatting."""
 class ConfluenceArticleManager:
     """Manages article storage and retrieval in Supabase."""
     
+    # Index rows are paged so the prefetch stays under PostgREST's max-rows cap
+    INDEX_PAGE_SIZE = 1000
+    # Unique index used as the upsert conflict target
+    CONFLICT_KEY = 'source,external_id'
+    
     def __init__(self, supabase_client: SupabaseAPIClient):
         """
         Initialize article manager.
@@ -374,40 +435,70 @@ class ConfluenceArticleManager:
             supabase_client: Supabase API client
         """
         self.supabase = supabase_client
+        self._article_index: Optional[Dict[str, Dict[str, Any]]] = None
     
-    def find_existing_article(self, page_id: str, page_url: str) -> Optional[Dict[str, Any]]:
+    def load_article_index(self) -> Dict[str, Dict[str, Any]]:
         """
-        Find existing article by Confluence page ID.
+        Prefetch a page_id -> article map for all Confluence articles.
+        
+        Reads only the typed ``external_*`` columns (see
+        ``supabase/add_external_id_columns.sql``), never page bodies.
         
-        Args:
-            page_id: Confluence page ID
-            page_url: Confluence page URL
-            
         Returns:
-            Existing article dictionary or None
+            Dictionary mapping Confluence page ID to a dict with
+            id, version, version_date, date and updated_at
         """
+        index: Dict[str, Dict[str, Any]] = {}
         params = {
-            'select': 'id,raw_text,date,updated_at',
-            'source': 'eq.confluence'
+            'select': 'id,external_id,external_version,external_version_date,date,updated_at',
+            'source': 'eq.confluence',
+            'external_id': 'not.is.null',
+            'order': 'id.asc'
         }
         
         try:
-            response = self.supabase.get('knowledge_items', params)
-            if response.status_code != 200:
-                return None
-            
-            items = response.json()
-            for item in items:
-                raw_text = item.get('raw_text', '')
-                if raw_text.startswith('URL:'):
-                    url_line = raw_text.split('\n')[0]
-                    item_url = url_line.replace('URL:', '').strip()
-                    if page_id in item_url or page_id in str(item.get('id', '')):
-                        return item
+            offset = 0
+            while True:
+                page_params = {**params, 'limit': self.INDEX_PAGE_SIZE, 'offset': offset}
+                response = self.supabase.get('knowledge_items', page_params)
+                if response.status_code != 200:
+                    logger.warning(f"Could not load article index: {response.status_code} {response.text}")
+                    break
+                
+                rows = response.json()
+                for row in rows:
+                    index[row['external_id']] = {
+                        'id': row.get('id'),
+                        'version': row.get('external_version'),
+                        'version_date': row.get('external_version_date'),
+                        'date': row.get('date', ''),
+                        'updated_at': row.get('updated_at', '')
+                    }
+                
+                if len(rows) < self.INDEX_PAGE_SIZE:
+                    break
+                offset += self.INDEX_PAGE_SIZE
         except Exception as e:
-            logger.warning(f"Error checking for existing article: {e}")
+            logger.warning(f"Error loading existing article index: {e}")
         
-        return None
+        logger.info(f"Loaded {len(index)} existing Confluence articles")
+        self._article_index = index
+        return index
+    
+    def find_existing_article(self, page_id: str, page_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Find existing article by Confluence page ID.
+        
+        Args:
+            page_id: Confluence page ID
+            page_url: Confluence page URL
+            
+        Returns:
+            Existing article index entry or None
+        """
+        if self._article_index is None:
+            self.load_article_index()
+        return self._article_index.get(str(page_id))
     
     def extract_version_from_raw_text(self, raw_text: str) -> Tuple[Optional[str], Optional[int], Optional[str]]:
         """
@@ -478,10 +569,13 @@ class ConfluenceArticleManager:
             'project': article_data.get('project', ''),
             'sender_name': article_data['author'],
             'raw_text': self.build_raw_text_header(article_data) + article_data.get('raw_text', ''),
+            **self._external_columns(article_data),
         }
+        if article_data.get('embedding'):
+            payload['embedding'] = article_data['embedding']
         
         try:
-            response = self.supabase.post('knowledge_items', payload)
+            response = self.supabase.upsert('knowledge_items', payload, self.CONFLICT_KEY)
             if response.status_code in (200, 201):
                 logger.info(f"✅ Inserted article: {article_data['title']}")
                 return True
@@ -494,16 +588,14 @@ class ConfluenceArticleManager:
     
     def update_article(
         self,
-        article_id: str,
         article_data: Dict[str, Any],
         summary_text: str,
         key_points: List[str]
     ) -> bool:
         """
-        Update existing article in Supabase.
+        Update existing article in Supabase, keyed on its Confluence page ID.
         
         Args:
-            article_id: Article ID
             article_data: Article data dictionary
             summary_text: Formatted summary text
             key_points: List of key points
@@ -513,17 +605,21 @@ class ConfluenceArticleManager:
         """
         payload = {
             'summary': summary_text,
+            'source': 'confluence',
             'date': article_data['date'],
             'sender_name': article_data['author'],
             'raw_text': self.build_raw_text_header(article_data) + article_data.get('raw_text', ''),
             'key_points': key_points,
             'decisions': [],
             'action_items': [],
+            **self._external_columns(article_data),
         }
+        if article_data.get('embedding'):
+            payload['embedding'] = article_data['embedding']
         
         try:
-            response = self.supabase.patch('knowledge_items', article_id, payload)
-            if response.status_code in (200, 204):
+            response = self.supabase.upsert('knowledge_items', payload, self.CONFLICT_KEY)
+            if response.status_code in (200, 201, 204):
                 logger.info(f"🔄 Updated article: {article_data['title']}")
                 return True
             else:
@@ -533,6 +629,14 @@ class ConfluenceArticleManager:
             logger.error(f"Error updating article: {e}")
             return False
     
+    def _external_columns(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the typed external identity/version columns for a page."""
+        return {
+            'external_id': str(article_data.get('id', '')),
+            'external_version': article_data.get('version', 1),
+            'external_version_date': article_data.get('version_date') or None,
+        }
+    
     def should_update_article(
         self,
         existing: Dict[str, Any],
@@ -542,16 +646,14 @@ class ConfluenceArticleManager:
         Determine if article should be updated based on version comparison.
         
         Args:
-            existing: Existing article data
+            existing: Existing article index entry
             current_data: Current article data
             
         Returns:
             True if update needed, False otherwise
         """
-        existing_raw_text = existing.get('raw_text', '')
-        existing_page_id, existing_version, existing_version_date = (
-            self.extract_version_from_raw_text(existing_raw_text)
-        )
+        existing_version = existing.get('version')
+        existing_version_date = existing.get('version_date')
         
         current_version = current_data.get('version', 1)
         current_version_date = current_data.get('version_date', '')
@@ -564,9 +666,12 @@ class ConfluenceArticleManager:
                     f"for page {current_data.get('id')}"
                 )
                 return True
-            elif current_version == existing_version and current_version_date != existing_version_date:
-                logger.info(f"Version date changed for page {current_data.get('id')}")
-                return True
+            elif current_version == existing_version:
+                if self._version_date_changed(existing_version_date, current_version_date):
+                    logger.info(f"Version date changed for page {current_data.get('id')}")
+                    return True
+                # Same version number and date: the page is unchanged
+                return False
         
         # Fallback: compare dates
         existing_date = existing.get('date', '')
@@ -580,15 +685,221 @@ class ConfluenceArticleManager:
             if existing_updated:
                 try:
                     existing_updated_dt = parse_iso_date(existing_updated)
-                    current_timestamp = current_data.get('version_timestamp', datetime.now().timestamp())
-                    current_dt = datetime.fromtimestamp(current_timestamp)
+                    if existing_updated_dt.tzinfo is None:
+                        existing_updated_dt = existing_updated_dt.replace(tzinfo=timezone.utc)
+                    current_timestamp = current_data.get('version_timestamp', datetime.now(timezone.utc).timestamp())
+                    current_dt = datetime.fromtimestamp(current_timestamp, tz=timezone.utc)
                     if current_dt > existing_updated_dt:
                         logger.info(f"Content updated for page {current_data.get('id')}")
                         return True
-                except Exception:
+                except (TypeError, ValueError, OverflowError, OSError) as e:
+                    logger.warning(f"Could not compare updated_at for page {current_data.get('id')}: {e}")
                     return True
         
         return False
+    
+    def _version_date_changed(self, existing_date: Optional[str], current_date: str) -> bool:
+        """Compare version timestamps by instant, not by string formatting."""
+        if not existing_date or not current_date:
+            return bool(current_date) and current_date != existing_date
+        return parse_iso_date(current_date) != parse_iso_date(existing_date)
+
+
+class StagePipeline:
+    """
+    Bounded-concurrency pipeline of processing stages.
+    
+    Each stage runs a fixed number of worker threads and hands jobs to the
+    next stage through a bounded queue, so a slow stage (e.g. OpenAI) applies
+    backpressure to the stages feeding it instead of letting work pile up.
+    A job whose stage raises is marked with action "error" and passed
+    through the remaining stages untouched.
+    """
+    
+    _DONE = object()
+    
+    def __init__(
+        self,
+        stages: List[Tuple[str, Callable[[Dict[str, Any]], Dict[str, Any]], int]],
+        queue_size: int = 16
+    ):
+        """
+        Initialize pipeline.
+        
+        Args:
+            stages: List of (name, function, worker count) tuples
+            queue_size: Maximum number of jobs waiting between two stages
+        """
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+    
+    def run(self, jobs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Push jobs through all stages and return them once finished.
+        
+        Args:
+            jobs: Jobs to process
+            
+        Returns:
+            Finished jobs, in completion order
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        results: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        outputs = queues[1:] + [results]
+        
+        workers = []
+        for (name, func, count), inbox, outbox in zip(self.stages, queues, outputs):
+            stage_workers = [
+                threading.Thread(
+                    target=self._work,
+                    args=(name, func, inbox, outbox),
+                    name=f"pipeline-{name}-{i}",
+                    daemon=True
+                )
+                for i in range(max(1, count))
+            ]
+            for thread in stage_workers:
+                thread.start()
+            workers.append(stage_workers)
+        
+        for job in jobs:
+            queues[0].put(job)
+        
+        # Drain stage by stage: once a stage's workers exit, stop the next stage
+        for i, stage_workers in enumerate(workers):
+            for _ in stage_workers:
+                queues[i].put(self._DONE)
+            for thread in stage_workers:
+                thread.join()
+        
+        finished = []
+        while not results.empty():
+            finished.append(results.get())
+        return finished
+    
+    def _work(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Dict[str, Any]],
+        inbox: queue.Queue,
+        outbox: queue.Queue
+    ):
+        """Worker loop: process jobs from inbox until the stop marker arrives."""
+        while True:
+            job = inbox.get()
+            if job is self._DONE:
+                return
+            if job.get('action') != "error":
+                try:
+                    job = func(job)
+                except Exception as e:
+                    page_id = job.get('article_data', {}).get('id', 'unknown')
+                    logger.error(f"Pipeline stage '{name}' failed for page {page_id}: {e}")
+                    job['action'] = "error"
+            outbox.put(job)
+
+
+def parse_page_modified(when: Optional[str]) -> Optional[datetime]:
+    """Parse a page's version.when into a timezone-aware datetime (None if missing/invalid)."""
+    if not when:
+        return None
+    try:
+        modified_at = datetime.fromisoformat(when.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return modified_at if modified_at.tzinfo else modified_at.replace(tzinfo=timezone.utc)
+
+
+def next_sync_cursor(
+    last_synced_at: Optional[datetime],
+    run_started_at: datetime,
+    pages: List[Dict[str, Any]],
+    failed_versions: List[Optional[str]],
+    listing_complete: bool
+) -> Optional[datetime]:
+    """
+    Decide where the next incremental sync should start.
+    
+    A complete run without failures resumes from when it started. Otherwise
+    everything before the earliest failed page is synced, and so is, for an
+    incremental listing (oldest change first) cut short by CONFLUENCE_LIMIT,
+    everything up to its last page. A full listing cut short says nothing
+    about the pages it missed, so it records no cursor.
+    
+    Args:
+        last_synced_at: Cursor the run started from (None for a full sync)
+        run_started_at: When the run started
+        pages: Pages listed by the run
+        failed_versions: version.when of every page that failed to sync
+        listing_complete: Whether every changed page was listed
+        
+    Returns:
+        New cursor, or None to keep the current one
+    """
+    if listing_complete and not failed_versions:
+        return run_started_at
+    if not listing_complete and last_synced_at is None:
+        return None
+    
+    if failed_versions:
+        failed_at = [parse_page_modified(when) for when in failed_versions]
+        if None in failed_at:
+            return None
+        resume_at = min(failed_at)
+    else:
+        resume_at = parse_page_modified(pages[-1].get('version', {}).get('when')) if pages else None
+    
+    if resume_at is None or (last_synced_at and resume_at <= last_synced_at):
+        return None
+    return min(resume_at, run_started_at)
+
+
+class ConfluenceSyncState:
+    """Persists the per-space high-water mark for incremental syncs."""
+    
+    def __init__(self, path: str):
+        """
+        Initialize sync state.
+        
+        Args:
+            path: Path of the JSON state file
+        """
+        self.path = path
+    
+    def _load(self) -> Dict[str, Any]:
+        """Load the state file, returning an empty state if missing or invalid."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read sync state {self.path}: {e}")
+            return {}
+    
+    def get_cursor(self, space_key: str) -> Optional[datetime]:
+        """Return the last successful sync time for a space, if any."""
+        value = self._load().get('spaces', {}).get(space_key, {}).get('last_synced_at')
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            logger.warning(f"Ignoring invalid sync cursor for {space_key}: {value}")
+            return None
+    
+    def set_cursor(self, space_key: str, synced_at: datetime):
+        """Atomically record a successful sync time for a space."""
+        state = self._load()
+        state.setdefault('spaces', {}).setdefault(space_key, {})['last_synced_at'] = synced_at.isoformat()
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_path, self.path)
+            logger.info(f"Sync cursor for {space_key} advanced to {synced_at.isoformat()}")
+        except OSError as e:
+            logger.error(f"Could not write sync state {self.path}: {e}")
 
 
 class ConfluenceKnowledgeExtractor:
@@ -612,9 +923,22 @@ class ConfluenceKnowledgeExtractor:
         self.confluence_api_token = os.getenv('CONFLUENCE_API_TOKEN')
         self.space_key = os.getenv('CONFLUENCE_SPACE_KEY')
         self.limit = int(os.getenv('CONFLUENCE_LIMIT', '50'))
+        self.full_sync = os.getenv('CONFLUENCE_FULL_SYNC', 'false').lower() in ('1', 'true', 'yes')
+        self.state_file = os.getenv(
+            'CONFLUENCE_STATE_FILE',
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), 'confluence-sync-state.json')
+        )
+        self.sync_overlap_hours = int(os.getenv('CONFLUENCE_SYNC_OVERLAP_HOURS', '24'))
+        self.fetch_workers = int(os.getenv('CONFLUENCE_FETCH_WORKERS', '4'))
+        self.text_workers = int(os.getenv('CONFLUENCE_TEXT_WORKERS', '2'))
+        self.summary_workers = int(os.getenv('CONFLUENCE_SUMMARY_WORKERS', '4'))
+        self.write_workers = int(os.getenv('CONFLUENCE_WRITE_WORKERS', '2'))
+        self.pipeline_queue_size = int(os.getenv('CONFLUENCE_PIPELINE_QUEUE_SIZE', '16'))
         self.supabase_url = os.getenv('SUPABASE_URL')
         self.supabase_key = os.getenv('SUPABASE_ANON_KEY')
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
+        # Embeddings for the AI assistant's semantic search (needs OpenAI)
+        self.embed_articles = bool(self.openai_api_key) and os.getenv('EMBED_ARTICLES', 'true').lower() != 'false'
     
     def _validate_environment(self):
         """Validate required environment variables."""
@@ -653,16 +977,27 @@ class ConfluenceKnowledgeExtractor:
         self.page_extractor = ConfluencePageExtractor(self.confluence_client, self.space_key)
         self.ai_summarizer = ConfluenceAISummarizer(self.openai_api_key)
         self.article_manager = ConfluenceArticleManager(self.supabase_client)
+        self.sync_state = ConfluenceSyncState(self.state_file)
     
-    def fetch_confluence_pages(self) -> List[Dict[str, Any]]:
-        """Fetch pages from the specified Confluence space."""
+    def fetch_confluence_pages(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Fetch every page in the specified Confluence space.
+        
+        The full listing is not capped by CONFLUENCE_LIMIT: it bootstraps
+        the incremental cursor, which is only recorded once the whole space
+        has been listed.
+        
+        Returns:
+            Tuple of (pages, complete) where complete is False if the
+            listing was cut short by an error
+        """
         logger.info(f"Fetching pages from Confluence space: {self.space_key}")
         
         all_pages = []
         start = 0
         limit = min(self.limit, 50)  # Confluence API limit
         
-        while len(all_pages) < self.limit:
+        while True:
             params = {
                 'spaceKey': self.space_key,
                 'limit': limit,
@@ -672,25 +1007,89 @@ class ConfluenceKnowledgeExtractor:
             
             try:
                 data = self.confluence_client.call_api('content', params)
-                pages = data.get('results', [])
-                
-                if not pages:
-                    break
-                
-                all_pages.extend(pages)
-                logger.info(f"Fetched {len(pages)} pages (total: {len(all_pages)})")
-                
-                # Check if there are more pages
-                if len(all_pages) >= data.get('size', 0) or not data.get('_links', {}).get('next'):
-                    break
-                
-                start += limit
             except Exception as e:
                 logger.error(f"Error fetching pages: {e}")
+                logger.warning("Page listing incomplete; the sync cursor will not be recorded")
+                return (all_pages, False)
+            
+            pages = data.get('results', [])
+            all_pages.extend(pages)
+            logger.info(f"Fetched {len(pages)} pages (total: {len(all_pages)})")
+            
+            # Check if there are more pages
+            if not pages or not data.get('_links', {}).get('next'):
                 break
+            
+            start += len(pages)
         
         logger.info(f"Total pages fetched: {len(all_pages)}")
-        return all_pages[:self.limit]
+        return (all_pages, True)
+    
+    def fetch_modified_pages(self, since: datetime) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Fetch pages modified since a point in time using CQL.
+        
+        Bodies are expanded in the listing, so changed pages need no
+        per-page content request. Pages are listed oldest change first, so a
+        listing cut short still covers everything up to its last page.
+        
+        Args:
+            since: Only pages modified at or after this time are listed
+            
+        Returns:
+            Tuple of (pages, complete) where complete is False if the
+            listing was cut short by CONFLUENCE_LIMIT or an error
+        """
+        # CQL compares at minute granularity in the API user's timezone, so
+        # step back by a safety overlap; pages the overlap re-lists from
+        # before `since` are dropped using their exact version timestamp, so
+        # they don't count towards CONFLUENCE_LIMIT.
+        cursor = since - timedelta(hours=self.sync_overlap_hours)
+        cql = (
+            f'space = "{self.space_key}" and type = page '
+            f'and lastmodified >= "{cursor.strftime("%Y/%m/%d %H:%M")}" '
+            'order by lastmodified asc'
+        )
+        logger.info(f"Fetching pages modified since {cursor.isoformat()} (CQL: {cql})")
+        
+        all_pages = []
+        start = 0
+        limit = min(self.limit, 50)  # Confluence API limit
+        
+        while True:
+            params = {
+                'cql': cql,
+                'limit': limit,
+                'start': start,
+                'expand': 'body.storage,version,history,space'
+            }
+            
+            try:
+                data = self.confluence_client.call_api('content/search', params)
+            except Exception as e:
+                logger.error(f"Error fetching modified pages: {e}")
+                return (all_pages, False)
+            
+            pages = data.get('results', [])
+            for page in pages:
+                modified_at = parse_page_modified(page.get('version', {}).get('when'))
+                if modified_at is None or modified_at >= since:
+                    all_pages.append(page)
+            logger.info(f"Fetched {len(pages)} modified pages (total: {len(all_pages)})")
+            
+            if len(all_pages) >= self.limit and (len(all_pages) > self.limit or data.get('_links', {}).get('next')):
+                logger.warning(
+                    f"Modified page listing truncated at CONFLUENCE_LIMIT={self.limit}; "
+                    "sync cursor advances to the last synced page"
+                )
+                return (all_pages[:self.limit], False)
+            if not pages or not data.get('_links', {}).get('next'):
+                break
+            
+            start += limit
+        
+        logger.info(f"Total modified pages fetched: {len(all_pages)}")
+        return (all_pages, True)
     
     def _generate_summary_data(
         self,
@@ -717,49 +1116,121 @@ class ConfluenceKnowledgeExtractor:
         
         return (summary_text, key_points)
     
-    def save_article(self, article_data: Dict[str, Any]) -> bool:
+    def save_article(self, article_data: Dict[str, Any]) -> Tuple[bool, str]:
         """
         Save article to Supabase (insert or update).
         
+        The page body is fetched only after the version check, if
+        article_data came from extract_page_metadata.
+        
         Args:
             article_data: Article data dictionary
             
         Returns:
-            True if successful, False otherwise
+            Tuple of (success, action) where action is one of
+            "inserted", "updated", "skipped" or "error"
         """
+        job = self._plan_sync(article_data)
+        if job['action']:
+            return (job['action'] != "error", job['action'])
+        
+        if 'raw_text' not in article_data:
+            self.page_extractor.add_page_content(article_data)
+        self._summarize_job(job)
+        self._write_job(job)
+        return (job['action'] != "error", job['action'])
+    
+    def _plan_sync(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Look up the existing article and decide whether the page needs syncing.
+        
+        Decides on the version alone so unchanged pages cost no body fetch
+        or AI call.
+        
+        Returns:
+            Sync job dictionary; its action is already set for skipped or
+            invalid pages and None for pages that need syncing
+        """
+        job = {'article_data': article_data, 'existing': None, 'action': None}
+        
         page_id = article_data.get('id')
         if not page_id:
             logger.error("Article data missing page ID")
-            return False
+            job['action'] = "error"
+            return job
         
         page_url = article_data.get('url', '')
         existing = self.article_manager.find_existing_article(page_id, page_url)
+        job['existing'] = existing
         
-        # Generate summary
-        summary_text, key_points = self._generate_summary_data(article_data)
-        
-        if existing:
-            if self.article_manager.should_update_article(existing, article_data):
-                return self.article_manager.update_article(
-                    existing['id'],
-                    article_data,
-                    summary_text,
-                    key_points
-                )
-            else:
-                logger.info(
-                    f"⏭️  Skipping page {page_id} ({article_data.get('title', 'Unknown')}) - "
-                    "no changes detected"
-                )
-                return True  # Not an error, just no update needed
+        if existing and not self.article_manager.should_update_article(existing, article_data):
+            logger.info(
+                f"⏭️  Skipping page {page_id} ({article_data.get('title', 'Unknown')}) - "
+                "no changes detected"
+            )
+            job['action'] = "skipped"  # Not an error, just no update needed
+        return job
+    
+    def _fetch_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch the page body for a sync job."""
+        self.page_extractor.fetch_page_body(job['article_data'])
+        return job
+    
+    def _text_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert the page body to plain text for a sync job."""
+        self.page_extractor.add_text_content(job['article_data'])
+        return job
+    
+    def _summarize_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate summary, key points and (optionally) the embedding for a sync job."""
+        article_data = job['article_data']
+        job['summary_text'], job['key_points'] = self._generate_summary_data(article_data)
+        if self.embed_articles:
+            article_data['embedding'] = create_embedding(format_article_for_embedding(
+                f"{article_data.get('title', '')}\n{job['summary_text']}",
+                key_points=job['key_points'],
+                content=article_data.get('text_content', '')
+            ))
+        return job
+    
+    def _write_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert or update the article for a sync job and record the action."""
+        article_data = job['article_data']
+        if job['existing']:
+            success = self.article_manager.update_article(
+                article_data,
+                job['summary_text'],
+                job['key_points']
+            )
+            job['action'] = "updated" if success else "error"
         else:
             # Set project from space_key
             article_data['project'] = self.space_key
-            return self.article_manager.insert_article(
+            success = self.article_manager.insert_article(
                 article_data,
-                summary_text,
-                key_points
+                job['summary_text'],
+                job['key_points']
             )
+            job['action'] = "inserted" if success else "error"
+        return job
+    
+    def _sync_pages(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run sync jobs through the fetch -> text -> summarize -> write pipeline.
+        
+        Each stage has its own worker limit so Confluence and OpenAI
+        concurrency stay within their rate limits.
+        """
+        pipeline = StagePipeline(
+            stages=[
+                ('fetch', self._fetch_job, self.fetch_workers),
+                ('text', self._text_job, self.text_workers),
+                ('summarize', self._summarize_job, self.summary_workers),
+                ('write', self._write_job, self.write_workers),
+            ],
+            queue_size=self.pipeline_queue_size
+        )
+        return pipeline.run(jobs)
     
     def run_extraction_workflow(self) -> bool:
         """Execute the complete extraction workflow."""
@@ -768,10 +1239,19 @@ class ConfluenceKnowledgeExtractor:
             logger.info("Starting Confluence Knowledge Extraction Workflow")
             logger.info("=" * 60)
             
-            # Fetch pages
-            pages = self.fetch_confluence_pages()
+            # Fetch pages: incremental from the last successful sync when possible
+            run_started_at = datetime.now(timezone.utc)
+            last_synced_at = None if self.full_sync else self.sync_state.get_cursor(self.space_key)
+            if last_synced_at:
+                pages, listing_complete = self.fetch_modified_pages(last_synced_at)
+            else:
+                logger.info("No sync cursor (or CONFLUENCE_FULL_SYNC set) - running full sync")
+                pages, listing_complete = self.fetch_confluence_pages()
+            
             if not pages:
-                logger.warning("No pages found in Confluence space")
+                logger.info("No new or modified pages found in Confluence space")
+                if listing_complete:
+                    self.sync_state.set_cursor(self.space_key, run_started_at)
                 return True
             
             # Process each page
@@ -783,45 +1263,48 @@ class ConfluenceKnowledgeExtractor:
                 'errors': 0
             }
             
+            # Load existing articles once for the whole run
+            self.article_manager.load_article_index()
+            
+            pending_jobs = []
+            failed_versions: List[Optional[str]] = []  # version dates of failed pages
             for page in pages:
                 stats['processed'] += 1
                 
-                article_data = self.page_extractor.extract_page_data(page)
+                article_data = self.page_extractor.extract_page_metadata(page)
                 if not article_data:
                     stats['errors'] += 1
+                    failed_versions.append(page.get('version', {}).get('when'))
                     continue
                 
-                page_id = article_data.get('id', '')
-                page_url = article_data.get('url', '')
-                existing = self.article_manager.find_existing_article(page_id, page_url)
-                
-                success = self.save_article(article_data)
-                if success:
-                    if not existing:
-                        stats['inserted'] += 1
-                    else:
-                        # Check if it was updated or skipped
-                        existing_raw_text = existing.get('raw_text', '')
-                        existing_page_id, existing_version, existing_version_date = (
-                            self.article_manager.extract_version_from_raw_text(existing_raw_text)
-                        )
-                        current_version = article_data.get('version', 1)
-                        
-                        if existing_version is not None and current_version is not None:
-                            if current_version > existing_version:
-                                stats['updated'] += 1
-                            else:
-                                stats['skipped'] += 1
-                        else:
-                            # Fallback: check dates
-                            existing_date = existing.get('date', '')
-                            current_date = article_data.get('date', '')
-                            if current_date > existing_date:
-                                stats['updated'] += 1
-                            else:
-                                stats['skipped'] += 1
+                job = self._plan_sync(article_data)
+                if job['action'] == "error":
+                    stats['errors'] += 1
+                    failed_versions.append(article_data.get('version_date'))
+                elif job['action']:
+                    stats[job['action']] += 1
+                else:
+                    pending_jobs.append(job)
+            
+            logger.info(f"{len(pending_jobs)} new or changed pages to sync")
+            for job in self._sync_pages(pending_jobs):
+                if job['action'] in ("inserted", "updated"):
+                    stats[job['action']] += 1
                 else:
                     stats['errors'] += 1
+                    failed_versions.append(job['article_data'].get('version_date'))
+            
+            next_cursor = next_sync_cursor(
+                last_synced_at,
+                run_started_at,
+                pages,
+                failed_versions,
+                listing_complete
+            )
+            if next_cursor:
+                self.sync_state.set_cursor(self.space_key, next_cursor)
+            else:
+                logger.warning("Sync cursor not advanced; the next run will retry from the previous cursor")
             
             # Log statistics
             logger.info("=" * 60)
@@ -123,6 +123,23 @@ export async function exportItems(format: 'csv' | 'pdf', items: any[], filename
   return res.json();
 }
 
+// PDF export as a binary download (no hex-in-JSON round trip)
+export async function exportItemsPdf(items: any[], filename = 'knowledge') {
+  const backend = process.env.NEXT_PUBLIC_BACKEND_URL;
+  if (!backend) {
+    throw new Error('Backend URL is not configured. Please check your environment variables.');
+  }
+  const headers = await getAuthHeaders();
+  const res = await fetch(`${backend}/export/pdf`, {
+    method: 'POST',
+    headers,
+    body: JSON.stringify({ filename, items })
+  });
+  if (res.status === 401) throw new Error('Authentication failed. Please log in again.');
+  if (!res.ok) throw new Error('Failed to export');
+  return res.blob();
+}
+
 // ============================================================================
 // User Management API (Admin Only)
 // ============================================================================
@@ -378,3 +395,91 @@ export async function askAIQuestion(question: string) {
   }
 }
 
+
+type AIArticleLink = { id: string; title: string; url: string };
+
+type AIStreamHandlers = {
+  onArticles?: (articleLinks: AIArticleLink[]) => void;
+  onToken?: (text: string) => void;
+};
+
+/**
+ * Ask a question via the streaming endpoint (Server-Sent Events).
+ * Calls onArticles as soon as search completes and onToken for each answer
+ * fragment; resolves with the final response, whose answer (normalized for
+ * rejections) replaces the streamed text.
+ */
+export async function askAIQuestionStream(question: string, handlers: AIStreamHandlers = {}) {
+  const backend = process.env.NEXT_PUBLIC_BACKEND_URL;
+  if (!backend) {
+    throw new Error('Backend URL is not configured. Please check your environment variables.');
+  }
+
+  const controller = new AbortController();
+  const timeoutId = setTimeout(() => controller.abort(), 90000);
+
+  try {
+    const res = await fetch(`${backend}/api/ai/ask/stream`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({ question }),
+      signal: controller.signal,
+    });
+
+    if (!res.ok || !res.body) {
+      const error = await res.json().catch(() => ({ detail: res.statusText }));
+      if (res.status === 400) {
+        throw new Error(error.detail || 'Invalid question. Please provide a valid question.');
+      }
+      throw new Error(error.detail || `Failed to get AI response (${res.status})`);
+    }
+
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let result: any = null;
+
+    while (result === null) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      // Events are separated by a blank line
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const rawEvent = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+
+        let event = 'message';
+        let data = '';
+        for (const line of rawEvent.split('\n')) {
+          if (line.startsWith('event:')) event = line.slice(6).trim();
+          else if (line.startsWith('data:')) data += line.slice(5).trim();
+        }
+        const payload = data ? JSON.parse(data) : {};
+
+        if (event === 'articles') handlers.onArticles?.(payload.article_links || []);
+        else if (event === 'token') handlers.onToken?.(payload.text || '');
+        else if (event === 'done') result = payload;
+        else if (event === 'error') throw new Error(payload.detail || 'Failed to get AI response');
+      }
+    }
+
+    if (result === null) {
+      throw new Error('The AI response ended unexpectedly. Please try again.');
+    }
+    return result;
+  } catch (err: any) {
+    if (err.name === 'AbortError') {
+      throw new Error('Request timed out. The AI response is taking too long. Please try again with a simpler question.');
+    }
+    if (err.name === 'TypeError' && err.message.includes('fetch')) {
+      throw new Error('Cannot connect to backend server. Please ensure the backend is running on port 8080.');
+    }
+    throw err;
+  } finally {
+    clearTimeout(timeoutId);
+  }
+}
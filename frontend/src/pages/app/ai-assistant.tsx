@@ -2,7 +2,7 @@ import { useState } from 'react';
 import { useRouter } from 'next/router';
 import styled from 'styled-components';
 import MainMenu from '../../components/MainMenu';
-import { askAIQuestion } from '../../lib/api';
+import { askAIQuestionStream } from '../../lib/api';
 import Link from 'next/link';
 
 const Container = styled.div`
@@ -250,17 +250,18 @@ export default function AIAssistant() {
     return html;
   };
 
-  const handleSubmit = async (e: React.FormEvent) => {
-    e.preventDefault();
-    if (!question.trim() || loading) return;
-
+  // Stream the answer: article links arrive after search, then answer tokens
+  const ask = async (text: string) => {
     setLoading(true);
     setError(null);
     setAnswer(null);
     setArticleLinks([]);
 
     try {
-      const response = await askAIQuestion(question.trim());
+      const response = await askAIQuestionStream(text, {
+        onArticles: (links) => setArticleLinks(links),
+        onToken: (token) => setAnswer((prev) => (prev || '') + token),
+      });
       setAnswer(response.answer);
       setArticleLinks(response.article_links || []);
     } catch (err: any) {
@@ -273,25 +274,15 @@ export default function AIAssistant() {
     }
   };
 
+  const handleSubmit = async (e: React.FormEvent) => {
+    e.preventDefault();
+    if (!question.trim() || loading) return;
+    await ask(question.trim());
+  };
+
   const handleExampleClick = async (exampleQuestion: string) => {
     setQuestion(exampleQuestion);
-    setLoading(true);
-    setError(null);
-    setAnswer(null);
-    setArticleLinks([]);
-
-    try {
-      const response = await askAIQuestion(exampleQuestion);
-      setAnswer(response.answer);
-      setArticleLinks(response.article_links || []);
-    } catch (err: any) {
-      setError(
-        err.message || 
-        'Failed to get AI response. Please try again or check if the backend is running.'
-      );
-    } finally {
-      setLoading(false);
-    }
+    await ask(exampleQuestion);
   };
 
   return (
@@ -342,12 +333,12 @@ export default function AIAssistant() {
           </ErrorMessage>
         )}
 
-        {answer && (
+        {(answer || articleLinks.length > 0) && (
           <ResponseCard>
             <ResponseTitle>
               💡 AI Answer
             </ResponseTitle>
-            <AnswerText dangerouslySetInnerHTML={{ __html: parseMarkdownLinks(answer) }} />
+            <AnswerText dangerouslySetInnerHTML={{ __html: parseMarkdownLinks(answer || (loading ? 'Thinking…' : '')) }} />
             
             {articleLinks.length > 0 && (
               <ArticlesSection>
@@ -3,6 +3,7 @@ import styled from 'styled-components';
 import { supabase } from '../../lib/supabaseClient';
 import Link from 'next/link';
 import MainMenu from '../../components/MainMenu';
+import { exportItemsPdf } from '../../lib/api';
 
 // Decode HTML entities
 const decodeHtmlEntities = (text: string): string => {
@@ -512,6 +513,7 @@ export default function Dashboard() {
     topics: 0
   });
   const [knowledgeItems, setKnowledgeItems] = useState<any[]>([]);
+  const [exportingPdf, setExportingPdf] = useState(false);
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedProject, setSelectedProject] = useState('all');
   const [selectedTopic, setSelectedTopic] = useState('all');
@@ -609,6 +611,26 @@ export default function Dashboard() {
     window.URL.revokeObjectURL(url);
   };
 
+  const handleExportPDF = async () => {
+    setExportingPdf(true);
+    try {
+      // The PDF is rendered server-side; embeddings aren't part of it
+      const items = filteredItems.map(({ embedding, ...item }) => item);
+      const blob = await exportItemsPdf(items, 'knowledge-base-export');
+      const url = window.URL.createObjectURL(blob);
+      const a = document.createElement('a');
+      a.href = url;
+      a.download = 'knowledge-base-export.pdf';
+      a.click();
+      window.URL.revokeObjectURL(url);
+    } catch (error: any) {
+      console.error('Error exporting PDF:', error);
+      alert(error.message || 'Failed to export PDF');
+    } finally {
+      setExportingPdf(false);
+    }
+  };
+
   return (
     <>
       <MainMenu />
@@ -624,6 +646,9 @@ export default function Dashboard() {
             <ExportButton onClick={handleExportCSV}>
               📥 Export CSV
             </ExportButton>
+            <ExportButton onClick={handleExportPDF} disabled={exportingPdf}>
+              📄 {exportingPdf ? 'Exporting…' : 'Export PDF'}
+            </ExportButton>
             <NewArticleButton href="/app/items/new">
               ➕ New Article
             </NewArticleButton>
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Load test for POST /api/ai/ask against local OpenAI and PostgREST stubs.
+
+Starts a stub server that answers chat completions, embeddings and
+knowledge_items queries after a fixed delay, runs the FastAPI app under uvicorn pointed at
+it, then fires concurrent questions while polling /health. If the endpoint
+blocked the event loop, total time would grow with the number of questions
+and /health would stall behind them.
+
+Usage:
+    python3 load_test_ai_ask.py [--questions 50] [--openai-ms 300] [--db-ms 50] [--stream]
+"""
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import threading
+import statistics
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import uvicorn
+
+STUB_ARTICLE = {
+    'id': '00000000-0000-0000-0000-000000000001',
+    'summary': 'Dashboard status',
+    'topics': ['dashboard'],
+    'key_points': ['Dashboard redesign shipped'],
+    'raw_text': 'Dashboard discussion',
+    'source': 'slack',
+    'created_at': '2025-01-01T00:00:00+00:00',
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Stand-in for both the OpenAI chat API and Supabase PostgREST."""
+
+    protocol_version = 'HTTP/1.1'
+    openai_delay = 0.3
+    db_delay = 0.05
+    token_delay = 0.05
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _send_json(self, payload, status=200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        time.sleep(self.db_delay)
+        if self.path.startswith('/rest/v1/knowledge_items'):
+            self._send_json([STUB_ARTICLE])
+        else:
+            self._send_json([])
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        if self.path.startswith('/rest/v1/rpc/'):  # semantic, full-text and fuzzy search
+            time.sleep(self.db_delay)
+            self._send_json([{**STUB_ARTICLE, 'rank': 0.5}])
+            return
+        time.sleep(self.openai_delay)
+        if self.path.endswith('/embeddings'):
+            self._send_json({'data': [{'embedding': [0.01] * request.get('dimensions', 1536)}]})
+            return
+        prompt = request.get('messages', [{}])[-1].get('content', '')
+        if 'Extract the most relevant keywords' in prompt:
+            content = 'dashboard, status'
+        else:
+            content = f"[{STUB_ARTICLE['summary']}](http://localhost:3000/app/items/{STUB_ARTICLE['id']})"
+        if request.get('stream'):
+            self._send_stream(content)
+        else:
+            self._send_json({'choices': [{'message': {'content': content}}]})
+
+    def _send_stream(self, content):
+        """Chat completion as SSE chunks; the delay is spread over the tokens."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        tokens = content.split(' ')
+        for i, token in enumerate(tokens):
+            text = token if i == 0 else f' {token}'
+            chunk = {'choices': [{'delta': {'content': text}}]}
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+            time.sleep(self.token_delay)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 resets connections under concurrent load
+    request_queue_size = 256
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def run_load(base_url: str, questions: int, stream: bool = False):
+    """Fire concurrent questions while polling /health; print latency stats."""
+    health_latencies = []
+    first_event_latencies = []
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        async def poll_health():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get('/health')
+                health_latencies.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.05)
+
+        async def ask(i: int) -> float:
+            start = time.perf_counter()
+            question = {'question': f'What is the status of dashboard {i}?'}
+            if not stream:
+                response = await client.post('/api/ai/ask', json=question)
+                response.raise_for_status()
+                return (time.perf_counter() - start) * 1000
+            async with client.stream('POST', '/api/ai/ask/stream', json=question) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if line.startswith('event: articles'):
+                        first_event_latencies.append((time.perf_counter() - start) * 1000)
+                    elif line.startswith('event: error'):
+                        raise RuntimeError('stream reported an error')
+            return (time.perf_counter() - start) * 1000
+
+        poller = asyncio.create_task(poll_health())
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(ask(i) for i in range(questions)))
+        total = time.perf_counter() - start
+        done.set()
+        await poller
+
+    latencies.sort()
+    print(f"{questions} concurrent questions finished in {total:.2f} s")
+    print(f"  /api/ai/ask  p50={statistics.median(latencies):8.1f} ms  max={latencies[-1]:8.1f} ms")
+    if first_event_latencies:
+        first_event_latencies.sort()
+        print(f"  first event  p50={statistics.median(first_event_latencies):8.1f} ms  max={first_event_latencies[-1]:8.1f} ms")
+    print(f"  /health      p50={statistics.median(health_latencies):8.1f} ms  max={max(health_latencies):8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--questions', type=int, default=50)
+    parser.add_argument('--openai-ms', type=float, default=300.0, help='stub OpenAI latency')
+    parser.add_argument('--db-ms', type=float, default=50.0, help='stub PostgREST latency')
+    parser.add_argument('--stream', action='store_true', help='use /api/ai/ask/stream')
+    args = parser.parse_args()
+
+    StubHandler.openai_delay = args.openai_ms / 1000
+    StubHandler.db_delay = args.db_ms / 1000
+    stub = StubServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    stub_url = f"http://127.0.0.1:{stub.server_port}"
+
+    os.environ.update({
+        'SUPABASE_URL': stub_url,
+        'SUPABASE_SERVICE_ROLE_KEY': 'stub-service-role-key',
+        'OPENAI_API_KEY': 'sk-stub',
+        'OPENAI_BASE_URL': f"{stub_url}/v1",
+    })
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+    from app.main import app  # noqa: E402
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host='127.0.0.1', port=port, log_level='warning'))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    print(f"Stub latency: OpenAI {args.openai_ms:.0f} ms, PostgREST {args.db_ms:.0f} ms")
+    asyncio.run(run_load(f"http://127.0.0.1:{port}", args.questions, args.stream))
+
+    server.should_exit = True
+    stub.shutdown()
+
+
+if __name__ == '__main__':
+    main()
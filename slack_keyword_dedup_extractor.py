@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 Slack Keyword Dedup Extractor
-- Loads keywords/key phrases from backend and frontend README files
+- Loads keywords/key phrases from backend and frontend README files and
+  existing article topics (shared, cached keyword index)
 - Fetches Slack messages from specified channel(s)
 - Matches messages containing any keyword/phrase (no formatting)
 - Deduplicates by Slack ts or content hash against Supabase
@@ -12,7 +13,10 @@ Config via environment variables (.env):
 - SUPABASE_URL
 - SUPABASE_ANON_KEY
 - INCLUDE_CHANNELS (comma-separated, e.g., all-knowledgehub,eng-updates) optional
-- EXTRACTION_HOURS_BACK (default 24)
+- EXTRACTION_HOURS_BACK (default 24; first run only, later runs continue
+  from each channel's saved cursor)
+- SLACK_DEDUP_STATE_FILE (default slack-dedup-sync-state.json next to this script)
+- SLACK_FULL_SYNC (ignore saved cursors) optional
 """
 
 import os
@@ -22,7 +26,7 @@ import json
 import hashlib
 import logging
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Iterator
 from datetime import datetime, timedelta
 
 import requests
@@ -34,6 +38,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared keyword index from backend utils
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+from app.utils.api_clients import SlackAPIClient  # noqa: E402
+from app.utils.keyword_index import KeywordIndex, load_keyword_index  # noqa: E402
+from app.utils.slack_sync_state import SlackSyncState, newer_ts  # noqa: E402
+
 # Dataclasses
 @dataclass
 class SlackMsg:
@@ -51,87 +61,26 @@ def load_env_str(name: str, default: Optional[str] = None) -> str:
         sys.exit(1)
     return val
 
-def read_file_text(path: str) -> str:
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except Exception as e:
-        logger.warning(f"Could not read {path}: {e}")
-        return ""
-
 def normalize_text_for_match(text: str) -> str:
     # Remove common formatting characters and normalize spaces
     text = text.replace('`', ' ').replace('*', ' ').replace('_', ' ').replace('~', ' ')
     text = re.sub(r"\s+", " ", text)
     return text.strip().lower()
 
-def extract_keywords_from_readmes(frontend_path: str, backend_path: str) -> List[str]:
-    fe = read_file_text(frontend_path)
-    be = read_file_text(backend_path)
-    combined = f"{fe}\n{be}"
-
-    # Look for explicit keyword sections/bullets first
-    candidates: Set[str] = set()
-
-    # Capture list items after headings that mention Keywords
-    for m in re.finditer(r"(?im)^##\s*(?:🚩\s*)?Important\s+Keywords[\s\S]*?$", combined):
-        pass  # placeholder; below general bullet parsing covers it
-
-    # Collect bullet items and inline code tokens
-    bullet_items = re.findall(r"(?m)^\s*[-*]\s+(.+)$", combined)
-    code_items = re.findall(r"`([^`]+)`", combined)
-
-    for item in bullet_items + code_items:
-        cleaned = normalize_text_for_match(item)
-        # Keep short phrases/words; strip trailing punctuation
-        cleaned = re.sub(r"[\s,:;.!?]+$", "", cleaned)
-        # Skip overly generic terms
-        if not cleaned:
-            continue
-        if len(cleaned) < 2:
-            continue
-        # Limit phrase length to avoid entire sentences
-        if len(cleaned.split()) <= 4:
-            candidates.add(cleaned)
-
-    # Additionally, seed with known terms often used in this repo
-    seeded = [
-        'ui issues', 'dashboard', 'mia chatbot', 'recommendations', 'order history',
-        'pending approvals', 'catalog', 'cart', 'authentication', 'rest api',
-        'dental city webhook', 'mia chat api'
-    ]
-    for s in seeded:
-        candidates.add(normalize_text_for_match(s))
-
-    # Remove duplicates and return
-    keywords = sorted(candidates)
-    logger.info(f"Loaded {len(keywords)} keywords/phrases from README files")
-    return keywords
-
 # Slack API
 class SlackClient:
     def __init__(self, token: str):
-        self.headers = {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
-        }
+        # Pooled, retrying, rate-limit-paced client from backend utils
+        self.api = SlackAPIClient(token)
 
     def list_channels(self) -> List[Dict]:
-        url = "https://slack.com/api/conversations.list"
-        resp = requests.get(url, headers=self.headers)
-        data = resp.json()
-        if not data.get('ok'):
-            raise RuntimeError(f"Slack error conversations.list: {data.get('error')}")
-        return data.get('channels', [])
-
-    def fetch_history(self, channel_id: str, oldest_ts: str, limit: int = 200) -> List[Dict]:
-        url = "https://slack.com/api/conversations.history"
-        params = { 'channel': channel_id, 'oldest': oldest_ts, 'limit': limit }
-        resp = requests.get(url, headers=self.headers, params=params)
-        data = resp.json()
-        if not data.get('ok'):
-            raise RuntimeError(f"Slack error conversations.history: {data.get('error')}")
-        return data.get('messages', [])
+        # Every page of unarchived channels
+        return list(self.api.iter_items('conversations.list', 'channels', {'exclude_archived': 'true'}))
+
+    def fetch_history(self, channel_id: str, oldest_ts: str, limit: int = 200) -> Iterator[Dict]:
+        # All messages since oldest_ts, fetched lazily page by page
+        params = { 'channel': channel_id, 'oldest': oldest_ts }
+        return self.api.iter_items('conversations.history', 'messages', params, limit)
 
 # Supabase REST
 class SupabaseClient:
@@ -143,6 +92,9 @@ class SupabaseClient:
             'Content-Type': 'application/json'
         }
 
+    def get(self, table: str, params: Optional[Dict] = None) -> requests.Response:
+        return requests.get(f"{self.url}/rest/v1/{table}", headers=self.headers, params=params or {})
+
     def exists_message(self, ts: str, content_hash: str) -> bool:
         # Check by ts in date OR hash stored in raw_text
         # First by date==ts and source==Slack Message
@@ -187,21 +139,10 @@ class SupabaseClient:
         return False
 
 # Matching
-def message_matches_keywords(text: str, keywords: List[str]) -> Optional[str]:
-    norm = normalize_text_for_match(text)
-    for kw in keywords:
-        # Exact phrase search on normalized content
-        kw_norm = normalize_text_for_match(kw)
-        if not kw_norm:
-            continue
-        # For single words, enforce word boundary; for phrases, substring
-        if ' ' in kw_norm:
-            if kw_norm in norm:
-                return kw
-        else:
-            if re.search(rf"\b{re.escape(kw_norm)}\b", norm):
-                return kw
-    return None
+def message_matches_keywords(text: str, index: KeywordIndex) -> Optional[str]:
+    # Most specific (longest) keyword in the message, whole words only;
+    # the index is built once per run in main()
+    return index.best_match(text)
 
 # Main workflow
 def main():
@@ -215,19 +156,29 @@ def main():
 
     hours_back = int(os.getenv('EXTRACTION_HOURS_BACK', '24'))
     oldest_ts = str(int((datetime.now() - timedelta(hours=hours_back)).timestamp()))
+    full_sync = os.getenv('SLACK_FULL_SYNC', 'false').lower() in ('1', 'true', 'yes')
+    sync_state = SlackSyncState(os.getenv(
+        'SLACK_DEDUP_STATE_FILE',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'slack-dedup-sync-state.json')
+    ))
 
     # Read keywords
     repo_root = os.getcwd()
     fe_readme = os.path.join(repo_root, 'frontend', 'README.md')
     be_readme = os.path.join(repo_root, 'backend', 'README.md')
-    keywords = extract_keywords_from_readmes(fe_readme, be_readme)
-    if not keywords:
-        logger.warning('No keywords found; exiting')
-        return 0
-
     slack = SlackClient(slack_token)
     supa = SupabaseClient(supabase_url, supabase_key)
 
+    cache_path = os.getenv(
+        'KEYWORD_INDEX_CACHE',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'keyword-index-cache.json')
+    )
+    use_topics = os.getenv('KEYWORD_INDEX_DB_TOPICS', 'true').lower() != 'false'
+    keyword_index = load_keyword_index([fe_readme, be_readme], supabase=supa if use_topics else None, cache_path=cache_path)
+    if not keyword_index:
+        logger.warning('No keywords found; exiting')
+        return 0
+
     # Channels
     channels = slack.list_channels()
     selected: List[Tuple[str, str]] = []  # (id, name)
@@ -247,37 +198,50 @@ def main():
     scanned = 0
 
     for ch_id, ch_name in selected:
+        # Only messages after the channel's cursor; it advances once every
+        # fetched message has been handled
+        cursor = None if full_sync else sync_state.get_cursor(ch_id)
+        last_ts = None
+        failed = False
+        # History pages are fetched lazily, so fetch errors surface while iterating;
+        # messages already handled for the channel stay inserted
         try:
-            messages = slack.fetch_history(ch_id, oldest_ts, limit=200)
+            for m in slack.fetch_history(ch_id, cursor or oldest_ts, limit=200):
+                last_ts = newer_ts(last_ts, m.get('ts'))
+                # Skip bot/system
+                if m.get('bot_id') or m.get('subtype'):
+                    continue
+                text = m.get('text') or ''
+                if not text.strip():
+                    continue
+
+                scanned += 1
+                match = message_matches_keywords(text, keyword_index)
+                if not match:
+                    continue
+
+                ts = m.get('ts', '')
+                user = m.get('user', 'unknown')
+                msg = SlackMsg(ts=ts, text=text, user=user, channel_id=ch_id, channel_name=ch_name)
+                content_hash = hashlib.sha256(normalize_text_for_match(text).encode('utf-8')).hexdigest()
+
+                # Dedup check
+                if supa.exists_message(ts, content_hash):
+                    continue
+
+                summary = f"Slack #{ch_name} | user:{user} | ts:{ts} | kw:{match}"
+                if supa.insert_message(summary, match, msg, content_hash):
+                    inserted += 1
+                else:
+                    failed = True
         except Exception as e:
             logger.error(f"Failed fetching history for #{ch_name}: {e}")
-            continue
+            failed = True
 
-        for m in messages:
-            # Skip bot/system
-            if m.get('bot_id') or m.get('subtype'):
-                continue
-            text = m.get('text') or ''
-            if not text.strip():
-                continue
-
-            scanned += 1
-            match = message_matches_keywords(text, keywords)
-            if not match:
-                continue
-
-            ts = m.get('ts', '')
-            user = m.get('user', 'unknown')
-            msg = SlackMsg(ts=ts, text=text, user=user, channel_id=ch_id, channel_name=ch_name)
-            content_hash = hashlib.sha256(normalize_text_for_match(text).encode('utf-8')).hexdigest()
-
-            # Dedup check
-            if supa.exists_message(ts, content_hash):
-                continue
-
-            summary = f"Slack #{ch_name} | user:{user} | ts:{ts} | kw:{match}"
-            if supa.insert_message(summary, match, msg, content_hash):
-                inserted += 1
+        if failed:
+            logger.warning(f"Cursor for #{ch_name} not advanced; the next run will retry it")
+        else:
+            sync_state.set_cursor(ch_id, last_ts, {})
 
     logger.info(f"Scanned messages: {scanned} | Inserted new: {inserted}")
     return 0
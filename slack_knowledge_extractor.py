@@ -27,6 +27,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared keyword index from backend utils
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+from app.utils.keyword_index import KeywordIndex  # noqa: E402
+
+# Common technology keywords
+TECH_KEYWORDS = [
+    'Next.js', 'React', 'TypeScript', 'JavaScript', 'Python', 'FastAPI',
+    'Supabase', 'PostgreSQL', 'Node.js', 'API', 'Database', 'Frontend',
+    'Backend', 'Authentication', 'Security', 'Deployment', 'Docker',
+    'AWS', 'Azure', 'Git', 'GitHub', 'CI/CD', 'Testing', 'Debugging'
+]
+
+# Project management keywords
+PM_KEYWORDS = [
+    'Sprint', 'Planning', 'Review', 'Retrospective', 'Backlog', 'Epic',
+    'Story', 'Task', 'Bug', 'Feature', 'Release', 'Deployment',
+    'Documentation', 'Meeting', 'Decision', 'Action Item'
+]
+
+# Business keywords
+BUSINESS_KEYWORDS = [
+    'Customer', 'User', 'Product', 'Feature', 'Revenue', 'Growth',
+    'Strategy', 'Goal', 'Objective', 'KPI', 'Metric', 'Analytics'
+]
+
+# Compiled once per process instead of scanning every keyword per call
+TOPIC_INDEX = KeywordIndex(TECH_KEYWORDS + PM_KEYWORDS + BUSINESS_KEYWORDS)
+
 @dataclass
 class SlackMessage:
     """Data class for Slack message structure"""
@@ -238,39 +266,8 @@ class SlackKnowledgeExtractor:
     
     def _extract_topics(self, text: str) -> List[str]:
         """Extract topics/keywords from text"""
-        # Common technology keywords
-        tech_keywords = [
-            'Next.js', 'React', 'TypeScript', 'JavaScript', 'Python', 'FastAPI',
-            'Supabase', 'PostgreSQL', 'Node.js', 'API', 'Database', 'Frontend',
-            'Backend', 'Authentication', 'Security', 'Deployment', 'Docker',
-            'AWS', 'Azure', 'Git', 'GitHub', 'CI/CD', 'Testing', 'Debugging'
-        ]
-        
-        # Project management keywords
-        pm_keywords = [
-            'Sprint', 'Planning', 'Review', 'Retrospective', 'Backlog', 'Epic',
-            'Story', 'Task', 'Bug', 'Feature', 'Release', 'Deployment',
-            'Documentation', 'Meeting', 'Decision', 'Action Item'
-        ]
-        
-        # Business keywords
-        business_keywords = [
-            'Customer', 'User', 'Product', 'Feature', 'Revenue', 'Growth',
-            'Strategy', 'Goal', 'Objective', 'KPI', 'Metric', 'Analytics'
-        ]
-        
-        all_keywords = tech_keywords + pm_keywords + business_keywords
-        
-        # Find keywords in text (case-insensitive)
-        found_topics = []
-        text_lower = text.lower()
-        
-        for keyword in all_keywords:
-            if keyword.lower() in text_lower:
-                found_topics.append(keyword)
-        
-        # Remove duplicates and limit to top 20
-        return list(set(found_topics))[:20]
+        # Whole-word matches, most specific first, limited to top 20
+        return TOPIC_INDEX.match_all(text)[:20]
     
     def _extract_decisions(self, text: str) -> List[str]:
         """Extract decisions from text"""
@@ -9,8 +9,9 @@ import sys
 import json
 import logging
 import re
+import functools
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple, Set, Union, Iterator
 from dataclasses import dataclass
 
 import requests
@@ -43,7 +44,9 @@ if os.path.exists(backend_path):
         from app.utils.ai_summarization import (
             call_openai_api,
             parse_json_response,
-            format_summary_for_storage
+            format_summary_for_storage,
+            create_embedding,
+            format_article_for_embedding
         )
     except ImportError as e:
         logger.warning(f"Could not import from backend utils: {e}. Using inline implementations.")
@@ -113,6 +116,18 @@ if os.path.exists(backend_path):
                 if not data.get('ok'):
                     raise RuntimeError(f"Slack API error: {data.get('error')}")
                 return data
+            def paginate(self, endpoint, params=None, limit=200):
+                params = {**(params or {}), 'limit': limit}
+                while True:
+                    data = self.call_api(endpoint, params)
+                    yield data
+                    cursor = (data.get('response_metadata') or {}).get('next_cursor')
+                    if not cursor:
+                        return
+                    params['cursor'] = cursor
+            def iter_items(self, endpoint, key, params=None, limit=200):
+                for page in self.paginate(endpoint, params, limit):
+                    yield from page.get(key, [])
         
         class SupabaseAPIClient:
             def __init__(self, url, anon_key):
@@ -126,9 +141,12 @@ if os.path.exists(backend_path):
             def get(self, table, params=None):
                 url = f"{self.base_url}/rest/v1/{table}"
                 return requests.get(url, headers=self.headers, params=params or {})
-            def post(self, table, data):
+            def post(self, table, data, return_representation=False):
                 url = f"{self.base_url}/rest/v1/{table}"
-                return requests.post(url, headers=self.headers, json=data)
+                headers = self.headers
+                if return_representation:
+                    headers = {**self.headers, "Prefer": "return=representation"}
+                return requests.post(url, headers=headers, json=data)
             def patch(self, table, item_id, data):
                 url = f"{self.base_url}/rest/v1/{table}"
                 headers = {**self.headers, "Prefer": "return=representation"}
@@ -190,6 +208,14 @@ if os.path.exists(backend_path):
                     parts.append(f"{i}. {action}")
                 parts.append("")
             return "\n".join(parts)
+        
+        def create_embedding(text, timeout=30):
+            return None  # Semantic search needs the backend utils
+        
+        def format_article_for_embedding(summary, topics=None, key_points=None, content=''):
+            return summary or ''
+    from app.utils.keyword_index import KeywordIndex, load_keyword_index, load_readme_keywords
+    from app.utils.slack_sync_state import SlackSyncState, newer_ts, ts_value
 else:
     logger.error("Backend directory not found. Please ensure backend/app/utils exists.")
     sys.exit(1)
@@ -211,66 +237,45 @@ class SlackMessage:
     sender_name: Optional[str] = None
     is_thread_reply: bool = False
     original_thread_ts: Optional[str] = None
+    # Already processed by an earlier run; only kept as thread context
+    context_only: bool = False
 
 
 # ============================================================================
 # Keyword Extraction
 # ============================================================================
 
-def read_file_safe(path: str) -> str:
-    """Read file content safely, returning empty string on error."""
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except Exception as e:
-        logger.warning(f"Could not read {path}: {e}")
-        return ""
+def default_keyword_index_cache() -> str:
+    """Keyword cache file: KEYWORD_INDEX_CACHE, else next to this script."""
+    return os.getenv(
+        'KEYWORD_INDEX_CACHE',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'keyword-index-cache.json')
+    )
 
 
-def extract_keywords_from_readmes(frontend_path: str, backend_path: str) -> List[str]:
+def extract_keywords_from_readmes(
+    frontend_path: str,
+    backend_path: str,
+    cache_path: Optional[str] = None
+) -> List[str]:
     """
     Extract keywords from frontend and backend README files.
     
+    The extracted vocabulary is cached with a content hash of the READMEs,
+    so unchanged files are not re-read or re-parsed on the next run.
+    
     Args:
         frontend_path: Path to frontend README
         backend_path: Path to backend README
+        cache_path: Cache file (default: default_keyword_index_cache())
         
     Returns:
-        List of extracted keywords
+        List of extracted keywords (including the seeded keywords)
     """
-    frontend_text = read_file_safe(frontend_path)
-    backend_text = read_file_safe(backend_path)
-    combined_text = f"{frontend_text}\n{backend_text}"
-    
-    candidates = set()
-    
-    # Extract bullet points (handles both "- keyword" and "-keyword" formats)
-    bullet_items = re.findall(r"(?m)^\s*[-*]\s*(.+)$", combined_text)
-    # Extract inline code blocks
-    code_items = re.findall(r"`([^`]+)`", combined_text)
-    
-    for item in bullet_items + code_items:
-        cleaned = normalize_text(item)
-        cleaned = re.sub(r"[\s,:;.!?]+$", "", cleaned)
-        
-        # Skip empty or whitespace-only keywords
-        if not cleaned or not cleaned.strip():
-            continue
-        
-        # Keep only short phrases (4 words or less)
-        if len(cleaned.split()) <= 4:
-            candidates.add(cleaned)
-    
-    # Add known seeded keywords
-    seeded_keywords = [
-        'ui issues', 'dashboard', 'mia chatbot', 'recommendations', 'order history',
-        'pending approvals', 'catalog', 'cart', 'authentication', 'rest api',
-        'dental city webhook', 'mia chat api'
-    ]
-    for keyword in seeded_keywords:
-        candidates.add(normalize_text(keyword))
-    
-    keywords = sorted(candidates)
+    keywords = load_readme_keywords(
+        [frontend_path, backend_path],
+        cache_path=cache_path or default_keyword_index_cache()
+    )
     logger.info(f"Loaded {len(keywords)} keywords/phrases from README files")
     return keywords
 
@@ -279,45 +284,30 @@ def extract_keywords_from_readmes(frontend_path: str, backend_path: str) -> List
 # Keyword Matching
 # ============================================================================
 
-def find_matching_keywords(text: str, keywords: List[str]) -> Optional[Tuple[str, List[str]]]:
+@functools.lru_cache(maxsize=8)
+def _cached_index(keywords: Tuple[str, ...]) -> KeywordIndex:
+    return KeywordIndex(keywords)
+
+
+def find_matching_keywords(
+    text: str,
+    keywords: Union[KeywordIndex, List[str]]
+) -> Optional[Tuple[str, List[str]]]:
     """
     Find all matching keywords in text, prioritizing longer, more specific phrases.
     
     Args:
         text: Text to search
-        keywords: List of keywords to match against
+        keywords: KeywordIndex loaded once per run, or a keyword list
+            (its index is built on first use and cached)
         
     Returns:
         Tuple of (best_match, all_matches) or None if no matches.
         Best match is the longest keyword (by word count, then character count).
     """
-    normalized_text = normalize_text(text)
-    matches = []
-    
-    for keyword in keywords:
-        normalized_keyword = normalize_text(keyword)
-        if not normalized_keyword:
-            continue
-        
-        if ' ' in normalized_keyword:
-            # Multi-word phrase: check if entire phrase is in text
-            if normalized_keyword in normalized_text:
-                matches.append(keyword)
-        else:
-            # Single word: check word boundary match
-            if re.search(rf"\b{re.escape(normalized_keyword)}\b", normalized_text):
-                matches.append(keyword)
-    
-    if not matches:
-        return None
-    
-    # Sort by priority: word count (descending), then character length (descending)
-    def priority(keyword: str) -> Tuple[int, int]:
-        words = keyword.split()
-        return (-len(words), -len(keyword))  # Negative for descending sort
-    
-    sorted_matches = sorted(matches, key=priority)
-    return (sorted_matches[0], sorted_matches)
+    if not isinstance(keywords, KeywordIndex):
+        keywords = _cached_index(tuple(keywords))
+    return keywords.match(text)
 
 
 # ============================================================================
@@ -534,19 +524,46 @@ class SlackMessageProcessor:
 class SlackArticleManager:
     """Manages article storage and retrieval for Slack messages."""
     
-    def __init__(self, supabase_client: SupabaseAPIClient):
+    def __init__(self, supabase_client: SupabaseAPIClient, embed_articles: bool = False):
         """
         Initialize article manager.
         
         Args:
             supabase_client: Supabase API client
+            embed_articles: Store an embedding with new and re-summarized
+                articles for the assistant's semantic search
         """
         self.supabase = supabase_client
+        self.embed_articles = embed_articles
+        # In-run topic -> article cache (None records a confirmed miss)
+        self._article_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+    
+    def _embed_article(
+        self,
+        summary: str,
+        topics: List[str],
+        key_points: List[str],
+        content: str = ''
+    ) -> Optional[List[float]]:
+        """Embedding for an article, or None when disabled or the request fails."""
+        if not self.embed_articles:
+            return None
+        return create_embedding(format_article_for_embedding(summary, topics, key_points, content))
+    
+    @staticmethod
+    def _topic_filter(topic: str) -> str:
+        """Build a PostgREST array-containment filter for a single topic."""
+        escaped = topic.replace('\\', '\\\\').replace('"', '\\"')
+        return f'cs.{{"{escaped}"}}'
     
     def find_existing_article(self, keyword: str) -> Optional[Dict[str, Any]]:
         """
         Find existing knowledge article for keyword.
         
+        Looks up the in-run cache first, then queries Supabase with a
+        server-side ``topics`` containment filter (backed by the GIN index
+        in ``supabase/add_topics_gin_index.sql``).
+        
         Args:
             keyword: Topic keyword
             
@@ -554,9 +571,15 @@ class SlackArticleManager:
             Existing article dictionary or None
         """
         topic_singular = singularize_keyword(keyword)
+        if topic_singular in self._article_cache:
+            return self._article_cache[topic_singular]
+        
         params = {
             'select': 'id,raw_text,summary,topics,date',
-            'source': 'eq.slack'
+            'source': 'eq.slack',
+            'topics': self._topic_filter(topic_singular),
+            'order': 'created_at.asc',
+            'limit': 1
         }
         
         response = self.supabase.get('knowledge_items', params)
@@ -564,12 +587,9 @@ class SlackArticleManager:
             return None
         
         items = response.json()
-        for item in items:
-            item_topics = item.get('topics', [])
-            if isinstance(item_topics, list) and topic_singular in item_topics:
-                return item
-        
-        return None
+        article = items[0] if items else None
+        self._article_cache[topic_singular] = article
+        return article
     
     def message_exists_in_article(self, content_hash: str, raw_text: str) -> bool:
         """
@@ -666,6 +686,8 @@ class SlackArticleManager:
         response = self.supabase.patch('knowledge_items', item_id, update_payload)
         
         if response.status_code in (200, 204):
+            # Keep the cached copy in sync so later dedup checks see this message
+            article['raw_text'] = updated_text
             message_type = "reply" if msg.is_thread_reply else "message"
             topic = singularize_keyword(article.get('topics', [''])[0])
             logger.info(f"Appended {message_type} to existing page: {topic}")
@@ -724,10 +746,19 @@ class SlackArticleManager:
             "sender_name": msg.sender_name or "Unknown",
             "raw_text": message_entry
         }
+        embedding = self._embed_article(summary, [topic_singular], key_points, msg.text)
+        if embedding:
+            payload["embedding"] = embedding
         
-        response = self.supabase.post('knowledge_items', payload)
+        response = self.supabase.post('knowledge_items', payload, return_representation=True)
         
         if response.status_code in (200, 201):
+            # Cache the inserted row so later messages on this topic skip the lookup
+            rows = response.json() if response.content else []
+            if rows:
+                self._article_cache[topic_singular] = rows[0]
+            else:
+                self._article_cache.pop(topic_singular, None)
             logger.info(f"Created new page: {title}")
             return (True, "inserted")
         else:
@@ -774,6 +805,15 @@ class SlackArticleManager:
         if action_items:
             update_payload["action_items"] = action_items
         
+        embedding = self._embed_article(
+            formatted_summary,
+            article.get('topics') or [keyword],
+            key_points,
+            "\n".join(m.text for m in thread_messages)
+        )
+        if embedding:
+            update_payload["embedding"] = embedding
+        
         response = self.supabase.patch('knowledge_items', item_id, update_payload)
         
         if response.status_code in (200, 204):
@@ -810,6 +850,20 @@ class SlackKnowledgeExtractor:
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
         self.include_channels = self._parse_channel_list(os.getenv('INCLUDE_CHANNELS', ''))
         self.hours_back = int(os.getenv('EXTRACTION_HOURS_BACK', '24'))
+        # Per-channel cursors: runs only pull messages newer than the last
+        # processed one; EXTRACTION_HOURS_BACK bounds the first run and how
+        # long threads are watched for new replies
+        self.full_sync = os.getenv('SLACK_FULL_SYNC', 'false').lower() in ('1', 'true', 'yes')
+        self.state_file = os.getenv(
+            'SLACK_STATE_FILE',
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), 'slack-sync-state.json')
+        )
+        # Embeddings for the AI assistant's semantic search (needs OpenAI)
+        self.embed_articles = bool(self.openai_api_key) and os.getenv('EMBED_ARTICLES', 'true').lower() != 'false'
+        # Shared keyword index: cached between runs, extended with article
+        # topics and the admin-managed keyword_vocabulary table
+        self.keyword_index_cache = default_keyword_index_cache()
+        self.keyword_topics = os.getenv('KEYWORD_INDEX_DB_TOPICS', 'true').lower() != 'false'
     
     def _validate_environment(self):
         """Validate required environment variables."""
@@ -828,12 +882,18 @@ class SlackKnowledgeExtractor:
         self.slack_client = SlackAPIClient(self.slack_token)
         self.supabase_client = SupabaseAPIClient(self.supabase_url, self.supabase_key)
         self.message_processor = SlackMessageProcessor(self.slack_client)
-        self.article_manager = SlackArticleManager(self.supabase_client)
+        self.article_manager = SlackArticleManager(self.supabase_client, self.embed_articles)
+        self.sync_state = SlackSyncState(self.state_file)
+        # Cursors reached by fetch_slack_messages, saved once their messages are written
+        self.pending_cursors: Dict[str, Dict[str, Any]] = {}
     
     def _list_channels(self) -> List[Dict[str, Any]]:
-        """List all Slack channels."""
-        data = self.slack_client.call_api('conversations.list')
-        return data.get('channels', [])
+        """List all unarchived Slack channels (every page)."""
+        return list(self.slack_client.iter_items(
+            'conversations.list',
+            'channels',
+            {'exclude_archived': 'true'}
+        ))
     
     def _select_channels(self) -> List[Tuple[str, str]]:
         """Select channels to process based on configuration."""
@@ -856,12 +916,20 @@ class SlackKnowledgeExtractor:
         self,
         channel_id: str,
         oldest_ts: str,
-        limit: int = 200
-    ) -> List[Dict[str, Any]]:
-        """Fetch message history from a Slack channel."""
-        params = {'channel': channel_id, 'oldest': oldest_ts, 'limit': limit}
-        data = self.slack_client.call_api('conversations.history', params)
-        return data.get('messages', [])
+        limit: int = 200,
+        latest_ts: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield a channel's messages after oldest_ts (up to and including
+        latest_ts, if given), page by page.
+        
+        Pages are fetched lazily as the caller iterates, so every message in
+        the window is seen while only one page is held in memory.
+        """
+        params = {'channel': channel_id, 'oldest': oldest_ts}
+        if latest_ts:
+            params.update(latest=latest_ts, inclusive='true')
+        return self.slack_client.iter_items('conversations.history', 'messages', params, limit)
     
     def _fetch_thread_replies(
         self,
@@ -879,25 +947,38 @@ class SlackKnowledgeExtractor:
             
         Returns:
             List of thread messages (replies only by default)
+            
+        Raises:
+            RuntimeError: If the Slack API returns an error
         """
-        try:
-            params = {'channel': channel_id, 'ts': thread_ts}
-            data = self.slack_client.call_api('conversations.replies', params)
-            messages = data.get('messages', [])
-            # First message is the parent, rest are replies
-            if include_parent:
-                return messages
-            return messages[1:] if len(messages) > 1 else []
-        except Exception as e:
-            logger.warning(f"Failed to fetch thread replies for {thread_ts}: {e}")
-            return []
+        params = {'channel': channel_id, 'ts': thread_ts}
+        messages = []
+        has_parent = False
+        for message in self.slack_client.iter_items('conversations.replies', 'messages', params):
+            # The parent (ts == thread_ts) may be repeated on later pages
+            if message.get('ts') == thread_ts:
+                if not include_parent or has_parent:
+                    continue
+                has_parent = True
+            messages.append(message)
+        return messages
     
     def fetch_slack_messages(self) -> List[SlackMessage]:
-        """Fetch all Slack messages from selected channels within time window."""
-        logger.info(f"Fetching Slack messages for last {self.hours_back} hours...")
-        oldest_ts = str(int((datetime.now() - timedelta(hours=self.hours_back)).timestamp()))
-        oldest_datetime = datetime.now() - timedelta(hours=self.hours_back)
+        """
+        Fetch new Slack messages from selected channels.
+        
+        Each channel is read from its saved cursor (or the last hours_back
+        hours on the first run / with SLACK_FULL_SYNC). Replies to older
+        threads never show up in that history, so the threads recorded by
+        earlier runs (parents with replies, posted within hours_back) are
+        polled for replies after their saved latest_reply instead of
+        re-listing the window. The cursors reached are kept in
+        pending_cursors until save_cursors() is called.
+        """
+        window_start = (datetime.now() - timedelta(hours=self.hours_back)).timestamp()
+        default_oldest = str(int(window_start))
         messages = []
+        self.pending_cursors = {}
         
         selected_channels = self._select_channels()
         if not selected_channels:
@@ -905,107 +986,209 @@ class SlackKnowledgeExtractor:
             return messages
         
         processed_timestamps: Set[str] = set()
-        threads_to_fetch: Set[str] = set()  # Track thread timestamps to fetch
         
         for channel_id, channel_name in selected_channels:
-            logger.info(f"Fetching messages from channel: {channel_name}")
+            cursor = None if self.full_sync else self.sync_state.get_cursor(channel_id)
+            known_threads = {} if self.full_sync else self.sync_state.get_threads(channel_id)
+            oldest_ts = cursor or default_oldest
+            logger.info(
+                f"Fetching messages from channel: {channel_name} "
+                f"({'since cursor ' + cursor if cursor else f'last {self.hours_back} hours'})"
+            )
+            threads_to_fetch: Set[str] = set()  # Track thread timestamps to fetch
+            complete = True
+            last_ts = None
             
             try:
-                history = self._fetch_channel_history(channel_id, oldest_ts)
+                last_ts = self._collect_history(
+                    channel_id, channel_name, oldest_ts, messages, processed_timestamps, threads_to_fetch
+                )
+                threads_to_fetch.update(
+                    self._threads_with_new_replies(
+                        channel_id, known_threads, window_start, threads_to_fetch
+                    )
+                )
             except Exception as e:
+                # Messages from pages already fetched are kept
                 logger.error(f"Failed to fetch history for #{channel_name}: {e}")
-                continue
-            
-            # Process messages from history
-            for msg in history:
-                slack_msg = self.message_processor.process_message(msg, channel_name)
-                if not slack_msg:
-                    continue
-                
-                # Skip duplicates
-                if slack_msg.timestamp in processed_timestamps:
-                    continue
-                processed_timestamps.add(slack_msg.timestamp)
-                
-                # If this is a thread reply, track the thread to fetch all replies
-                if slack_msg.is_thread_reply and slack_msg.original_thread_ts:
-                    threads_to_fetch.add(slack_msg.original_thread_ts)
-                # If this is an original message with replies, also track it
-                elif not slack_msg.is_thread_reply:
-                    reply_count = msg.get('reply_count', 0)
-                    if reply_count > 0:
-                        threads_to_fetch.add(slack_msg.timestamp)
-                
-                messages.append(slack_msg)
+                complete = False
             
-            # Fetch and process thread replies for all tracked threads
-            # This includes both threads with recent original messages AND threads with recent replies
+            thread_cursors: Dict[str, str] = {}
             for thread_ts in threads_to_fetch:
                 try:
-                    # Fetch all replies in the thread
-                    all_replies = self._fetch_thread_replies(channel_id, thread_ts)
-                    logger.info(f"Found {len(all_replies)} replies for thread {thread_ts}")
-                    
-                    # Filter replies to only include those within the time window
-                    recent_replies = []
-                    for reply in all_replies:
-                        reply_ts = float(reply.get('ts', 0))
-                        reply_datetime = datetime.fromtimestamp(reply_ts)
-                        if reply_datetime >= oldest_datetime:
-                            recent_replies.append(reply)
-                    
-                    if recent_replies:
-                        logger.info(f"Found {len(recent_replies)} recent replies (within time window) for thread {thread_ts}")
-                        
-                        # When we have recent replies, fetch ALL thread messages (including parent) for full context
-                        # This ensures we have complete thread context for AI summarization
-                        all_thread_messages = self._fetch_thread_replies(channel_id, thread_ts, include_parent=True)
-                        
-                        # Add ALL thread messages (old + new) for context
-                        # Old messages won't be added to articles (deduplication handles this)
-                        for thread_msg in all_thread_messages:
-                            # Check if this is the parent message or a reply
-                            if thread_msg.get('ts') == thread_ts:
-                                # This is the parent message - process it as a regular message
-                                parent_msg = self.message_processor.process_message(thread_msg, channel_name)
-                                if parent_msg and parent_msg.timestamp not in processed_timestamps:
-                                    processed_timestamps.add(parent_msg.timestamp)
-                                    messages.append(parent_msg)
-                            else:
-                                # This is a reply
-                                reply_msg = self.message_processor.process_thread_reply(
-                                    thread_msg,
-                                    channel_name,
-                                    thread_ts
-                                )
-                                if not reply_msg:
-                                    continue
-                                
-                                # Only add if not already processed (deduplication)
-                                if reply_msg.timestamp not in processed_timestamps:
-                                    processed_timestamps.add(reply_msg.timestamp)
-                                    messages.append(reply_msg)
-                    else:
-                        # No recent replies, but thread was tracked (has replies)
-                        # Only add recent replies if any exist
-                        for reply in all_replies:
-                            reply_ts = float(reply.get('ts', 0))
-                            reply_datetime = datetime.fromtimestamp(reply_ts)
-                            if reply_datetime >= oldest_datetime:
-                                reply_msg = self.message_processor.process_thread_reply(
-                                    reply,
-                                    channel_name,
-                                    thread_ts
-                                )
-                                if reply_msg and reply_msg.timestamp not in processed_timestamps:
-                                    processed_timestamps.add(reply_msg.timestamp)
-                                    messages.append(reply_msg)
+                    thread_cursors[thread_ts] = self._collect_thread(
+                        channel_id,
+                        channel_name,
+                        thread_ts,
+                        known_threads.get(thread_ts) or thread_ts,
+                        bool(cursor) and ts_value(thread_ts) <= ts_value(cursor),
+                        messages,
+                        processed_timestamps
+                    )
                 except Exception as e:
                     logger.warning(f"Error fetching thread replies for {thread_ts}: {e}")
+                    complete = False
+            
+            if complete:
+                self.pending_cursors[channel_id] = {
+                    'name': channel_name,
+                    'last_ts': last_ts,
+                    'threads': thread_cursors,
+                    'threads_since': window_start
+                }
+            else:
+                logger.warning(f"#{channel_name} was not fully fetched; its cursor will not advance")
         
         logger.info(f"Fetched {len(messages)} messages from Slack")
         return messages
     
+    def _threads_with_new_replies(
+        self,
+        channel_id: str,
+        known_threads: Dict[str, str],
+        window_start: float,
+        skip: Set[str]
+    ) -> Set[str]:
+        """
+        Find tracked threads with replies newer than their saved latest_reply.
+        
+        Only threads started after window_start are polled (those in skip are
+        fetched anyway), and each poll asks for the replies after the saved
+        latest_reply, so the cost follows the number of tracked threads rather
+        than the length of the channel history. A message that had no replies
+        when it was processed is not tracked; its first replies are not seen.
+        """
+        threads = set()
+        for thread_ts, latest_reply in known_threads.items():
+            if thread_ts in skip or ts_value(thread_ts) < window_start:
+                continue
+            if self._thread_has_new_replies(channel_id, thread_ts, latest_reply or thread_ts):
+                threads.add(thread_ts)
+        if threads:
+            logger.info(f"{len(threads)} older threads have new replies")
+        return threads
+    
+    def _thread_has_new_replies(self, channel_id: str, thread_ts: str, since_ts: str) -> bool:
+        """Check whether a thread has replies after since_ts (reads one page at most)."""
+        params = {'channel': channel_id, 'ts': thread_ts, 'oldest': since_ts}
+        for message in self.slack_client.iter_items('conversations.replies', 'messages', params, limit=10):
+            if message.get('ts') == thread_ts:
+                # The parent is always returned and carries latest_reply
+                if ts_value(message.get('latest_reply')) > ts_value(since_ts):
+                    return True
+            elif ts_value(message.get('ts')) > ts_value(since_ts):
+                return True
+        return False
+    
+    def _collect_history(
+        self,
+        channel_id: str,
+        channel_name: str,
+        oldest_ts: str,
+        messages: List[SlackMessage],
+        processed_timestamps: Set[str],
+        threads_to_fetch: Set[str]
+    ) -> Optional[str]:
+        """
+        Add a channel's messages after oldest_ts and note threads with replies.
+        
+        Returns:
+            ts of the newest message seen (including skipped bot/system messages)
+        """
+        last_ts = None
+        for msg in self._fetch_channel_history(channel_id, oldest_ts):
+            last_ts = newer_ts(last_ts, msg.get('ts'))
+            slack_msg = self.message_processor.process_message(msg, channel_name)
+            if not slack_msg:
+                continue
+            
+            # Skip duplicates
+            if slack_msg.timestamp in processed_timestamps:
+                continue
+            processed_timestamps.add(slack_msg.timestamp)
+            
+            # If this is a thread reply, track the thread to fetch all replies
+            if slack_msg.is_thread_reply and slack_msg.original_thread_ts:
+                threads_to_fetch.add(slack_msg.original_thread_ts)
+            # If this is an original message with replies, also track it
+            elif not slack_msg.is_thread_reply:
+                reply_count = msg.get('reply_count', 0)
+                if reply_count > 0:
+                    threads_to_fetch.add(slack_msg.timestamp)
+            
+            messages.append(slack_msg)
+        return last_ts
+    
+    def _collect_thread(
+        self,
+        channel_id: str,
+        channel_name: str,
+        thread_ts: str,
+        since_ts: str,
+        parent_processed: bool,
+        messages: List[SlackMessage],
+        processed_timestamps: Set[str]
+    ) -> str:
+        """
+        Add a thread's messages if it has replies after since_ts.
+        
+        Replies up to since_ts (and the parent, if an earlier run processed
+        it) are added as context_only: they give the AI summary the whole
+        thread but are not matched or written again.
+        
+        Args:
+            since_ts: Latest reply already processed (the parent ts if none)
+            parent_processed: Whether the parent is older than the channel cursor
+        
+        Returns:
+            The thread's latest reply ts (since_ts if there are no new replies)
+        """
+        all_thread_messages = self._fetch_thread_replies(channel_id, thread_ts, include_parent=True)
+        all_replies = [m for m in all_thread_messages if m.get('ts') != thread_ts]
+        recent_replies = [r for r in all_replies if ts_value(r.get('ts')) > ts_value(since_ts)]
+        if not recent_replies:
+            return since_ts
+        logger.info(f"Found {len(recent_replies)} new of {len(all_replies)} replies for thread {thread_ts}")
+        
+        # With new replies, add ALL thread messages (old + new, including
+        # the parent) for full AI summarization context
+        for thread_msg in all_thread_messages:
+            if thread_msg.get('ts') == thread_ts:
+                # This is the parent message - process it as a regular message
+                thread_item = self.message_processor.process_message(thread_msg, channel_name)
+                if thread_item:
+                    thread_item.context_only = parent_processed
+            else:
+                thread_item = self.message_processor.process_thread_reply(thread_msg, channel_name, thread_ts)
+                if thread_item:
+                    thread_item.context_only = ts_value(thread_item.timestamp) <= ts_value(since_ts)
+            # Only add if not already processed (deduplication)
+            if thread_item and thread_item.timestamp not in processed_timestamps:
+                processed_timestamps.add(thread_item.timestamp)
+                messages.append(thread_item)
+        
+        latest_reply = since_ts
+        for reply in recent_replies:
+            latest_reply = newer_ts(latest_reply, reply.get('ts'))
+        return latest_reply
+    
+    def save_cursors(self, failed_channels: Set[str]):
+        """
+        Persist the cursors reached by fetch_slack_messages.
+        
+        Args:
+            failed_channels: Names of channels with messages that could not be
+                written; their cursors stay put so the next run retries them
+        """
+        for channel_id, cursor in self.pending_cursors.items():
+            if cursor['name'] in failed_channels:
+                logger.warning(f"Cursor for #{cursor['name']} not advanced; the next run will retry it")
+                continue
+            self.sync_state.set_cursor(
+                channel_id, cursor['last_ts'], cursor['threads'], cursor['threads_since']
+            )
+        self.pending_cursors = {}
+    
     def _group_messages_by_thread(
         self,
         messages: List[SlackMessage]
@@ -1079,7 +1262,7 @@ class SlackKnowledgeExtractor:
         topic_singular = self._validate_keyword(keyword)
         if not topic_singular:
             logger.error(f"Invalid keyword '{keyword}' for message {msg.timestamp}, skipping")
-            return (False, "error")
+            return (False, "invalid")
         
         content_hash = hash_content(msg.text)
         existing_article = self.article_manager.find_existing_article(keyword)
@@ -1136,9 +1319,13 @@ class SlackKnowledgeExtractor:
             repo_root = os.getcwd()
             frontend_readme = os.path.join(repo_root, 'frontend', 'README.md')
             backend_readme = os.path.join(repo_root, 'backend', 'README.md')
-            keywords = extract_keywords_from_readmes(frontend_readme, backend_readme)
+            keyword_index = load_keyword_index(
+                [frontend_readme, backend_readme],
+                supabase=self.supabase_client if self.keyword_topics else None,
+                cache_path=self.keyword_index_cache
+            )
             
-            if not keywords:
+            if not keyword_index:
                 logger.warning('No keywords found in README files; nothing to match')
                 return True
             
@@ -1146,6 +1333,7 @@ class SlackKnowledgeExtractor:
             messages = self.fetch_slack_messages()
             if not messages:
                 logger.warning("No messages found to process")
+                self.save_cursors(set())
                 return True
             
             # Group messages by thread
@@ -1159,12 +1347,15 @@ class SlackKnowledgeExtractor:
                 'updated': 0,
                 'summarized': 0
             }
-            processed_threads: Set[str] = set()
+            failed_channels: Set[str] = set()
             
             for msg in messages:
+                # Written by an earlier run; only here as thread context
+                if msg.context_only:
+                    continue
                 stats['scanned'] += 1
                 
-                match_result = find_matching_keywords(msg.text, keywords)
+                match_result = find_matching_keywords(msg.text, keyword_index)
                 if not match_result:
                     continue
                 
@@ -1191,6 +1382,10 @@ class SlackKnowledgeExtractor:
                             stats['summarized'] += 1
                     elif action == "updated":
                         stats['updated'] += 1
+                elif action == "error":
+                    failed_channels.add(msg.channel)
+            
+            self.save_cursors(failed_channels)
             
             logger.info(
                 f"Scanned: {stats['scanned']} messages | "
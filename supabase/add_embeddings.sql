@@ -0,0 +1,71 @@
+-- Migration: Semantic (embedding) search for the AI assistant
+-- Stores one embedding per article, computed at ingest by the Slack and
+-- Confluence extractors, so a question can be matched by meaning with a
+-- single indexed query instead of an LLM keyword-extraction round trip.
+-- Requires pgvector >= 0.7 (halfvec). Run this in your Supabase SQL Editor
+
+CREATE EXTENSION IF NOT EXISTS vector WITH SCHEMA extensions;
+
+-- halfvec stores float16 components: 3KB per 1536-d embedding instead of 6KB,
+-- with no measurable loss in cosine ranking quality
+ALTER TABLE public.knowledge_items
+ADD COLUMN IF NOT EXISTS embedding extensions.halfvec(1536);
+
+-- Approximate nearest-neighbour index for cosine distance (<=>)
+CREATE INDEX IF NOT EXISTS knowledge_items_embedding_idx
+ON public.knowledge_items USING hnsw (embedding extensions.halfvec_cosine_ops);
+
+-- Top-k articles by cosine similarity to the question embedding.
+-- Rows without an embedding (not yet re-synced) are skipped; keyword search
+-- still covers them. Returns no raw_text (the answer prompt doesn't use it);
+-- dropped first because earlier versions returned a snippet column.
+DROP FUNCTION IF EXISTS public.match_knowledge_items(extensions.halfvec, integer, real);
+CREATE OR REPLACE FUNCTION public.match_knowledge_items(
+  query_embedding extensions.halfvec(1536),
+  match_limit integer DEFAULT 5,
+  min_similarity real DEFAULT 0.3
+)
+RETURNS TABLE (
+  id uuid,
+  summary text,
+  topics text[],
+  key_points text[],
+  source text,
+  created_at timestamp with time zone,
+  similarity real
+)
+LANGUAGE sql
+STABLE
+SET search_path = public, extensions
+AS $$
+  SELECT
+    n.id,
+    n.summary,
+    n.topics,
+    n.key_points,
+    n.source,
+    n.created_at,
+    n.similarity
+  FROM (
+    SELECT
+      k.id,
+      k.summary,
+      k.topics,
+      k.key_points,
+      k.source,
+      k.created_at,
+      (1 - (k.embedding <=> query_embedding))::real AS similarity
+    FROM public.knowledge_items k
+    WHERE k.embedding IS NOT NULL
+    ORDER BY k.embedding <=> query_embedding
+    LIMIT match_limit
+  ) n
+  WHERE n.similarity >= min_similarity
+  ORDER BY n.similarity DESC;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.match_knowledge_items(extensions.halfvec, integer, real) TO anon, authenticated, service_role;
+
+-- Verify: count of articles that already have an embedding
+SELECT count(*) FILTER (WHERE embedding IS NOT NULL) AS embedded, count(*) AS total
+FROM public.knowledge_items;
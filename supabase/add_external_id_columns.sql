@@ -0,0 +1,35 @@
+-- Migration: Typed external identity/version columns for imported articles
+-- Confluence page ID and version used to live only in the raw_text header
+-- (CONFLUENCE_PAGE_ID / CONFLUENCE_VERSION / CONFLUENCE_VERSION_DATE), so every
+-- change-detection lookup had to download and parse page bodies.
+-- These columns make that lookup an index hit and give the extractor a
+-- conflict key to upsert on.
+-- Run this in your Supabase SQL Editor, then run
+-- supabase/backfill_external_id_columns.sql
+
+ALTER TABLE public.knowledge_items
+ADD COLUMN IF NOT EXISTS external_id text NULL;
+
+ALTER TABLE public.knowledge_items
+ADD COLUMN IF NOT EXISTS external_version integer NULL;
+
+ALTER TABLE public.knowledge_items
+ADD COLUMN IF NOT EXISTS external_version_date timestamp with time zone NULL;
+
+COMMENT ON COLUMN public.knowledge_items.external_id IS 'Identifier of the item in its source system (e.g. Confluence page ID)';
+COMMENT ON COLUMN public.knowledge_items.external_version IS 'Source system version number of the item when last synced';
+COMMENT ON COLUMN public.knowledge_items.external_version_date IS 'Source system modification time of the item when last synced';
+
+-- Conflict target for upserts; rows without an external_id (NULL) never collide
+CREATE UNIQUE INDEX IF NOT EXISTS knowledge_items_source_external_id_key
+ON public.knowledge_items (source, external_id);
+
+-- The header view is superseded by the typed columns
+DROP VIEW IF EXISTS public.confluence_article_headers;
+
+-- Verify the columns were added
+SELECT column_name, data_type, is_nullable
+FROM information_schema.columns
+WHERE table_schema = 'public'
+  AND table_name = 'knowledge_items'
+  AND column_name IN ('external_id', 'external_version', 'external_version_date');
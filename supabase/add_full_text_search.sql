@@ -0,0 +1,79 @@
+-- Migration: Full-text search over knowledge_items for the AI assistant
+-- Replaces per-keyword ILIKE '%kw%' scans on summary/raw_text with a
+-- generated tsvector column, a GIN index and a single ranked RPC that takes
+-- every keyword at once.
+-- Run this in your Supabase SQL Editor
+
+-- array_to_string is only STABLE; generated columns need IMMUTABLE expressions
+CREATE OR REPLACE FUNCTION public.immutable_array_to_string(arr text[], sep text)
+RETURNS text
+LANGUAGE sql
+IMMUTABLE PARALLEL SAFE
+AS $$ SELECT array_to_string(arr, sep) $$;
+
+-- Weighted document: summary (A) > topics (B) > body (C).
+-- The body is capped because a tsvector cannot exceed 1MB and Slack
+-- articles are append-only logs.
+ALTER TABLE public.knowledge_items
+ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (
+  setweight(to_tsvector('english'::regconfig, coalesce(summary, '')), 'A') ||
+  setweight(to_tsvector('english'::regconfig, coalesce(public.immutable_array_to_string(topics, ' '), '')), 'B') ||
+  setweight(to_tsvector('english'::regconfig, left(coalesce(raw_text, ''), 100000)), 'C')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS knowledge_items_search_vector_idx
+ON public.knowledge_items USING gin (search_vector);
+
+-- Ranked search: any keyword may match (OR), best ts_rank first.
+-- Returns only the columns the answer prompt uses, never raw_text.
+-- (Dropped first: earlier versions also returned a snippet column.)
+DROP FUNCTION IF EXISTS public.search_knowledge_items(text[], integer);
+CREATE OR REPLACE FUNCTION public.search_knowledge_items(
+  keywords text[],
+  match_limit integer DEFAULT 5
+)
+RETURNS TABLE (
+  id uuid,
+  summary text,
+  topics text[],
+  key_points text[],
+  source text,
+  created_at timestamp with time zone,
+  rank real
+)
+LANGUAGE sql
+STABLE
+AS $$
+  WITH query AS (
+    SELECT string_agg('(' || q::text || ')', ' | ')::tsquery AS q
+    FROM (
+      SELECT plainto_tsquery('english', kw) AS q
+      FROM unnest(keywords) AS kw
+    ) parts
+    WHERE q::text <> ''
+  ),
+  ranked AS (
+    SELECT
+      k.id,
+      k.summary,
+      k.topics,
+      k.key_points,
+      k.source,
+      k.created_at,
+      ts_rank(k.search_vector, query.q) AS rank
+    FROM public.knowledge_items k, query
+    WHERE query.q IS NOT NULL
+      AND k.search_vector @@ query.q
+    ORDER BY rank DESC, k.created_at DESC
+    LIMIT match_limit
+  )
+  SELECT r.id, r.summary, r.topics, r.key_points, r.source, r.created_at, r.rank
+  FROM ranked r
+  ORDER BY r.rank DESC, r.created_at DESC;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.search_knowledge_items(text[], integer) TO anon, authenticated, service_role;
+
+-- Verify: should return ranked rows for a known topic
+SELECT id, summary, rank FROM public.search_knowledge_items(ARRAY['dashboard'], 5);
@@ -0,0 +1,41 @@
+-- Migration: Admin-managed keyword vocabulary for the Slack extractors
+-- Keywords here are matched alongside the README keywords and existing
+-- article topics, so admins can add keywords without editing READMEs
+-- (POST /api/admin/keywords). The extractors pick up changes once their
+-- cached keyword index is older than KEYWORD_INDEX_TOPICS_TTL.
+-- Optional: without this table the extractors use README keywords only.
+-- Run this in your Supabase SQL Editor
+
+CREATE TABLE IF NOT EXISTS public.keyword_vocabulary (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+  keyword text NOT NULL,
+  active boolean NOT NULL DEFAULT true,
+  created_by uuid NULL REFERENCES auth.users (id) ON DELETE SET NULL,
+  created_at timestamp with time zone NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE public.keyword_vocabulary IS 'Extra keywords/phrases matched by the Slack extractors';
+COMMENT ON COLUMN public.keyword_vocabulary.keyword IS 'Normalized (lowercase, single-spaced) keyword, at most 4 words';
+
+-- One row per keyword regardless of case
+CREATE UNIQUE INDEX IF NOT EXISTS keyword_vocabulary_keyword_key
+ON public.keyword_vocabulary (lower(keyword));
+
+ALTER TABLE public.keyword_vocabulary ENABLE ROW LEVEL SECURITY;
+
+-- Extractors read with the anon key; only admins change the vocabulary
+-- (the backend admin API uses the service role and bypasses RLS)
+DROP POLICY IF EXISTS keyword_vocabulary_select ON public.keyword_vocabulary;
+CREATE POLICY keyword_vocabulary_select ON public.keyword_vocabulary
+  FOR SELECT
+  USING (true);
+
+DROP POLICY IF EXISTS keyword_vocabulary_admin_write ON public.keyword_vocabulary;
+CREATE POLICY keyword_vocabulary_admin_write ON public.keyword_vocabulary
+  FOR ALL
+  USING ((auth.jwt() -> 'user_metadata' ->> 'role')::text = 'admin')
+  WITH CHECK ((auth.jwt() -> 'user_metadata' ->> 'role')::text = 'admin');
+
+-- Verify
+SELECT count(*) FILTER (WHERE active) AS active_keywords, count(*) AS total
+FROM public.keyword_vocabulary;
@@ -0,0 +1,19 @@
+-- Migration: Index knowledge_items.topics for topic lookups
+-- The Slack extractor finds the article for a keyword with a PostgREST
+-- array-containment filter (topics=cs.{"keyword"}); this GIN index lets
+-- that lookup avoid a sequential scan over every Slack row.
+-- Run this in your Supabase SQL Editor
+
+CREATE INDEX IF NOT EXISTS knowledge_items_topics_gin_idx
+ON public.knowledge_items USING gin (topics);
+
+-- Source is filtered alongside topics on every lookup
+CREATE INDEX IF NOT EXISTS knowledge_items_source_idx
+ON public.knowledge_items (source);
+
+-- Verify the indexes were created
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE schemaname = 'public'
+  AND tablename = 'knowledge_items'
+  AND indexname IN ('knowledge_items_topics_gin_idx', 'knowledge_items_source_idx');
@@ -0,0 +1,74 @@
+-- Migration: Trigram (pg_trgm) fuzzy keyword search for the AI assistant
+-- Catches typos and partial words ("dashbord", "recommend") that full-text
+-- search misses, using index-backed word similarity on summary and topics.
+-- Requires supabase/add_full_text_search.sql (immutable_array_to_string).
+-- Run this in your Supabase SQL Editor
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS knowledge_items_summary_trgm_idx
+ON public.knowledge_items USING gin (summary gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS knowledge_items_topics_trgm_idx
+ON public.knowledge_items USING gin (public.immutable_array_to_string(topics, ' ') gin_trgm_ops);
+
+-- Fuzzy search: for each keyword, index-scan rows whose summary or topics
+-- contain a word similar to it (kw <% text), keep each row's best score.
+-- similarity_threshold is applied through pg_trgm.word_similarity_threshold
+-- for this transaction only. Returns no raw_text (the answer prompt doesn't
+-- use it); dropped first because earlier versions returned a snippet column.
+DROP FUNCTION IF EXISTS public.search_knowledge_items_fuzzy(text[], integer, real);
+CREATE OR REPLACE FUNCTION public.search_knowledge_items_fuzzy(
+  keywords text[],
+  match_limit integer DEFAULT 5,
+  similarity_threshold real DEFAULT 0.4
+)
+RETURNS TABLE (
+  id uuid,
+  summary text,
+  topics text[],
+  key_points text[],
+  source text,
+  created_at timestamp with time zone,
+  rank real
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  PERFORM set_config('pg_trgm.word_similarity_threshold', similarity_threshold::text, true);
+
+  RETURN QUERY
+  WITH matches AS (
+    SELECT k.id AS item_id, word_similarity(kw, k.summary) AS score
+    FROM unnest(keywords) AS kw
+    JOIN public.knowledge_items k ON kw <% k.summary
+    UNION ALL
+    SELECT k.id, word_similarity(kw, public.immutable_array_to_string(k.topics, ' '))
+    FROM unnest(keywords) AS kw
+    JOIN public.knowledge_items k ON kw <% public.immutable_array_to_string(k.topics, ' ')
+  ),
+  best AS (
+    SELECT item_id, max(score) AS score
+    FROM matches
+    GROUP BY item_id
+    ORDER BY score DESC
+    LIMIT match_limit
+  )
+  SELECT
+    k.id,
+    k.summary,
+    k.topics,
+    k.key_points,
+    k.source,
+    k.created_at,
+    best.score AS rank
+  FROM best
+  JOIN public.knowledge_items k ON k.id = best.item_id
+  ORDER BY best.score DESC, k.created_at DESC;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.search_knowledge_items_fuzzy(text[], integer, real) TO anon, authenticated, service_role;
+
+-- Verify: a misspelled topic should still match
+SELECT id, summary, rank FROM public.search_knowledge_items_fuzzy(ARRAY['dashbord'], 5, 0.4);
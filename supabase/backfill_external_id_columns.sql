@@ -0,0 +1,51 @@
+-- Backfill: Populate external_id columns from existing Confluence headers
+-- Parses the CONFLUENCE_PAGE_ID / CONFLUENCE_VERSION / CONFLUENCE_VERSION_DATE
+-- header lines (or the page ID in the URL line for older rows) written by
+-- the Confluence extractor. If a page was imported more than once, only the
+-- newest row is keyed; the others keep a NULL external_id.
+-- Run after supabase/add_external_id_columns.sql. Safe to re-run.
+
+WITH parsed AS (
+  SELECT
+    id,
+    updated_at,
+    coalesce(
+      (regexp_match(raw_text, '^CONFLUENCE_PAGE_ID:\s*(\S+)', 'n'))[1],
+      (regexp_match(raw_text, '^URL:.*/pages/(\d+)', 'n'))[1]
+    ) AS page_id,
+    (regexp_match(raw_text, '^CONFLUENCE_VERSION:\s*(\d+)', 'n'))[1]::integer AS version,
+    nullif((regexp_match(raw_text, '^CONFLUENCE_VERSION_DATE:\s*(\S+)', 'n'))[1], '') AS version_date
+  FROM public.knowledge_items
+  WHERE source = 'confluence'
+    AND external_id IS NULL
+),
+ranked AS (
+  SELECT
+    *,
+    row_number() OVER (
+      PARTITION BY page_id
+      ORDER BY version DESC NULLS LAST, updated_at DESC NULLS LAST
+    ) AS rn
+  FROM parsed
+  WHERE page_id IS NOT NULL
+)
+UPDATE public.knowledge_items AS k
+SET
+  external_id = r.page_id,
+  external_version = r.version,
+  external_version_date = r.version_date::timestamp with time zone
+FROM ranked AS r
+WHERE k.id = r.id
+  AND r.rn = 1
+  AND NOT EXISTS (
+    SELECT 1
+    FROM public.knowledge_items AS e
+    WHERE e.source = 'confluence'
+      AND e.external_id = r.page_id
+  );
+
+-- Report rows that still could not be keyed
+SELECT count(*) AS unkeyed_confluence_rows
+FROM public.knowledge_items
+WHERE source = 'confluence'
+  AND external_id IS NULL;
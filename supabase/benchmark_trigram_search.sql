@@ -0,0 +1,55 @@
+-- Benchmark: ILIKE scan vs pg_trgm index on a synthetic 100k-row table
+-- Builds a throwaway copy of the knowledge_items search columns inside a
+-- transaction that is rolled back, so nothing is left behind.
+-- Run in psql (\timing on) or the Supabase SQL Editor; compare the
+-- "Execution Time" lines of each EXPLAIN ANALYZE.
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE TEMP TABLE bench_items (
+  id bigserial PRIMARY KEY,
+  summary text,
+  topics text[]
+) ON COMMIT DROP;
+
+-- 100k rows: random vocabulary words plus a few real topics
+INSERT INTO bench_items (summary, topics)
+SELECT
+  initcap(w1) || ' ' || w2 || ' ' || w3 || ' update ' || g,
+  ARRAY[w1, w2]
+FROM (
+  SELECT
+    g,
+    (ARRAY['dashboard','catalog','cart','authentication','recommendations',
+           'webhook','chatbot','approvals','history','invoice','shipping',
+           'search','profile','export','billing'])[1 + (random() * 14)::int] AS w1,
+    md5(random()::text) AS w2,
+    substr(md5(random()::text), 1, 8) AS w3
+  FROM generate_series(1, 100000) AS g
+) s;
+
+ANALYZE bench_items;
+
+-- Baseline: what search_relevant_articles used to do (sequential scan, exact substring)
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT id FROM bench_items WHERE summary ILIKE '%dashbord%';
+
+CREATE INDEX bench_items_summary_trgm_idx ON bench_items USING gin (summary gin_trgm_ops);
+ANALYZE bench_items;
+
+-- Index-backed fuzzy match: finds "Dashboard ..." rows despite the typo
+SET LOCAL pg_trgm.word_similarity_threshold = 0.4;
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT id, word_similarity('dashbord', summary) AS score
+FROM bench_items
+WHERE 'dashbord' <% summary
+ORDER BY score DESC
+LIMIT 5;
+
+-- ILIKE can also use the trigram index once it exists
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT id FROM bench_items WHERE summary ILIKE '%dashboard%' LIMIT 5;
+
+ROLLBACK;